@@ -279,11 +279,9 @@ def find_task_relatives(tasks, downstream, upstream):
             task = item
             yield task.task_id
         if downstream:
-            for relative in task.get_flat_relatives(upstream=False):
-                yield relative.task_id
+            yield from task.get_flat_relative_ids(upstream=False)
         if upstream:
-            for relative in task.get_flat_relatives(upstream=True):
-                yield relative.task_id
+            yield from task.get_flat_relative_ids(upstream=True)
 
 
 @provide_session
@@ -57,6 +57,8 @@ DEFAULT_CELERY_CONFIG = {
     'result_backend': result_backend,
     'worker_concurrency': conf.getint('celery', 'WORKER_CONCURRENCY'),
     'worker_enable_remote_control': conf.getboolean('celery', 'worker_enable_remote_control'),
+    # The executor tracks the state of the tasks from the events sent by the workers
+    'worker_send_task_events': conf.getboolean('celery', 'track_task_events', fallback=False),
 }
 
 celery_ssl_active = False
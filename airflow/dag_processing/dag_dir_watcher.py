@@ -0,0 +1,180 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Change notifications for the DAG directory, using inotify"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import struct
+import sys
+from typing import NamedTuple
+
+from airflow.utils.log.logging_mixin import LoggingMixin
+
+# From <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+    | IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class DagDirectoryChanges(NamedTuple):
+    """Changes seen in the DAG directory since they were last read"""
+
+    paths: set[str]
+    rescan_needed: bool
+
+
+class DagDirectoryWatcher(LoggingMixin):
+    """
+    Watches a DAG directory and all its subdirectories with inotify.
+
+    Files created, written, moved or deleted are reported as changed paths, along with the
+    directories deleted or moved away. Files in directories created or moved into the tree are
+    reported as changed too. If events were lost, a full rescan of the directory is requested.
+
+    Only available on Linux. Changes made on another host of a network filesystem are not seen.
+
+    :param directory: the DAG directory to watch
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self._directory = str(directory)
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error_code = ctypes.get_errno()
+            raise OSError(error_code, f"inotify_init1 failed: {os.strerror(error_code)}")
+        self._paths_by_wd: dict[int, str] = {}
+        try:
+            self._add_watches(self._directory)
+        except OSError:
+            self.close()
+            raise
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Whether inotify can be used on this platform."""
+        return sys.platform.startswith("linux")
+
+    def close(self) -> None:
+        """Stop watching the directory."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+        self._paths_by_wd.clear()
+
+    def _add_watches(self, top: str) -> list[str]:
+        """Watch the directory and its subdirectories, returning the files found in them."""
+        files = []
+        for root, _, filenames in os.walk(top, followlinks=True):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(root), _WATCH_MASK)
+            if wd < 0:
+                error_code = ctypes.get_errno()
+                if error_code == errno.ENOENT:
+                    # Already deleted, its deletion is reported separately
+                    continue
+                raise OSError(error_code, f"Cannot watch {root}: {os.strerror(error_code)}")
+            self._paths_by_wd[wd] = root
+            files.extend(os.path.join(root, filename) for filename in filenames)
+        return files
+
+    def _remove_watches(self, top: str) -> None:
+        """Stop watching a directory that was moved away, and its subdirectories."""
+        prefix = os.path.join(top, "")
+        for wd, path in list(self._paths_by_wd.items()):
+            if path == top or path.startswith(prefix):
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._paths_by_wd[wd]
+
+    def read_changes(self) -> DagDirectoryChanges:
+        """
+        Read the changes that happened since the last call, without blocking.
+
+        :raises OSError: if a directory cannot be watched, or if the watched directory itself was
+            deleted or moved away. The watcher cannot be used after that.
+        """
+        paths: set[str] = set()
+        rescan_needed = False
+        directory_gone = False
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    self.log.warning("Lost changes to %s, it will be scanned again", self._directory)
+                    rescan_needed = True
+                    continue
+                if mask & IN_IGNORED:
+                    self._paths_by_wd.pop(wd, None)
+                    continue
+                directory = self._paths_by_wd.get(wd)
+                if directory is None:
+                    continue
+                if not name:
+                    # Event about the watched directory itself
+                    if mask & (IN_DELETE_SELF | IN_MOVE_SELF) and directory == self._directory:
+                        directory_gone = True
+                    continue
+
+                path = os.path.join(directory, os.fsdecode(name))
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        paths.update(self._add_watches(path))
+                    elif mask & IN_MOVED_FROM:
+                        self._remove_watches(path)
+                paths.add(path)
+        if directory_gone:
+            raise FileNotFoundError(errno.ENOENT, f"{self._directory} was deleted or moved away")
+        if rescan_needed:
+            # Directories created while events were lost are not watched yet
+            self._add_watches(self._directory)
+        return DagDirectoryChanges(paths=paths, rescan_needed=rescan_needed)
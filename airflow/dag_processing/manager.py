@@ -19,6 +19,7 @@
 from __future__ import annotations
 
 import enum
+import hashlib
 import importlib
 import inspect
 import logging
@@ -43,7 +44,9 @@ from tabulate import tabulate
 import airflow.models
 from airflow.callbacks.callback_requests import CallbackRequest, SlaCallbackRequest
 from airflow.configuration import conf
+from airflow.dag_processing.dag_dir_watcher import DagDirectoryWatcher
 from airflow.dag_processing.processor import DagFileProcessorProcess
+from airflow.dag_processing.processor_pool import DagFileProcessorPool
 from airflow.models import errors
 from airflow.models.dag import DagModel
 from airflow.models.dagwarning import DagWarning
@@ -51,7 +54,7 @@ from airflow.models.db_callback_request import DbCallbackRequest
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.stats import Stats
 from airflow.utils import timezone
-from airflow.utils.file import list_py_file_paths, might_contain_dag
+from airflow.utils.file import is_dag_file_path, list_py_file_paths, might_contain_dag
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.mixins import MultiprocessingStartMethodMixin
 from airflow.utils.net import get_hostname
@@ -81,6 +84,16 @@ class DagFileStat(NamedTuple):
     run_count: int
 
 
+class ParsedFileFingerprint(NamedTuple):
+    """What a file was parsed from, used to tell whether it has to be parsed again"""
+
+    content_hash: str
+    dependencies: tuple[str, ...]
+    dependency_stats: tuple[tuple[int, int] | None, ...]
+    num_dags: int
+    parsed_at: datetime
+
+
 class DagParsingSignal(enum.Enum):
     """All signals sent to parser."""
 
@@ -421,12 +434,36 @@ class DagFileProcessorManager(LoggingMixin):
 
         # Map from file path to the processor
         self._processors: dict[str, DagFileProcessorProcess] = {}
+        # Long-lived processes to parse the files on, instead of a new process per file
+        self._processor_pool: DagFileProcessorPool | None = None
+        if conf.getboolean('scheduler', 'parsing_worker_pool'):
+            self._processor_pool = DagFileProcessorPool(
+                max_workers=self._parallelism,
+                max_files_per_worker=conf.getint('scheduler', 'parsing_worker_max_files'),
+                max_memory_growth=conf.getint('scheduler', 'parsing_worker_max_memory_growth'),
+                preload_modules=[
+                    module.strip()
+                    for module in conf.get('scheduler', 'parsing_worker_preload_modules').split(',')
+                    if module.strip()
+                ],
+            )
 
         self._num_run = 0
 
         # Map from file path to stats about the file
         self._file_stats: dict[str, DagFileStat] = {}
 
+        # Whether to skip parsing files when neither they nor the modules they import changed
+        self._skip_unchanged_files = conf.getboolean('scheduler', 'skip_unchanged_dag_files')
+        # Parse unchanged files anyway after this many seconds, so dynamic inputs are picked up
+        self._unchanged_file_reparse_interval = conf.getint(
+            'scheduler', 'unchanged_dag_file_reparse_interval'
+        )
+        # Map from file path to the fingerprint of its last successful parse
+        self._file_fingerprints: dict[str, ParsedFileFingerprint] = {}
+        # Map from file path to the hash of its content when its processor was started
+        self._processed_content_hashes: dict[str, str | None] = {}
+
         # Last time that the DAG dir was traversed to look for files
         self.last_dag_dir_refresh_time = timezone.make_aware(datetime.fromtimestamp(0))
         # Last time stats were printed
@@ -439,6 +476,9 @@ class DagFileProcessorManager(LoggingMixin):
         self._processor_timeout = processor_timeout
         # How often to scan the DAGs directory for new files. Default to 5 minutes.
         self.dag_dir_list_interval = conf.getint('scheduler', 'dag_dir_list_interval')
+        # Whether to watch the DAGs directory for changes instead of scanning it periodically
+        self._watch_dag_dir = conf.get('scheduler', 'dag_dir_watcher') == 'inotify'
+        self._dag_dir_watcher: DagDirectoryWatcher | None = None
 
         # Mapping file name and callbacks requests
         self._callback_to_execute: dict[str, list[CallbackRequest]] = defaultdict(list)
@@ -719,46 +759,128 @@ class DagFileProcessorManager(LoggingMixin):
         """Refresh file paths from dag dir if we haven't done it for too long."""
         now = timezone.utcnow()
         elapsed_time_since_refresh = (now - self.last_dag_dir_refresh_time).total_seconds()
-        if elapsed_time_since_refresh > self.dag_dir_list_interval:
+        rescan_needed = False
+        if self._dag_dir_watcher is not None:
+            try:
+                changes = self._dag_dir_watcher.read_changes()
+            except OSError:
+                self.log.exception(
+                    "Cannot watch %s any more, it will be listed periodically", self._dag_directory
+                )
+                self._dag_dir_watcher.close()
+                self._dag_dir_watcher = None
+                rescan_needed = True
+            else:
+                # The ignore files can change which files are DAG files anywhere below them
+                rescan_needed = changes.rescan_needed or any(
+                    os.path.basename(path) == ".airflowignore" for path in changes.paths
+                )
+                if not rescan_needed:
+                    if changes.paths:
+                        self._apply_dag_dir_changes(changes.paths)
+                    return
+        if rescan_needed or elapsed_time_since_refresh > self.dag_dir_list_interval:
+            if self._watch_dag_dir and self._dag_dir_watcher is None:
+                # Start watching before listing, so that no change goes unnoticed
+                self._start_dag_dir_watcher()
             # Build up a list of Python files that could contain DAGs
             self.log.info("Searching for files in %s", self._dag_directory)
-            self._file_paths = list_py_file_paths(self._dag_directory)
+            file_paths = list_py_file_paths(self._dag_directory)
             self.last_dag_dir_refresh_time = now
-            self.log.info("There are %s files in %s", len(self._file_paths), self._dag_directory)
-            self.set_file_paths(self._file_paths)
+            self.log.info("There are %s files in %s", len(file_paths), self._dag_directory)
+            self._update_file_paths(file_paths)
 
-            try:
-                self.log.debug("Removing old import errors")
-                self.clear_nonexistent_import_errors()
-            except Exception:
-                self.log.exception("Error removing old import errors")
-
-            # Check if file path is a zipfile and get the full path of the python file.
-            # Without this, SerializedDagModel.remove_deleted_files would delete zipped dags.
-            # Likewise DagCode.remove_deleted_code
-            dag_filelocs = []
-            for fileloc in self._file_paths:
-                if not fileloc.endswith(".py") and zipfile.is_zipfile(fileloc):
-                    with zipfile.ZipFile(fileloc) as z:
-                        dag_filelocs.extend(
-                            [
-                                os.path.join(fileloc, info.filename)
-                                for info in z.infolist()
-                                if might_contain_dag(info.filename, True, z)
-                            ]
-                        )
-                else:
-                    dag_filelocs.append(fileloc)
+    def _start_dag_dir_watcher(self):
+        self._watch_dag_dir = False
+        if not os.path.isdir(self._dag_directory):
+            return
+        if not DagDirectoryWatcher.is_supported():
+            self.log.warning("inotify is not available, %s will be listed periodically", self._dag_directory)
+            return
+        try:
+            self._dag_dir_watcher = DagDirectoryWatcher(str(self._dag_directory))
+        except OSError:
+            self.log.exception("Cannot watch %s, it will be listed periodically", self._dag_directory)
+        else:
+            self.log.info("Watching %s for changes", self._dag_directory)
 
-            SerializedDagModel.remove_deleted_dags(
-                alive_dag_filelocs=dag_filelocs,
-                processor_subdir=self.get_dag_directory(),
+    def _apply_dag_dir_changes(self, changed_paths: set[str]):
+        """
+        Update the file paths with the paths reported as changed by the DAG directory watcher,
+        queueing the changed files before the others.
+        """
+        known_file_paths = set(self._file_paths)
+        updated_file_paths = set()
+        removed_file_paths = set()
+        for path in changed_paths:
+            if os.path.isdir(path):
+                # The files of new directories are reported separately
+                continue
+            if is_dag_file_path(self._dag_directory, path):
+                updated_file_paths.add(path)
+            elif path in known_file_paths:
+                removed_file_paths.add(path)
+            elif not os.path.exists(path):
+                # Possibly a directory that was deleted or moved away
+                prefix = os.path.join(path, "")
+                removed_file_paths.update(
+                    file_path for file_path in known_file_paths if file_path.startswith(prefix)
+                )
+
+        added_file_paths = updated_file_paths - known_file_paths
+        if added_file_paths or removed_file_paths:
+            self.log.info(
+                "%s files were added to and %s files removed from %s",
+                len(added_file_paths),
+                len(removed_file_paths),
+                self._dag_directory,
             )
-            DagModel.deactivate_deleted_dags(self._file_paths)
+            self._update_file_paths(
+                [path for path in self._file_paths if path not in removed_file_paths]
+                + sorted(added_file_paths)
+            )
+        if updated_file_paths:
+            self._file_path_queue = sorted(updated_file_paths) + [
+                path for path in self._file_path_queue if path not in updated_file_paths
+            ]
+
+    def _update_file_paths(self, file_paths: list[str]):
+        """Set the file paths, and clean up after the DAG files that no longer exist."""
+        self._file_paths = file_paths
+        self.set_file_paths(self._file_paths)
+
+        try:
+            self.log.debug("Removing old import errors")
+            self.clear_nonexistent_import_errors()
+        except Exception:
+            self.log.exception("Error removing old import errors")
+
+        # Check if file path is a zipfile and get the full path of the python file.
+        # Without this, SerializedDagModel.remove_deleted_files would delete zipped dags.
+        # Likewise DagCode.remove_deleted_code
+        dag_filelocs = []
+        for fileloc in self._file_paths:
+            if not fileloc.endswith(".py") and zipfile.is_zipfile(fileloc):
+                with zipfile.ZipFile(fileloc) as z:
+                    dag_filelocs.extend(
+                        [
+                            os.path.join(fileloc, info.filename)
+                            for info in z.infolist()
+                            if might_contain_dag(info.filename, True, z)
+                        ]
+                    )
+            else:
+                dag_filelocs.append(fileloc)
 
-            from airflow.models.dagcode import DagCode
+        SerializedDagModel.remove_deleted_dags(
+            alive_dag_filelocs=dag_filelocs,
+            processor_subdir=self.get_dag_directory(),
+        )
+        DagModel.deactivate_deleted_dags(self._file_paths)
 
-            DagCode.remove_deleted_code(dag_filelocs)
+        from airflow.models.dagcode import DagCode
+
+        DagCode.remove_deleted_code(dag_filelocs)
 
     def _print_stat(self):
         """Occasionally print out stats about how fast the files are getting processed"""
@@ -953,6 +1075,8 @@ class DagFileProcessorManager(LoggingMixin):
                 processor.terminate()
                 self._file_stats.pop(file_path)
         self._processors = filtered_processors
+        for file_path in self._file_fingerprints.keys() - set(new_file_paths):
+            del self._file_fingerprints[file_path]
 
     def wait_until_finished(self):
         """Sleeps until all the processors are done."""
@@ -983,6 +1107,8 @@ class DagFileProcessorManager(LoggingMixin):
             run_count=self.get_run_count(processor.file_path) + 1,
         )
         self._file_stats[processor.file_path] = stat
+        if self._skip_unchanged_files:
+            self._update_file_fingerprint(processor, stat)
 
         file_name = os.path.splitext(os.path.basename(processor.file_path))[0].replace(os.sep, '.')
         Stats.timing(f'dag_processing.last_duration.{file_name}', last_duration)
@@ -1018,6 +1144,7 @@ class DagFileProcessorManager(LoggingMixin):
 
     def start_new_processes(self):
         """Start more processors if we have enough slots and files to process"""
+        unchanged_file_paths = []
         while self._parallelism - len(self._processors) > 0 and self._file_path_queue:
             file_path = self._file_path_queue.pop(0)
             # Stop creating duplicate processor i.e. processor with the same filepath
@@ -1025,13 +1152,31 @@ class DagFileProcessorManager(LoggingMixin):
                 continue
 
             callback_to_execute_for_file = self._callback_to_execute[file_path]
-            processor = self._create_process(
-                file_path,
-                self._pickle_dags,
-                self._dag_ids,
-                self.get_dag_directory(),
-                callback_to_execute_for_file,
-            )
+            if self._skip_unchanged_files:
+                content_hash = self._hash_file_content(file_path)
+                # Callbacks can only be run by parsing the file
+                if not callback_to_execute_for_file and self._is_file_unchanged(file_path, content_hash):
+                    del self._callback_to_execute[file_path]
+                    unchanged_file_paths.append(file_path)
+                    continue
+                self._processed_content_hashes[file_path] = content_hash
+
+            if self._processor_pool is not None:
+                processor = self._processor_pool.create_processor(
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    self.get_dag_directory(),
+                    callback_to_execute_for_file,
+                )
+            else:
+                processor = self._create_process(
+                    file_path,
+                    self._pickle_dags,
+                    self._dag_ids,
+                    self.get_dag_directory(),
+                    callback_to_execute_for_file,
+                )
 
             del self._callback_to_execute[file_path]
             Stats.incr('dag_processing.processes')
@@ -1041,6 +1186,102 @@ class DagFileProcessorManager(LoggingMixin):
             self._processors[file_path] = processor
             self.waitables[processor.waitable_handle] = processor
 
+        if unchanged_file_paths:
+            self._record_unchanged_files(unchanged_file_paths)
+
+    @staticmethod
+    def _hash_file_content(file_path: str) -> str | None:
+        try:
+            with open(file_path, 'rb') as f:
+                return hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _stat_dependencies(dependencies: tuple[str, ...]) -> tuple[tuple[int, int] | None, ...]:
+        stats: list[tuple[int, int] | None] = []
+        for dependency in dependencies:
+            try:
+                stat = os.stat(dependency)
+            except OSError:
+                stats.append(None)
+            else:
+                stats.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(stats)
+
+    def _is_file_unchanged(self, file_path: str, content_hash: str | None) -> bool:
+        """Whether the file and the modules it imported are the same as when it was last parsed."""
+        fingerprint = self._file_fingerprints.get(file_path)
+        if fingerprint is None or content_hash is None or fingerprint.content_hash != content_hash:
+            return False
+        if (
+            self._unchanged_file_reparse_interval > 0
+            and (timezone.utcnow() - fingerprint.parsed_at).total_seconds()
+            >= self._unchanged_file_reparse_interval
+        ):
+            return False
+        return self._stat_dependencies(fingerprint.dependencies) == fingerprint.dependency_stats
+
+    @provide_session
+    def _record_unchanged_files(self, file_paths: list[str], session: Session = NEW_SESSION) -> None:
+        """
+        Count unchanged files as processed without parsing them again.
+
+        Their DAGs, as serialized by the last parse, stay as they are. Only the last parsed time
+        of the DAGs is bumped, so that they are not deactivated as stale.
+        """
+        now = timezone.utcnow()
+        session.query(DagModel).filter(DagModel.fileloc.in_(file_paths)).update(
+            {DagModel.last_parsed_time: now}, synchronize_session=False
+        )
+        for file_path in file_paths:
+            self.log.debug("Skipping unchanged file %s", file_path)
+            self._file_stats[file_path] = DagFileStat(
+                num_dags=self._file_fingerprints[file_path].num_dags,
+                import_errors=0,
+                last_finish_time=now,
+                last_duration=timedelta(0),
+                run_count=self.get_run_count(file_path) + 1,
+            )
+        Stats.incr('dag_processing.unchanged_files_skipped', len(file_paths))
+
+    def _update_file_fingerprint(self, processor: DagFileProcessorProcess, stat: DagFileStat) -> None:
+        file_path = processor.file_path
+        content_hash = self._processed_content_hashes.pop(file_path, None)
+        dependencies = processor.dependencies if processor.result is not None else None
+        # Only remember files that parsed cleanly, anything else is retried as usual
+        if content_hash is None or dependencies is None or stat.import_errors:
+            self._file_fingerprints.pop(file_path, None)
+            return
+        dependencies = tuple(dependency for dependency in dependencies if dependency != file_path)
+        self._file_fingerprints[file_path] = ParsedFileFingerprint(
+            content_hash=content_hash,
+            dependencies=dependencies,
+            dependency_stats=self._stat_dependencies(dependencies),
+            num_dags=stat.num_dags,
+            parsed_at=processor.start_time,
+        )
+
+    @provide_session
+    def _expire_file_fingerprints(self, session: Session = NEW_SESSION) -> None:
+        """
+        Forget the fingerprints of the files with DAGs that were expired after the file was parsed.
+
+        Setting ``DagModel.last_expired`` is how a DAG, for instance one generated from
+        Variables, is explicitly refreshed: see :meth:`airflow.models.dag.DagModel.expire_dags`.
+        """
+        if not self._file_fingerprints:
+            return
+        oldest_parse = min(fingerprint.parsed_at for fingerprint in self._file_fingerprints.values())
+        expired = session.query(DagModel.fileloc, DagModel.last_expired).filter(
+            DagModel.last_expired > oldest_parse
+        )
+        for fileloc, last_expired in expired:
+            fingerprint = self._file_fingerprints.get(fileloc)
+            if fingerprint is not None and last_expired > fingerprint.parsed_at:
+                self.log.debug("DAGs in %s were expired, it will be parsed again", fileloc)
+                del self._file_fingerprints[fileloc]
+
     def prepare_file_path_queue(self):
         """Generate more file paths to process. Result are saved in _file_path_queue."""
         self._parsing_start_time = time.perf_counter()
@@ -1052,6 +1293,9 @@ class DagFileProcessorManager(LoggingMixin):
         # Sort the file paths by the parsing order mode
         list_mode = conf.get("scheduler", "file_parsing_sort_mode")
 
+        if self._skip_unchanged_files:
+            self._expire_file_fingerprints()
+
         files_with_mtime = {}
         file_paths = []
         is_mtime_mode = list_mode == "modified_time"
@@ -1144,6 +1388,8 @@ class DagFileProcessorManager(LoggingMixin):
 
                 # Clean up processor references
                 self.waitables.pop(processor.waitable_handle)
+                self._processed_content_hashes.pop(file_path, None)
+                self._file_fingerprints.pop(file_path, None)
                 processors_to_remove.append(file_path)
 
         # Clean up `self._processors` after iterating over it
@@ -1169,6 +1415,8 @@ class DagFileProcessorManager(LoggingMixin):
         for processor in self._processors.values():
             Stats.decr('dag_processing.processes')
             processor.terminate()
+        if self._processor_pool is not None:
+            self._processor_pool.shutdown()
 
     def end(self):
         """
@@ -1176,6 +1424,8 @@ class DagFileProcessorManager(LoggingMixin):
         them as orphaned.
         """
         pids_to_kill = self.get_all_pids()
+        if self._processor_pool is not None:
+            pids_to_kill = list(set(pids_to_kill).union(self._processor_pool.get_all_pids()))
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
 
@@ -21,9 +21,11 @@ import logging
 import multiprocessing
 import os
 import signal
+import sys
+import sysconfig
 import threading
 import time
-from contextlib import redirect_stderr, redirect_stdout, suppress
+from contextlib import contextmanager, redirect_stderr, redirect_stdout, suppress
 from datetime import timedelta
 from multiprocessing.connection import Connection as MultiprocessingConnection
 from typing import TYPE_CHECKING, Iterator
@@ -32,6 +34,7 @@ from setproctitle import setproctitle
 from sqlalchemy import exc, func, or_
 from sqlalchemy.orm.session import Session
 
+import airflow
 from airflow import settings
 from airflow.callbacks.callback_requests import (
     CallbackRequest,
@@ -59,6 +62,66 @@ if TYPE_CHECKING:
     from airflow.models.operator import Operator
 
 
+def _get_user_modules(module_names: set[str]) -> dict[str, str]:
+    """
+    Get the source files of the given modules, leaving out the standard library, installed
+    packages and Airflow itself: those only change when Airflow is redeployed.
+
+    :return: mapping of module name to the file of the module
+    """
+    excluded_dirs = tuple(
+        os.path.join(path, "")
+        for path in {
+            *(sysconfig.get_paths()[name] for name in ("stdlib", "platstdlib", "purelib", "platlib")),
+            os.path.dirname(airflow.__file__),
+        }
+    )
+    modules = {}
+    for name in module_names:
+        module_file = getattr(sys.modules.get(name), "__file__", None)
+        if module_file and not module_file.startswith(excluded_dirs):
+            modules[name] = module_file
+    return modules
+
+
+@contextmanager
+def _redirect_output_to_log(log: logging.Logger) -> Iterator[None]:
+    if conf.get_mandatory_value('logging', 'DAG_PROCESSOR_LOG_TARGET') == "stdout":
+        yield
+    else:
+        # The following line ensures that stdout goes to the same destination as the logs. If stdout
+        # gets sent to logs and logs are sent to stdout, this leads to an infinite loop. This
+        # necessitates this conditional based on the value of DAG_PROCESSOR_LOG_TARGET.
+        with redirect_stdout(StreamLogWriter(log, logging.INFO)), redirect_stderr(
+            StreamLogWriter(log, logging.WARN)
+        ):
+            yield
+
+
+def _process_file_tracking_imports(
+    log: logging.Logger,
+    file_path: str,
+    pickle_dags: bool,
+    dag_ids: list[str] | None,
+    dag_directory: str,
+    callback_requests: list[CallbackRequest],
+) -> tuple[tuple[int, int], dict[str, str]]:
+    """
+    Process the given file in the current process.
+
+    :return: the result of DagFileProcessor.process_file(), and the user modules that were
+        imported while processing the file
+    """
+    modules_before = set(sys.modules)
+    dag_file_processor = DagFileProcessor(dag_ids=dag_ids, dag_directory=dag_directory, log=log)
+    result: tuple[int, int] = dag_file_processor.process_file(
+        file_path=file_path,
+        pickle_dags=pickle_dags,
+        callback_requests=callback_requests,
+    )
+    return result, _get_user_modules(set(sys.modules) - modules_before)
+
+
 class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
     """Runs DAG processing in a separate process using DagFileProcessor
 
@@ -90,6 +153,8 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
         self._process: multiprocessing.process.BaseProcess | None = None
         # The result of DagFileProcessor.process_file(file_path).
         self._result: tuple[int, int] | None = None
+        # Files of the modules that were imported while processing the file.
+        self._dependencies: list[str] | None = None
         # Whether the process is done running.
         self._done = False
         # When the process started.
@@ -152,27 +217,14 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
             threading.current_thread().name = thread_name
 
             log.info("Started process (PID=%s) to work on %s", os.getpid(), file_path)
-            dag_file_processor = DagFileProcessor(dag_ids=dag_ids, dag_directory=dag_directory, log=log)
-            result: tuple[int, int] = dag_file_processor.process_file(
-                file_path=file_path,
-                pickle_dags=pickle_dags,
-                callback_requests=callback_requests,
+            result, user_modules = _process_file_tracking_imports(
+                log, file_path, pickle_dags, dag_ids, dag_directory, callback_requests
             )
-            result_channel.send(result)
+            result_channel.send((result, sorted(set(user_modules.values()))))
 
         try:
-            DAG_PROCESSOR_LOG_TARGET = conf.get_mandatory_value('logging', 'DAG_PROCESSOR_LOG_TARGET')
-            if DAG_PROCESSOR_LOG_TARGET == "stdout":
-                with Stats.timer() as timer:
-                    _handle_dag_file_processing()
-            else:
-                # The following line ensures that stdout goes to the same destination as the logs. If stdout
-                # gets sent to logs and logs are sent to stdout, this leads to an infinite loop. This
-                # necessitates this conditional based on the value of DAG_PROCESSOR_LOG_TARGET.
-                with redirect_stdout(StreamLogWriter(log, logging.INFO)), redirect_stderr(
-                    StreamLogWriter(log, logging.WARN)
-                ), Stats.timer() as timer:
-                    _handle_dag_file_processing()
+            with _redirect_output_to_log(log), Stats.timer() as timer:
+                _handle_dag_file_processing()
             log.info("Processing %s took %.3f seconds", file_path, timer.duration)
         except Exception:
             # Log exceptions through the logging framework.
@@ -297,7 +349,7 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
 
         if self._parent_channel.poll():
             try:
-                self._result = self._parent_channel.recv()
+                self._result, self._dependencies = self._parent_channel.recv()
                 self._done = True
                 self.log.debug("Waiting for %s", self._process)
                 self._process.join()
@@ -334,6 +386,17 @@ class DagFileProcessorProcess(LoggingMixin, MultiprocessingStartMethodMixin):
             raise AirflowException("Tried to get the result before it's done!")
         return self._result
 
+    @property
+    def dependencies(self) -> list[str] | None:
+        """
+        :return: the files of the user modules that were imported while processing the
+            file, or None if the processor did not finish
+        :rtype: list[str] or None
+        """
+        if not self.done:
+            raise AirflowException("Tried to get the dependencies before it's done!")
+        return self._dependencies
+
     @property
     def start_time(self) -> datetime.datetime:
         """
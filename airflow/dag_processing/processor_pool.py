@@ -0,0 +1,458 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Pool of long-lived processes parsing DAG files one after the other"""
+from __future__ import annotations
+
+import datetime
+import importlib
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from contextlib import suppress
+from multiprocessing.connection import Connection as MultiprocessingConnection
+
+import psutil
+from setproctitle import setproctitle
+
+from airflow import settings
+from airflow.callbacks.callback_requests import CallbackRequest
+from airflow.dag_processing.processor import _process_file_tracking_imports, _redirect_output_to_log
+from airflow.exceptions import AirflowException
+from airflow.stats import Stats
+from airflow.utils import timezone
+from airflow.utils.log.file_processor_handler import FileProcessorHandler
+from airflow.utils.log.logging_mixin import LoggingMixin, set_context
+from airflow.utils.mixins import MultiprocessingStartMethodMixin
+
+
+class DagFileProcessorWorker(LoggingMixin):
+    """
+    A process that parses the DAG files it is sent, one at a time, until it is recycled.
+
+    :param process: the worker process
+    :param channel: the manager end of the connection to the worker
+    :param slot: the slot of the pool the worker occupies, reused by its replacement
+    """
+
+    def __init__(
+        self, process: multiprocessing.process.BaseProcess, channel: MultiprocessingConnection, slot: int
+    ):
+        super().__init__()
+        self.process = process
+        self.channel = channel
+        self.slot = slot
+        self.files_processed = 0
+        self.busy_seconds = 0.0
+
+    @property
+    def pid(self) -> int:
+        if self.process.pid is None:
+            raise AirflowException("Tried to get PID before starting!")
+        return self.process.pid
+
+    def stop(self, sigkill: bool = False) -> None:
+        """Stop the worker, at once if it is busy."""
+        if self.process.is_alive():
+            if sigkill:
+                os.kill(self.pid, signal.SIGKILL)
+            else:
+                with suppress(ConnectionError):
+                    self.channel.send(None)
+            self.process.join(timeout=5)
+            if self.process.is_alive():
+                self.log.warning("Killing DAG file processor worker (PID=%d)", self.pid)
+                os.kill(self.pid, signal.SIGKILL)
+                self.process.join()
+        self.channel.close()
+
+    @staticmethod
+    def _run_worker(
+        channel: MultiprocessingConnection,
+        parent_channel: MultiprocessingConnection,
+        thread_name: str,
+        preload_modules: list[str],
+        max_files: int,
+        max_memory_growth: int,
+    ) -> None:
+        """
+        Process the files sent through the channel until recycled.
+
+        :param channel: the connection to receive files to process from and send results to
+        :param parent_channel: the parent end of the channel to close in the child
+        :param thread_name: the name to use for the process that is launched
+        :param preload_modules: modules to import before processing any file
+        :param max_files: number of files to process before exiting
+        :param max_memory_growth: growth of the resident memory, in MiB, after which to exit.
+            0 means no limit
+        """
+        # This helper runs in the newly created process
+        log: logging.Logger = logging.getLogger("airflow.processor")
+
+        # Since we share all open FDs from the parent, we need to close the parent side of the pipe here in
+        # the child, else it won't get closed properly until we exit.
+        parent_channel.close()
+        del parent_channel
+
+        setproctitle("airflow scheduler - DagFileProcessor worker")
+        # Re-configure the ORM engine as there are issues with multiple processes
+        settings.configure_orm()
+        threading.current_thread().name = thread_name
+
+        for module in preload_modules:
+            try:
+                importlib.import_module(module)
+            except Exception:
+                log.exception("Failed to preload module %s", module)
+
+        process = psutil.Process()
+        initial_memory = process.memory_info().rss
+        files_processed = 0
+        try:
+            while True:
+                try:
+                    task = channel.recv()
+                except EOFError:
+                    break
+                if task is None:
+                    break
+                file_path, pickle_dags, dag_ids, dag_directory, callback_requests = task
+
+                # Do not leave the log file of the previous file open
+                for handler in log.handlers:
+                    if isinstance(handler, FileProcessorHandler):
+                        handler.close()
+                set_context(log, file_path)
+                setproctitle(f"airflow scheduler - DagFileProcessor {file_path}")
+                log.info("Started processing %s in worker (PID=%s)", file_path, os.getpid())
+                start_time = time.monotonic()
+                try:
+                    with _redirect_output_to_log(log):
+                        result, user_modules = _process_file_tracking_imports(
+                            log, file_path, pickle_dags, dag_ids, dag_directory, callback_requests
+                        )
+                except Exception:
+                    # Log exceptions through the logging framework.
+                    log.exception("Got an exception while processing %s!", file_path)
+                    result, user_modules = None, {}
+                duration = time.monotonic() - start_time
+                log.info("Processing %s took %.3f seconds", file_path, duration)
+                # Forget the user modules, so that they are imported again, as they are now, by the
+                # next file needing them.
+                for name in user_modules:
+                    sys.modules.pop(name, None)
+
+                files_processed += 1
+                memory_growth = (process.memory_info().rss - initial_memory) // (1024 * 1024)
+                # Do not trust a worker that failed, it may have been left in any state
+                recycle = (
+                    result is None or files_processed >= max_files or 0 < max_memory_growth <= memory_growth
+                )
+                dependencies = sorted(set(user_modules.values())) if result is not None else None
+                channel.send((result, dependencies, duration, recycle))
+                if recycle:
+                    log.info(
+                        "Exiting after processing %d files, resident memory grew by %d MiB",
+                        files_processed,
+                        memory_growth,
+                    )
+                    break
+                setproctitle("airflow scheduler - DagFileProcessor worker")
+        finally:
+            # We re-initialized the ORM within this Process above so we need to
+            # tear it down manually here
+            settings.dispose_orm()
+
+            channel.close()
+
+
+class PooledDagFileProcessor(LoggingMixin):
+    """
+    Processes a DAG file on a worker of a :class:`DagFileProcessorPool`.
+
+    It can be used by the DagFileProcessorManager in place of a DagFileProcessorProcess.
+
+    :param pool: the pool to get a worker from
+    :param file_path: a Python file containing Airflow DAG definitions
+    :param pickle_dags: whether to serialize the DAG objects to the DB
+    :param dag_ids: If specified, only look at these DAG ID's
+    :param dag_directory: the directory of the DAG files
+    :param callback_requests: failure callback to execute
+    """
+
+    def __init__(
+        self,
+        pool: DagFileProcessorPool,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: list[str] | None,
+        dag_directory: str,
+        callback_requests: list[CallbackRequest],
+    ):
+        super().__init__()
+        self._pool = pool
+        self._file_path = file_path
+        self._pickle_dags = pickle_dags
+        self._dag_ids = dag_ids
+        self._dag_directory = dag_directory
+        self._callback_requests = callback_requests
+
+        self._worker: DagFileProcessorWorker | None = None
+        self._result: tuple[int, int] | None = None
+        self._dependencies: list[str] | None = None
+        self._done = False
+        self._start_time: datetime.datetime | None = None
+
+    @property
+    def file_path(self) -> str:
+        return self._file_path
+
+    def start(self) -> None:
+        """Send the file to an idle worker of the pool."""
+        self._worker = self._pool.acquire_worker()
+        self._start_time = timezone.utcnow()
+        self._worker.channel.send(
+            (self._file_path, self._pickle_dags, self._dag_ids, self._dag_directory, self._callback_requests)
+        )
+
+    def _receive_result(self) -> None:
+        if self._worker is None:
+            raise AirflowException("Tried to receive the result before starting!")
+        if self._done:
+            return
+        self._done = True
+        try:
+            self._result, self._dependencies, duration, recycle = self._worker.channel.recv()
+        except EOFError:
+            # The worker died while processing the file
+            duration, recycle = (timezone.utcnow() - self.start_time).total_seconds(), True
+        self._pool.release_worker(self._worker, duration, recycle)
+
+    def kill(self) -> None:
+        """Kill the worker processing the file."""
+        self.terminate(sigkill=True)
+
+    def terminate(self, sigkill: bool = False) -> None:
+        """
+        Stop the worker processing the file.
+
+        :param sigkill: whether to kill the worker at once instead of letting it finish the file.
+        """
+        if self._worker is None:
+            raise AirflowException("Tried to call terminate before starting!")
+        if not self._done:
+            self._done = True
+            self._pool.discard_worker(self._worker, sigkill=sigkill)
+
+    @property
+    def pid(self) -> int:
+        if self._worker is None:
+            raise AirflowException("Tried to get PID before starting!")
+        return self._worker.pid
+
+    @property
+    def exit_code(self) -> int | None:
+        if self._worker is None:
+            raise AirflowException("Tried to get exit code before starting!")
+        if not self._done:
+            raise AirflowException("Tried to call retcode before process was finished!")
+        return self._worker.process.exitcode
+
+    @property
+    def done(self) -> bool:
+        """Check if the worker is done processing the file."""
+        if self._worker is None:
+            raise AirflowException("Tried to see if it's done before starting!")
+
+        if self._done:
+            return True
+
+        # The result is only read from the channel when it is requested, so that the channel
+        # stays ready for multiprocessing.connection.wait() until then, like the sentinel of a
+        # finished DagFileProcessorProcess. If the worker died, the channel is at EOF.
+        return self._worker.channel.poll()
+
+    @property
+    def result(self) -> tuple[int, int] | None:
+        if not self.done:
+            raise AirflowException("Tried to get the result before it's done!")
+        self._receive_result()
+        return self._result
+
+    @property
+    def dependencies(self) -> list[str] | None:
+        if not self.done:
+            raise AirflowException("Tried to get the dependencies before it's done!")
+        self._receive_result()
+        return self._dependencies
+
+    @property
+    def start_time(self) -> datetime.datetime:
+        if self._start_time is None:
+            raise AirflowException("Tried to get start time before it started!")
+        return self._start_time
+
+    @property
+    def waitable_handle(self):
+        if self._worker is None:
+            raise AirflowException("Tried to get the waitable handle before starting!")
+        return self._worker.channel
+
+
+class DagFileProcessorPool(LoggingMixin, MultiprocessingStartMethodMixin):
+    """
+    Long-lived worker processes to parse DAG files, instead of starting a process per file.
+
+    Workers import the preload modules once, then parse files one after the other, forgetting
+    the user modules imported by a file once it is processed. A worker is replaced after
+    processing ``max_files_per_worker`` files, or once its resident memory grew by more than
+    ``max_memory_growth`` MiB. Each worker occupies a slot of the pool, and the parse throughput
+    of each slot is reported as a metric.
+
+    :param max_workers: the maximum number of workers
+    :param max_files_per_worker: number of files a worker processes before being replaced
+    :param max_memory_growth: growth of the resident memory of a worker, in MiB, after which
+        it is replaced. 0 means no limit
+    :param preload_modules: modules the workers import before processing any file
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_files_per_worker: int,
+        max_memory_growth: int,
+        preload_modules: list[str],
+    ):
+        super().__init__()
+        self._max_files_per_worker = max_files_per_worker
+        self._max_memory_growth = max_memory_growth
+        self._preload_modules = preload_modules
+        self._free_slots = list(range(max_workers))
+        self._idle_workers: list[DagFileProcessorWorker] = []
+        self._busy_workers: list[DagFileProcessorWorker] = []
+
+    def create_processor(
+        self,
+        file_path: str,
+        pickle_dags: bool,
+        dag_ids: list[str] | None,
+        dag_directory: str,
+        callback_requests: list[CallbackRequest],
+    ) -> PooledDagFileProcessor:
+        """Creates a processor for the file, to be run on a worker of this pool once started."""
+        return PooledDagFileProcessor(
+            pool=self,
+            file_path=file_path,
+            pickle_dags=pickle_dags,
+            dag_ids=dag_ids,
+            dag_directory=dag_directory,
+            callback_requests=callback_requests,
+        )
+
+    def _start_worker(self, slot: int) -> DagFileProcessorWorker:
+        start_method = self._get_multiprocessing_start_method()
+        context = multiprocessing.get_context(start_method)
+
+        parent_channel, child_channel = context.Pipe()
+        process = context.Process(
+            target=DagFileProcessorWorker._run_worker,
+            args=(
+                child_channel,
+                parent_channel,
+                f"DagFileProcessorWorker{slot}",
+                self._preload_modules,
+                self._max_files_per_worker,
+                self._max_memory_growth,
+            ),
+            name=f"DagFileProcessorWorker{slot}-Process",
+        )
+        process.start()
+        # Close the child side of the pipe now the subprocess has started
+        child_channel.close()
+        worker = DagFileProcessorWorker(process, parent_channel, slot)
+        self.log.debug("Started DAG file processor worker %s (PID=%s)", slot, worker.pid)
+        return worker
+
+    def acquire_worker(self) -> DagFileProcessorWorker:
+        """Get an idle worker, starting one if there is none."""
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                break
+            self.log.warning("DAG file processor worker (PID=%s) died while idle", worker.pid)
+            self._retire_worker(worker)
+        else:
+            if not self._free_slots:
+                raise AirflowException("All the workers of the DAG file processor pool are busy!")
+            worker = self._start_worker(self._free_slots.pop(0))
+        self._busy_workers.append(worker)
+        return worker
+
+    def release_worker(self, worker: DagFileProcessorWorker, duration: float, recycle: bool) -> None:
+        """
+        Return a worker that finished processing a file to the pool.
+
+        :param worker: the worker
+        :param duration: how long the worker took to process the file, in seconds
+        :param recycle: whether the worker exited and must be replaced
+        """
+        self._busy_workers.remove(worker)
+        worker.files_processed += 1
+        worker.busy_seconds += duration
+        if worker.busy_seconds > 0:
+            Stats.gauge(
+                f'dag_processing.worker.{worker.slot}.throughput',
+                worker.files_processed / worker.busy_seconds,
+            )
+        if recycle:
+            self.log.info(
+                "Replacing DAG file processor worker %s (PID=%s) after %d files (%.2f files/s)",
+                worker.slot,
+                worker.pid,
+                worker.files_processed,
+                worker.files_processed / worker.busy_seconds if worker.busy_seconds else 0.0,
+            )
+            Stats.incr('dag_processing.worker_recycled')
+            worker.stop()
+            self._retire_worker(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def discard_worker(self, worker: DagFileProcessorWorker, sigkill: bool = False) -> None:
+        """Stop a busy worker and take it out of the pool."""
+        self._busy_workers.remove(worker)
+        worker.stop(sigkill=sigkill)
+        self._retire_worker(worker)
+
+    def _retire_worker(self, worker: DagFileProcessorWorker) -> None:
+        self._free_slots.append(worker.slot)
+
+    def get_all_pids(self) -> list[int]:
+        """:return: the PIDs of all the workers"""
+        return [worker.pid for worker in self._idle_workers + self._busy_workers]
+
+    def shutdown(self) -> None:
+        """Stop all the workers."""
+        for worker in self._idle_workers + self._busy_workers:
+            worker.stop(sigkill=worker in self._busy_workers)
+            self._retire_worker(worker)
+        self._idle_workers = []
+        self._busy_workers = []
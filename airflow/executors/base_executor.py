@@ -17,10 +17,11 @@
 """Base executor - this is the base class for all the implemented executors."""
 from __future__ import annotations
 
+import heapq
+import itertools
 import sys
 import warnings
-from collections import OrderedDict
-from typing import Any, Counter, List, Optional, Sequence, Tuple
+from typing import Any, Counter, Dict, List, Optional, Sequence, Tuple
 
 from airflow.callbacks.base_callback_sink import BaseCallbackSink
 from airflow.callbacks.callback_requests import CallbackRequest
@@ -57,6 +58,72 @@ EventBufferValueType = Tuple[Optional[str], Any]
 TaskTuple = Tuple[TaskInstanceKey, CommandType, Optional[str], Optional[Any]]
 
 
+class QueuedTasks(Dict[TaskInstanceKey, QueuedTaskInstanceType]):
+    """
+    The tasks queued in an executor, by task instance key, which can also be taken by priority.
+
+    A heap of ``(-priority, sequence, key, value)`` entries is kept next to the dict, so that the
+    tasks with the highest priority are found in ``O(log n)`` each instead of sorting all the queued
+    tasks. The entries of tasks removed or replaced since are dropped when they reach the top of
+    the heap, or when the heap grows much larger than the dict. Tasks with the same priority are
+    taken in the order they were queued.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._heap: list[tuple[int, int, TaskInstanceKey, QueuedTaskInstanceType]] = []
+        # Added to the heap when tasks are taken, so that queueing does not look at the values
+        self._pending: list[tuple[TaskInstanceKey, QueuedTaskInstanceType]] = []
+        self._sequence = itertools.count()
+        self.update(*args, **kwargs)
+
+    def __setitem__(self, key: TaskInstanceKey, value: QueuedTaskInstanceType) -> None:
+        super().__setitem__(key, value)
+        self._pending.append((key, value))
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: TaskInstanceKey, default: QueuedTaskInstanceType) -> QueuedTaskInstanceType:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def _is_current(self, entry: tuple[int, int, TaskInstanceKey, QueuedTaskInstanceType]) -> bool:
+        return self.get(entry[2]) is entry[3]
+
+    def _push_pending(self) -> None:
+        heap = self._heap
+        for key, value in self._pending:
+            heapq.heappush(heap, (-value[1], next(self._sequence), key, value))
+        self._pending.clear()
+        if len(heap) > 2 * len(self) + 64:
+            heap[:] = [entry for entry in heap if self._is_current(entry)]
+            heapq.heapify(heap)
+
+    def peek_by_priority(self, limit: int) -> list[tuple[TaskInstanceKey, QueuedTaskInstanceType]]:
+        """
+        Returns the queued tasks with the highest priority, without removing them.
+
+        :param limit: the maximum number of tasks to return
+        :return: List of tuples from the queued tasks, by decreasing priority.
+        """
+        self._push_pending()
+        heap = self._heap
+        top = []
+        keys = set()
+        while heap and len(top) < limit:
+            entry = heapq.heappop(heap)
+            # Skip removed tasks, and the older entries of tasks queued again with the same value
+            if self._is_current(entry) and entry[2] not in keys:
+                top.append(entry)
+                keys.add(entry[2])
+        for entry in top:
+            heapq.heappush(heap, entry)
+        return [(key, value) for _, _, key, value in top]
+
+
 class BaseExecutor(LoggingMixin):
     """
     Class to derive in order to interface with executor-type systems
@@ -72,7 +139,7 @@ class BaseExecutor(LoggingMixin):
     def __init__(self, parallelism: int = PARALLELISM):
         super().__init__()
         self.parallelism: int = parallelism
-        self.queued_tasks: OrderedDict[TaskInstanceKey, QueuedTaskInstanceType] = OrderedDict()
+        self.queued_tasks: QueuedTasks = QueuedTasks()
         self.running: set[TaskInstanceKey] = set()
         self.event_buffer: dict[TaskInstanceKey, EventBufferValueType] = {}
         self.attempts: Counter[TaskInstanceKey] = Counter()
@@ -180,11 +247,7 @@ class BaseExecutor(LoggingMixin):
 
         :return: List of tuples from the queued_tasks according to the priority.
         """
-        return sorted(
-            self.queued_tasks.items(),
-            key=lambda x: x[1][1],
-            reverse=True,
-        )
+        return self.queued_tasks.peek_by_priority(len(self.queued_tasks))
 
     def trigger_tasks(self, open_slots: int) -> None:
         """
@@ -192,12 +255,9 @@ class BaseExecutor(LoggingMixin):
 
         :param open_slots: Number of open slots
         """
-        sorted_queue = self.order_queued_tasks_by_priority()
         task_tuples = []
 
-        for _ in range(min((open_slots, len(self.queued_tasks)))):
-            key, (command, _, queue, ti) = sorted_queue.pop(0)
-
+        for key, (command, _, queue, ti) in self.queued_tasks.peek_by_priority(open_slots):
             # If a task makes it here but is still understood by the executor
             # to be running, it generally means that the task has been killed
             # externally and not yet been marked as failed.
@@ -29,13 +29,15 @@ import math
 import operator
 import os
 import subprocess
+import threading
 import time
 import traceback
 from collections import Counter
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from enum import Enum
 from multiprocessing import cpu_count
-from typing import Any, Mapping, MutableMapping, Optional, Sequence, Tuple
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING, Any, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 from celery import Celery, Task, states as celery_states
 from celery.backends.base import BaseKeyValueStoreBackend
@@ -184,6 +186,139 @@ def send_task_to_executor(
     return key, command, result
 
 
+class CeleryTaskSender(LoggingMixin):
+    """
+    Sends tasks to Celery from a pool of threads, so that the scheduler does not wait for the broker.
+
+    The threads publish through the broker connection pool of the Celery app. At most
+    ``max_in_flight`` tasks are being sent at any time, the others have to wait for a later call.
+
+    :param num_threads: number of threads sending the tasks
+    :param max_in_flight: maximum number of tasks being sent at the same time
+    """
+
+    def __init__(self, num_threads: int, max_in_flight: int):
+        super().__init__()
+        self.max_in_flight = max_in_flight
+        self._pool = ThreadPoolExecutor(max_workers=num_threads, thread_name_prefix="CeleryTaskSender")
+        self._in_flight: dict[TaskInstanceKey, Future] = {}
+
+    @property
+    def num_in_flight(self) -> int:
+        """Number of tasks being sent."""
+        return len(self._in_flight)
+
+    def is_sending(self, key: TaskInstanceKey) -> bool:
+        """Whether the task is being sent."""
+        return key in self._in_flight
+
+    def send(self, task_tuple: TaskInstanceInCelery) -> bool:
+        """
+        Starts sending a task, unless too many tasks are being sent already.
+
+        :return: whether the task is being sent
+        """
+        if len(self._in_flight) >= self.max_in_flight:
+            return False
+        self._in_flight[task_tuple[0]] = self._pool.submit(self._send_task, task_tuple)
+        return True
+
+    @staticmethod
+    def _send_task(
+        task_tuple: TaskInstanceInCelery,
+    ) -> tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]:
+        # Same as send_task_to_executor, but the timeout relies on signals which only work in the main thread
+        key, command, queue, task_to_run = task_tuple
+        try:
+            result = task_to_run.apply_async(args=[command], queue=queue)
+        except Exception as e:
+            exception_traceback = f"Celery Task ID: {key}\n{traceback.format_exc()}"
+            result = ExceptionWithTraceback(e, exception_traceback)
+        return key, command, result
+
+    def collect(
+        self, wait_for_all: bool = False
+    ) -> list[tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]]:
+        """
+        Returns the results of the tasks sent since the last call.
+
+        :param wait_for_all: wait until all the tasks being sent are sent
+        """
+        if wait_for_all:
+            wait(self._in_flight.values())
+        sent_keys = [key for key, future in self._in_flight.items() if future.done()]
+        return [self._in_flight.pop(key).result() for key in sent_keys]
+
+    def shutdown(self) -> None:
+        """Stops the threads, once the tasks being sent are sent."""
+        self._pool.shutdown(wait=True)
+
+
+class CeleryEventReceiver(LoggingMixin):
+    """
+    Receives the events sent by the Celery workers when tasks start, succeed or fail, in a thread.
+
+    Reconnects to the broker when the connection is lost. Events lost while disconnected are
+    caught up by polling the result backend.
+    """
+
+    TASK_STATE_BY_EVENT = {
+        'task-started': celery_states.STARTED,
+        'task-succeeded': celery_states.SUCCESS,
+        'task-failed': celery_states.FAILURE,
+        'task-revoked': celery_states.REVOKED,
+    }
+
+    RECONNECT_INTERVAL = 5.0
+
+    def __init__(self):
+        super().__init__()
+        # (celery task id, state, info)
+        self._events: SimpleQueue[tuple[str, str, Any]] = SimpleQueue()
+        self._stopped = threading.Event()
+        self._receiver = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Starts receiving the events."""
+        self._thread = threading.Thread(target=self._run, name="CeleryEventReceiver", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops receiving the events."""
+        self._stopped.set()
+        if self._receiver is not None:
+            self._receiver.should_stop = True
+        if self._thread is not None:
+            self._thread.join(timeout=self.RECONNECT_INTERVAL)
+
+    def _on_task_event(self, event: dict) -> None:
+        info = event.get('exception') if event['type'] == 'task-failed' else event.get('result')
+        self._events.put((event['uuid'], self.TASK_STATE_BY_EVENT[event['type']], info))
+
+    def _run(self) -> None:
+        handlers = {event_type: self._on_task_event for event_type in self.TASK_STATE_BY_EVENT}
+        while not self._stopped.is_set():
+            try:
+                with app.connection_for_read() as connection:
+                    self._receiver = app.events.Receiver(connection, handlers=handlers)
+                    if self._stopped.is_set():
+                        break
+                    self._receiver.capture(limit=None, timeout=None, wakeup=False)
+            except Exception:
+                self.log.exception("Error receiving Celery events, reconnecting")
+                self._stopped.wait(self.RECONNECT_INTERVAL)
+
+    def get_events(self) -> list[tuple[str, str, Any]]:
+        """Returns the ``(celery task id, state, info)`` received since the last call."""
+        events = []
+        while True:
+            try:
+                events.append(self._events.get_nowait())
+            except Empty:
+                return events
+
+
 @celery_import_modules.connect
 def on_celery_import_modules(*args, **kwargs):
     """
@@ -251,9 +386,26 @@ class CeleryExecutor(BaseExecutor):
         )
         self.task_publish_retries: Counter[TaskInstanceKey] = Counter()
         self.task_publish_max_retries = conf.getint('celery', 'task_publish_max_retries', fallback=3)
+        self.event_receiver: CeleryEventReceiver | None = None
+        if conf.getboolean('celery', 'track_task_events', fallback=False):
+            self.event_receiver = CeleryEventReceiver()
+        self.task_state_reconciliation_interval = conf.getfloat(
+            'celery', 'task_state_reconciliation_interval', fallback=300.0
+        )
+        self._last_task_state_reconciliation = 0.0
+        # Celery task id -> (state, info, received at) of the events about tasks not known yet
+        self._unmatched_task_events: dict[str, tuple[str, Any, float]] = {}
+        self.task_sender: CeleryTaskSender | None = None
+        if conf.getboolean('celery', 'async_task_submission', fallback=False):
+            self.task_sender = CeleryTaskSender(
+                num_threads=self._sync_parallelism,
+                max_in_flight=conf.getint('celery', 'max_in_flight_task_submissions', fallback=256),
+            )
 
     def start(self) -> None:
         self.log.debug('Starting Celery Executor using %s processes for syncing', self._sync_parallelism)
+        if self.event_receiver:
+            self.event_receiver.start()
 
     def _num_tasks_per_send_process(self, to_send_count: int) -> int:
         """
@@ -272,9 +424,49 @@ class CeleryExecutor(BaseExecutor):
         # for all tasks.
         cached_celery_backend = first_task.backend
 
+        if self.task_sender:
+            self._send_tasks_in_background(task_tuples_to_send)
+            return
+
         key_and_async_results = self._send_tasks_to_celery(task_tuples_to_send)
         self.log.debug('Sent all tasks.')
+        self._process_sent_tasks(key_and_async_results, cached_celery_backend)
 
+    def _send_tasks_in_background(self, task_tuples_to_send: list[TaskInstanceInCelery]) -> None:
+        """
+        Starts sending the tasks with the task sender. They stay queued until they are sent, and the
+        results of sending them are processed by ``sync``.
+        """
+        if TYPE_CHECKING:
+            assert self.task_sender
+        num_sending = 0
+        for task_tuple in task_tuples_to_send:
+            if self.task_sender.is_sending(task_tuple[0]):
+                continue
+            if not self.task_sender.send(task_tuple):
+                self.log.debug(
+                    "%s tasks are being sent, sending the others later", self.task_sender.num_in_flight
+                )
+                break
+            num_sending += 1
+        self.log.debug('Sending %s tasks in the background.', num_sending)
+        Stats.gauge('celery.task_submissions_in_flight', self.task_sender.num_in_flight)
+
+    def _collect_sent_tasks(self, wait_for_all: bool = False) -> None:
+        if not self.task_sender:
+            return
+        key_and_async_results = self.task_sender.collect(wait_for_all=wait_for_all)
+        if key_and_async_results:
+            self._process_sent_tasks(key_and_async_results, execute_command.backend)
+            Stats.gauge('celery.task_submissions_in_flight', self.task_sender.num_in_flight)
+
+    def _process_sent_tasks(
+        self,
+        key_and_async_results: list[
+            tuple[TaskInstanceKey, CommandType, AsyncResult | ExceptionWithTraceback]
+        ],
+        cached_celery_backend: Any,
+    ) -> None:
         for key, _, result in key_and_async_results:
             if isinstance(result, ExceptionWithTraceback) and isinstance(
                 result.exception, AirflowTaskTimeout
@@ -326,10 +518,20 @@ class CeleryExecutor(BaseExecutor):
         return key_and_async_results
 
     def sync(self) -> None:
+        self._collect_sent_tasks()
+        if self.event_receiver:
+            self._process_task_events()
         if not self.tasks:
             self.log.debug("No task to query celery, skipping sync")
             return
-        self.update_all_task_states()
+        if self.event_receiver:
+            # The states of the tasks come from the events, only catch up with the events missed
+            now = time.monotonic()
+            if now - self._last_task_state_reconciliation >= self.task_state_reconciliation_interval:
+                self._last_task_state_reconciliation = now
+                self.update_all_task_states()
+        else:
+            self.update_all_task_states()
         self._check_for_timedout_adopted_tasks()
         self._check_for_stalled_tasks()
 
@@ -392,19 +594,20 @@ class CeleryExecutor(BaseExecutor):
         self, keys: list[TaskInstanceKey], session: Session = NEW_SESSION
     ) -> None:
         try:
-            session.query(TaskInstance).filter(
-                TaskInstance.filter_for_tis(keys),
-                TaskInstance.state == State.QUEUED,
-                TaskInstance.queued_by_job_id == self.job_id,
-            ).update(
-                {
-                    TaskInstance.state: State.SCHEDULED,
-                    TaskInstance.queued_dttm: None,
-                    TaskInstance.queued_by_job_id: None,
-                    TaskInstance.external_executor_id: None,
-                },
-                synchronize_session=False,
-            )
+            with TaskInstance.filter_for_many_tis(keys, session=session) as filter_for_tis:
+                session.query(TaskInstance).filter(
+                    filter_for_tis,
+                    TaskInstance.state == State.QUEUED,
+                    TaskInstance.queued_by_job_id == self.job_id,
+                ).update(
+                    {
+                        TaskInstance.state: State.SCHEDULED,
+                        TaskInstance.queued_dttm: None,
+                        TaskInstance.queued_by_job_id: None,
+                        TaskInstance.external_executor_id: None,
+                    },
+                    synchronize_session=False,
+                )
             session.commit()
         except Exception:
             self.log.exception("Error sending tasks back to scheduler")
@@ -438,6 +641,29 @@ class CeleryExecutor(BaseExecutor):
             "\n\t".join(map(repr, self.stalled_task_timeouts.items())),
         )
 
+    def _process_task_events(self) -> None:
+        """Updates the states of the tasks from the events received from the workers."""
+        if TYPE_CHECKING:
+            assert self.event_receiver
+        now = time.monotonic()
+        for celery_task_id, state, info in self.event_receiver.get_events():
+            previous_event = self._unmatched_task_events.get(celery_task_id)
+            if previous_event and previous_event[0] in celery_states.READY_STATES:
+                continue
+            self._unmatched_task_events[celery_task_id] = (state, info, now)
+        if not self._unmatched_task_events:
+            return
+
+        # The events of a task can arrive before the task is sent, or be about tasks of other schedulers
+        keys_by_celery_task_id = {result.task_id: key for key, result in self.tasks.items()}
+        for celery_task_id, (state, info, received_at) in list(self._unmatched_task_events.items()):
+            key = keys_by_celery_task_id.get(celery_task_id)
+            if key is not None:
+                del self._unmatched_task_events[celery_task_id]
+                self.update_task_state(key, state, info)
+            elif now - received_at > self.task_state_reconciliation_interval:
+                del self._unmatched_task_events[celery_task_id]
+
     def update_all_task_states(self) -> None:
         """Updates states of the tasks."""
         self.log.debug("Inquiring about %s celery task(s)", len(self.tasks))
@@ -472,13 +698,19 @@ class CeleryExecutor(BaseExecutor):
             self.log.exception("Error syncing the Celery executor, ignoring it.")
 
     def end(self, synchronous: bool = False) -> None:
+        if self.task_sender:
+            self._collect_sent_tasks(wait_for_all=True)
+            self.task_sender.shutdown()
         if synchronous:
             while any(task.state not in celery_states.READY_STATES for task in self.tasks.values()):
                 time.sleep(5)
         self.sync()
+        if self.event_receiver:
+            self.event_receiver.stop()
 
     def terminate(self):
-        pass
+        if self.event_receiver:
+            self.event_receiver.stop()
 
     def try_adopt_task_instances(self, tis: Sequence[TaskInstance]) -> Sequence[TaskInstance]:
         # See which of the TIs are still alive (or have finished even!)
@@ -27,10 +27,12 @@ import functools
 import json
 import logging
 import multiprocessing
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from queue import Empty, Queue
-from typing import Any, Dict, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from kubernetes import client, watch
 from kubernetes.client import Configuration, models as k8s
@@ -43,7 +45,7 @@ from airflow.kubernetes import pod_generator
 from airflow.kubernetes.kube_client import get_kube_client
 from airflow.kubernetes.kube_config import KubeConfig
 from airflow.kubernetes.kubernetes_helper_functions import annotations_to_key, create_pod_id
-from airflow.kubernetes.pod_generator import PodGenerator
+from airflow.kubernetes.pod_generator import PodGenerator, PodTemplateCache
 from airflow.models.taskinstance import TaskInstance, TaskInstanceKey
 from airflow.settings import pod_mutation_hook
 from airflow.utils import timezone
@@ -61,6 +63,12 @@ KubernetesResultsType = Tuple[TaskInstanceKey, Optional[str], str, str, str]
 # pod_id, namespace, state, annotations, resource_version
 KubernetesWatchType = Tuple[str, str, Optional[str], Dict[str, str], str]
 
+# event type (ADDED, MODIFIED, DELETED or SYNC), pods
+KubernetesPodEventType = Tuple[str, List[k8s.V1Pod]]
+
+# Longest time in seconds the retry of a pod creation waits, even when the API server asks for more
+MAX_POD_CREATION_RETRY_DELAY = 30.0
+
 
 class ResourceVersion:
     """Singleton for tracking resourceVersion from Kubernetes"""
@@ -74,6 +82,73 @@ class ResourceVersion:
         return cls._instance
 
 
+class WorkerPodCache:
+    """
+    Local cache of the pods of the KubernetesExecutor, kept up to date by the KubernetesJobWatcher.
+
+    The watcher lists the pods when it starts, or when its resource_version is too old, and sends
+    them as a ``SYNC`` event replacing the content of the cache. The events of the watch stream are
+    then applied to the cache. Only the metadata and the phase of the pods are kept.
+    """
+
+    def __init__(self):
+        self._pods: dict[tuple[str, str], k8s.V1Pod] = {}
+        self.synced = False
+
+    @staticmethod
+    def make_cached_pod(pod: k8s.V1Pod) -> k8s.V1Pod:
+        """Returns the part of a pod kept in the cache."""
+        metadata = pod.metadata
+        return k8s.V1Pod(
+            metadata=k8s.V1ObjectMeta(
+                name=metadata.name,
+                namespace=metadata.namespace,
+                labels=metadata.labels,
+                annotations=metadata.annotations,
+                creation_timestamp=metadata.creation_timestamp,
+                resource_version=metadata.resource_version,
+            ),
+            status=k8s.V1PodStatus(phase=pod.status.phase if pod.status else None),
+        )
+
+    def process_event(self, event_type: str, pods: list[k8s.V1Pod]) -> None:
+        """Applies an event sent by the KubernetesJobWatcher to the cache."""
+        if event_type == 'SYNC':
+            self._pods = {}
+            self.synced = True
+        for pod in pods:
+            key = (pod.metadata.namespace, pod.metadata.name)
+            if event_type == 'DELETED':
+                self._pods.pop(key, None)
+            else:
+                self._pods[key] = pod
+
+    def invalidate(self) -> None:
+        """Marks the cache out of date until the next ``SYNC`` event of the watcher."""
+        self.synced = False
+
+    def get_pods(
+        self, namespace: str | None = None, phase: str | None = None, **labels: str
+    ) -> list[k8s.V1Pod]:
+        """
+        Returns the cached pods matching the namespace, phase and labels given.
+
+        :param namespace: the namespace of the pods, or None for all the namespaces
+        :param phase: the phase of the pods, or None for all the phases
+        :param labels: the values the labels of the pods must have
+        """
+        return [
+            pod
+            for (pod_namespace, _), pod in self._pods.items()
+            if (namespace is None or pod_namespace == namespace)
+            and (phase is None or pod.status.phase == phase)
+            and all((pod.metadata.labels or {}).get(name) == value for name, value in labels.items())
+        ]
+
+    def __len__(self) -> int:
+        return len(self._pods)
+
+
 class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
     """Watches for Kubernetes jobs"""
 
@@ -85,6 +160,7 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         resource_version: str | None,
         scheduler_job_id: str,
         kube_config: Configuration,
+        pod_event_queue: Queue[KubernetesPodEventType] | None = None,
     ):
         super().__init__()
         self.namespace = namespace
@@ -93,6 +169,8 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         self.watcher_queue = watcher_queue
         self.resource_version = resource_version
         self.kube_config = kube_config
+        # When set, the pods of all the schedulers are watched to feed the WorkerPodCache
+        self.pod_event_queue = pod_event_queue
 
     def run(self) -> None:
         """Performs watching"""
@@ -127,17 +205,31 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
         scheduler_job_id: str,
         kube_config: Any,
     ) -> str | None:
-        self.log.info('Event: and now my watch begins starting at resource_version: %s', resource_version)
         watcher = watch.Watch()
 
-        kwargs = {'label_selector': f'airflow-worker={scheduler_job_id}'}
-        if resource_version:
-            kwargs['resource_version'] = resource_version
+        if self.pod_event_queue is not None:
+            kwargs = {'label_selector': 'kubernetes_executor=True'}
+        else:
+            kwargs = {'label_selector': f'airflow-worker={scheduler_job_id}'}
         if kube_config.kube_client_request_args:
             for key, value in kube_config.kube_client_request_args.items():
                 kwargs[key] = value
 
+        if self.multi_namespace_mode:
+            list_pods = functools.partial(kube_client.list_pod_for_all_namespaces, **kwargs)
+        else:
+            list_pods = functools.partial(kube_client.list_namespaced_pod, self.namespace, **kwargs)
+
         last_resource_version: str | None = None
+        if self.pod_event_queue is not None:
+            if not resource_version or resource_version == '0':
+                resource_version = self._sync_pods(list_pods, scheduler_job_id)
+            # Resume from the same resource_version if the watch ends without any event
+            last_resource_version = resource_version
+
+        self.log.info('Event: and now my watch begins starting at resource_version: %s', resource_version)
+        if resource_version:
+            kwargs['resource_version'] = resource_version
         if self.multi_namespace_mode:
             list_worker_pods = functools.partial(
                 watcher.stream, kube_client.list_pod_for_all_namespaces, **kwargs
@@ -151,30 +243,55 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             self.log.debug('Event: %s had an event of type %s', task.metadata.name, event['type'])
             if event['type'] == 'ERROR':
                 return self.process_error(event)
-            annotations = task.metadata.annotations
-            task_instance_related_annotations = {
-                'dag_id': annotations['dag_id'],
-                'task_id': annotations['task_id'],
-                'execution_date': annotations.get('execution_date'),
-                'run_id': annotations.get('run_id'),
-                'try_number': annotations['try_number'],
-            }
-            map_index = annotations.get('map_index')
-            if map_index is not None:
-                task_instance_related_annotations['map_index'] = map_index
-
-            self.process_status(
-                pod_id=task.metadata.name,
-                namespace=task.metadata.namespace,
-                status=task.status.phase,
-                annotations=task_instance_related_annotations,
-                resource_version=task.metadata.resource_version,
-                event=event,
-            )
             last_resource_version = task.metadata.resource_version
+            if self.pod_event_queue is not None:
+                self.pod_event_queue.put((event['type'], [WorkerPodCache.make_cached_pod(task)]))
+                if not self._is_scheduler_pod(task, scheduler_job_id):
+                    continue
+            self._process_pod_event(task, event)
 
         return last_resource_version
 
+    def _sync_pods(self, list_pods: Callable[[], k8s.V1PodList], scheduler_job_id: str) -> str:
+        """Lists the pods to replace the content of the WorkerPodCache, and returns their resource_version."""
+        if TYPE_CHECKING:
+            assert self.pod_event_queue is not None
+        pod_list = list_pods()
+        self.log.info('Listed %d pods to populate the worker pods cache', len(pod_list.items))
+        self.pod_event_queue.put(('SYNC', [WorkerPodCache.make_cached_pod(pod) for pod in pod_list.items]))
+        # The listed pods are processed as the ADDED events of a watch starting from resource_version 0
+        for pod in pod_list.items:
+            if self._is_scheduler_pod(pod, scheduler_job_id):
+                self._process_pod_event(pod, {'type': 'ADDED', 'object': pod})
+        return pod_list.metadata.resource_version
+
+    @staticmethod
+    def _is_scheduler_pod(pod: k8s.V1Pod, scheduler_job_id: str) -> bool:
+        labels = pod.metadata.labels or {}
+        return labels.get('airflow-worker') == pod_generator.make_safe_label_value(scheduler_job_id)
+
+    def _process_pod_event(self, task: k8s.V1Pod, event: Any) -> None:
+        annotations = task.metadata.annotations
+        task_instance_related_annotations = {
+            'dag_id': annotations['dag_id'],
+            'task_id': annotations['task_id'],
+            'execution_date': annotations.get('execution_date'),
+            'run_id': annotations.get('run_id'),
+            'try_number': annotations['try_number'],
+        }
+        map_index = annotations.get('map_index')
+        if map_index is not None:
+            task_instance_related_annotations['map_index'] = map_index
+
+        self.process_status(
+            pod_id=task.metadata.name,
+            namespace=task.metadata.namespace,
+            status=task.status.phase,
+            annotations=task_instance_related_annotations,
+            resource_version=task.metadata.resource_version,
+            event=event,
+        )
+
     def process_error(self, event: Any) -> str:
         """Process error response"""
         self.log.error('Encountered Error response from k8s list namespaced pod stream => %s', event)
@@ -230,6 +347,31 @@ class KubernetesJobWatcher(multiprocessing.Process, LoggingMixin):
             )
 
 
+class PodCreationRateLimiter:
+    """
+    Spaces out the creations of pods in each namespace, so that at most ``rate`` pods are created
+    per second in a namespace. Can be shared by threads.
+
+    :param rate: maximum number of pods created per second in a namespace, 0 for no limit
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_creation_time: dict[str, float] = {}
+
+    def wait(self, namespace: str) -> None:
+        """Waits until a pod can be created in the namespace."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            creation_time = max(now, self._next_creation_time.get(namespace, now))
+            self._next_creation_time[namespace] = creation_time + self._interval
+        if creation_time > now:
+            time.sleep(creation_time - now)
+
+
 class AirflowKubernetesScheduler(LoggingMixin):
     """Airflow Scheduler for Kubernetes"""
 
@@ -252,6 +394,15 @@ class AirflowKubernetesScheduler(LoggingMixin):
         self._manager = multiprocessing.Manager()
         self.watcher_queue = self._manager.Queue()
         self.scheduler_job_id = scheduler_job_id
+        self.pod_creation_rate_limiter = PodCreationRateLimiter(
+            self.kube_config.worker_pods_creation_rate_limit
+        )
+        self.pod_template_cache = PodTemplateCache(self.kube_config.kube_image)
+        self.pod_cache: WorkerPodCache | None = None
+        self.pod_event_queue: Queue[KubernetesPodEventType] | None = None
+        if self.kube_config.cache_worker_pods:
+            self.pod_cache = WorkerPodCache()
+            self.pod_event_queue = self._manager.Queue()
         self.kube_watcher = self._make_kube_watcher()
 
     def run_pod_async(self, pod: k8s.V1Pod, **kwargs):
@@ -262,6 +413,7 @@ class AirflowKubernetesScheduler(LoggingMixin):
         json_pod = json.dumps(sanitized_pod, indent=2)
 
         self.log.debug('Pod Creation Request: \n%s', json_pod)
+        self.pod_creation_rate_limiter.wait(pod.metadata.namespace)
         try:
             resp = self.kube_client.create_namespaced_pod(
                 body=sanitized_pod, namespace=pod.metadata.namespace, **kwargs
@@ -273,7 +425,12 @@ class AirflowKubernetesScheduler(LoggingMixin):
         return resp
 
     def _make_kube_watcher(self) -> KubernetesJobWatcher:
-        resource_version = ResourceVersion().resource_version
+        if self.pod_cache is not None:
+            # The watcher lists the pods again to populate the cache
+            self.pod_cache.invalidate()
+            resource_version = "0"
+        else:
+            resource_version = ResourceVersion().resource_version
         watcher = KubernetesJobWatcher(
             watcher_queue=self.watcher_queue,
             namespace=self.kube_config.kube_namespace,
@@ -281,6 +438,7 @@ class AirflowKubernetesScheduler(LoggingMixin):
             resource_version=resource_version,
             scheduler_job_id=self.scheduler_job_id,
             kube_config=self.kube_config,
+            pod_event_queue=self.pod_event_queue,
         )
         watcher.start()
         return watcher
@@ -309,27 +467,27 @@ class AirflowKubernetesScheduler(LoggingMixin):
         if command[0:3] != ["airflow", "tasks", "run"]:
             raise ValueError('The command must start with ["airflow", "tasks", "run"].')
 
-        base_worker_pod = get_base_pod_from_template(pod_template_file, self.kube_config)
+        pod_template = self.pod_template_cache.get_pod_template(
+            pod_template_file or self.kube_config.pod_template_file, kube_executor_config
+        )
 
-        if not base_worker_pod:
+        if not pod_template:
             raise AirflowException(
                 f"could not find a valid worker template yaml at {self.kube_config.pod_template_file}"
             )
 
-        pod = PodGenerator.construct_pod(
+        pod = PodGenerator.construct_pod_from_template(
+            pod_template=pod_template,
             namespace=self.namespace,
             scheduler_job_id=self.scheduler_job_id,
             pod_id=create_pod_id(dag_id, task_id),
             dag_id=dag_id,
             task_id=task_id,
-            kube_image=self.kube_config.kube_image,
             try_number=try_number,
             map_index=map_index,
             date=None,
             run_id=run_id,
             args=command,
-            pod_override_object=kube_executor_config,
-            base_worker_pod=base_worker_pod,
         )
         # Reconcile the pod generated by the Operator and the Pod
         # generated by the .cfg file
@@ -367,6 +525,8 @@ class AirflowKubernetesScheduler(LoggingMixin):
         """
         self.log.debug("Syncing KubernetesExecutor")
         self._health_check_kube_watcher()
+        if self.pod_cache is not None:
+            self._process_pod_events()
         while True:
             try:
                 task = self.watcher_queue.get_nowait()
@@ -378,6 +538,30 @@ class AirflowKubernetesScheduler(LoggingMixin):
             except Empty:
                 break
 
+    def _process_pod_events(self) -> None:
+        """Applies the pod events sent by the watcher to the worker pods cache."""
+        if TYPE_CHECKING:
+            assert self.pod_cache is not None
+            assert self.pod_event_queue is not None
+        while True:
+            try:
+                event_type, pods = self.pod_event_queue.get_nowait()
+            except Empty:
+                break
+            self.pod_cache.process_event(event_type, pods)
+
+    def get_cached_pods(self, **kwargs) -> list[k8s.V1Pod] | None:
+        """
+        Returns the pods of the worker pods cache matching the arguments of ``WorkerPodCache.get_pods``,
+        or None if the cache is disabled or not populated yet.
+        """
+        if self.pod_cache is None:
+            return None
+        self._process_pod_events()
+        if not self.pod_cache.synced:
+            return None
+        return self.pod_cache.get_pods(**kwargs)
+
     def process_watcher_task(self, task: KubernetesWatchType) -> None:
         """Process the task by watcher."""
         pod_id, namespace, state, annotations, resource_version = task
@@ -443,6 +627,11 @@ class KubernetesExecutor(BaseExecutor):
         self.kube_client: client.CoreV1Api | None = None
         self.scheduler_job_id: str | None = None
         self.event_scheduler: EventScheduler | None = None
+        self._pod_creation_pool: ThreadPoolExecutor | None = None
+        # Tasks whose pod creation is retried once the monotonic time has passed, and the
+        # number of times the creation of their pod was retried
+        self._pod_creation_retries: list[tuple[float, KubernetesJobType]] = []
+        self._pod_creation_attempts: dict[TaskInstanceKey, int] = {}
         self.last_handled: dict[TaskInstanceKey, float] = {}
         self.kubernetes_queue: str | None = None
         super().__init__(parallelism=self.kube_config.parallelism)
@@ -476,6 +665,7 @@ class KubernetesExecutor(BaseExecutor):
             if time.time() - timestamp > allowed_age:
                 del self.last_handled[key]
 
+        launched_pods = self._get_cached_launched_pods()
         for ti in queued_tis:
             self.log.debug("Checking task instance %s", ti)
 
@@ -483,31 +673,10 @@ class KubernetesExecutor(BaseExecutor):
             if ti.key in self.last_handled:
                 continue
 
-            # Build the pod selector
-            base_label_selector = (
-                f"dag_id={pod_generator.make_safe_label_value(ti.dag_id)},"
-                f"task_id={pod_generator.make_safe_label_value(ti.task_id)},"
-                f"airflow-worker={pod_generator.make_safe_label_value(str(ti.queued_by_job_id))}"
-            )
-            if ti.map_index >= 0:
-                # Old tasks _couldn't_ be mapped, so we don't have to worry about compat
-                base_label_selector += f',map_index={ti.map_index}'
-            kwargs = dict(label_selector=base_label_selector)
-            if self.kube_config.kube_client_request_args:
-                kwargs.update(**self.kube_config.kube_client_request_args)
-
-            # Try run_id first
-            kwargs['label_selector'] += ',run_id=' + pod_generator.make_safe_label_value(ti.run_id)
-            pod_list = self.kube_client.list_namespaced_pod(self.kube_config.kube_namespace, **kwargs)
-            if pod_list.items:
-                continue
-            # Fallback to old style of using execution_date
-            kwargs['label_selector'] = (
-                f'{base_label_selector},'
-                f'execution_date={pod_generator.datetime_to_label_safe_datestring(ti.execution_date)}'
-            )
-            pod_list = self.kube_client.list_namespaced_pod(self.kube_config.kube_namespace, **kwargs)
-            if pod_list.items:
+            if launched_pods is not None:
+                if self._is_launched_in_cache(ti, launched_pods):
+                    continue
+            elif self._is_launched(ti):
                 continue
             self.log.info('TaskInstance: %s found in queued state but was not launched, rescheduling', ti)
             session.query(TaskInstance).filter(
@@ -517,6 +686,74 @@ class KubernetesExecutor(BaseExecutor):
                 TaskInstance.map_index == ti.map_index,
             ).update({TaskInstance.state: State.SCHEDULED})
 
+    def _is_launched(self, ti: TaskInstance) -> bool:
+        """Lists the pods of the task instance from the API server to check whether it was launched."""
+        if TYPE_CHECKING:
+            assert self.kube_client
+        # Build the pod selector
+        base_label_selector = (
+            f"dag_id={pod_generator.make_safe_label_value(ti.dag_id)},"
+            f"task_id={pod_generator.make_safe_label_value(ti.task_id)},"
+            f"airflow-worker={pod_generator.make_safe_label_value(str(ti.queued_by_job_id))}"
+        )
+        if ti.map_index >= 0:
+            # Old tasks _couldn't_ be mapped, so we don't have to worry about compat
+            base_label_selector += f',map_index={ti.map_index}'
+        kwargs = dict(label_selector=base_label_selector)
+        if self.kube_config.kube_client_request_args:
+            kwargs.update(**self.kube_config.kube_client_request_args)
+
+        # Try run_id first
+        kwargs['label_selector'] += ',run_id=' + pod_generator.make_safe_label_value(ti.run_id)
+        pod_list = self.kube_client.list_namespaced_pod(self.kube_config.kube_namespace, **kwargs)
+        if pod_list.items:
+            return True
+        # Fallback to old style of using execution_date
+        kwargs['label_selector'] = (
+            f'{base_label_selector},'
+            f'execution_date={pod_generator.datetime_to_label_safe_datestring(ti.execution_date)}'
+        )
+        pod_list = self.kube_client.list_namespaced_pod(self.kube_config.kube_namespace, **kwargs)
+        return bool(pod_list.items)
+
+    def _get_cached_pods(self, **kwargs) -> list[k8s.V1Pod] | None:
+        """Returns the matching pods of the worker pods cache, or None when they must be listed."""
+        if not self.kube_config.cache_worker_pods or not self.kube_scheduler:
+            return None
+        return self.kube_scheduler.get_cached_pods(**kwargs)
+
+    def _get_cached_launched_pods(self) -> set[tuple[str | None, ...]] | None:
+        """
+        Returns the labels identifying the task instances of the cached pods, with both their
+        run_id and their execution_date, or None when the pods must be listed.
+        """
+        cached_pods = self._get_cached_pods(namespace=self.kube_config.kube_namespace)
+        if cached_pods is None:
+            return None
+        launched_pods = set()
+        for pod in cached_pods:
+            labels = pod.metadata.labels or {}
+            pod_labels = tuple(
+                labels.get(name) for name in ('dag_id', 'task_id', 'airflow-worker', 'map_index')
+            )
+            launched_pods.add((*pod_labels, 'run_id', labels.get('run_id')))
+            launched_pods.add((*pod_labels, 'execution_date', labels.get('execution_date')))
+        return launched_pods
+
+    @staticmethod
+    def _is_launched_in_cache(ti: TaskInstance, launched_pods: set[tuple[str | None, ...]]) -> bool:
+        ti_labels = (
+            pod_generator.make_safe_label_value(ti.dag_id),
+            pod_generator.make_safe_label_value(ti.task_id),
+            pod_generator.make_safe_label_value(str(ti.queued_by_job_id)),
+            str(ti.map_index) if ti.map_index >= 0 else None,
+        )
+        return (*ti_labels, 'run_id', pod_generator.make_safe_label_value(ti.run_id)) in launched_pods or (
+            *ti_labels,
+            'execution_date',
+            pod_generator.datetime_to_label_safe_datestring(ti.execution_date),
+        ) in launched_pods
+
     def start(self) -> None:
         """Starts the executor"""
         self.log.info('Start Kubernetes executor')
@@ -528,6 +765,11 @@ class KubernetesExecutor(BaseExecutor):
         self.kube_scheduler = AirflowKubernetesScheduler(
             self.kube_config, self.task_queue, self.result_queue, self.kube_client, self.scheduler_job_id
         )
+        if self.kube_config.worker_pods_creation_parallelism > 1:
+            self._pod_creation_pool = ThreadPoolExecutor(
+                max_workers=self.kube_config.worker_pods_creation_parallelism,
+                thread_name_prefix="KubernetesPodCreation",
+            )
         self.event_scheduler = EventScheduler()
         self.event_scheduler.call_regular_interval(
             self.kube_config.worker_pods_pending_timeout_check_interval,
@@ -619,42 +861,124 @@ class KubernetesExecutor(BaseExecutor):
         resource_instance = ResourceVersion()
         resource_instance.resource_version = last_resource_version or resource_instance.resource_version
 
-        for _ in range(self.kube_config.worker_pods_creation_batch_size):
-            try:
-                task = self.task_queue.get_nowait()
+        self._queue_due_pod_creation_retries()
+        if self._pod_creation_pool:
+            self._run_next_concurrently()
+        else:
+            for _ in range(self.kube_config.worker_pods_creation_batch_size):
                 try:
-                    self.kube_scheduler.run_next(task)
-                except PodReconciliationError as e:
-                    self.log.error(
-                        "Pod reconciliation failed, likely due to kubernetes library upgrade. "
-                        "Try clearing the task to re-run.",
-                        exc_info=True,
-                    )
-                    self.fail(task[0], e)
-                except ApiException as e:
-
-                    # These codes indicate something is wrong with pod definition; otherwise we assume pod
-                    # definition is ok, and that retrying may work
-                    if e.status in (400, 422):
-                        self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
-                        key, _, _, _ = task
-                        self.change_state(key, State.FAILED, e)
-                    else:
-                        self.log.warning(
-                            'ApiException when attempting to run task, re-queueing. Reason: %r. Message: %s',
-                            e.reason,
-                            json.loads(e.body)['message'],
-                        )
-                        self.task_queue.put(task)
-                finally:
-                    self.task_queue.task_done()
-            except Empty:
-                break
+                    task = self.task_queue.get_nowait()
+                    try:
+                        self.kube_scheduler.run_next(task)
+                        self._pod_creation_attempts.pop(task[0], None)
+                    except (PodReconciliationError, ApiException) as e:
+                        self._handle_run_next_error(task, e)
+                    finally:
+                        self.task_queue.task_done()
+                except Empty:
+                    break
 
         # Run any pending timed events
         next_event = self.event_scheduler.run(blocking=False)
         self.log.debug("Next timed event is in %f", next_event)
 
+    def _run_next_concurrently(self) -> None:
+        """Creates the pods of the next batch of tasks from the task queue with the pod creation pool."""
+        if TYPE_CHECKING:
+            assert self.kube_scheduler
+            assert self._pod_creation_pool
+        tasks = []
+        for _ in range(self.kube_config.worker_pods_creation_batch_size):
+            try:
+                tasks.append(self.task_queue.get_nowait())
+            except Empty:
+                break
+        if not tasks:
+            return
+        futures = [self._pod_creation_pool.submit(self.kube_scheduler.run_next, task) for task in tasks]
+        unexpected_error = None
+        for task, future in zip(tasks, futures):
+            try:
+                error = future.exception()
+                if error is None:
+                    self._pod_creation_attempts.pop(task[0], None)
+                elif isinstance(error, (PodReconciliationError, ApiException)):
+                    self._handle_run_next_error(task, error)
+                elif error is not None:
+                    unexpected_error = unexpected_error or error
+            finally:
+                self.task_queue.task_done()
+        self.log.debug("Created the pods of %d tasks", len(tasks))
+        if unexpected_error:
+            raise unexpected_error
+
+    def _handle_run_next_error(
+        self, task: KubernetesJobType, e: PodReconciliationError | ApiException
+    ) -> None:
+        if isinstance(e, PodReconciliationError):
+            self.log.error(
+                "Pod reconciliation failed, likely due to kubernetes library upgrade. "
+                "Try clearing the task to re-run.",
+                exc_info=e,
+            )
+            self._pod_creation_attempts.pop(task[0], None)
+            self.fail(task[0], e)
+        # These codes indicate something is wrong with pod definition; otherwise we assume pod
+        # definition is ok, and that retrying may work
+        elif e.status in (400, 422):
+            self.log.error("Pod creation failed with reason %r. Failing task", e.reason)
+            key, _, _, _ = task
+            self._pod_creation_attempts.pop(key, None)
+            self.change_state(key, State.FAILED, e)
+        else:
+            attempt = self._pod_creation_attempts.get(task[0], 0)
+            if self._is_retryable(e) and attempt < self.kube_config.worker_pods_creation_max_retries:
+                # Retried by a later sync, rather than holding up the scheduler loop until then
+                delay = self._get_retry_delay(e, attempt)
+                self._pod_creation_attempts[task[0]] = attempt + 1
+                self.log.warning(
+                    'Pod creation failed with %s %r, retrying in %.1f seconds (attempt %d of %d)',
+                    e.status,
+                    e.reason,
+                    delay,
+                    attempt + 1,
+                    self.kube_config.worker_pods_creation_max_retries,
+                )
+                self._pod_creation_retries.append((time.monotonic() + delay, task))
+                return
+            self.log.warning(
+                'ApiException when attempting to run task, re-queueing. Reason: %r. Message: %s',
+                e.reason,
+                json.loads(e.body)['message'],
+            )
+            self.task_queue.put(task)
+
+    @staticmethod
+    def _is_retryable(e: ApiException) -> bool:
+        # Throttled by the API server, or the API server is unavailable
+        return e.status == 429 or 500 <= e.status < 600
+
+    @staticmethod
+    def _get_retry_delay(e: ApiException, attempt: int) -> float:
+        retry_after = (e.headers or {}).get('Retry-After')
+        if retry_after:
+            try:
+                return min(float(retry_after), MAX_POD_CREATION_RETRY_DELAY)
+            except ValueError:
+                pass
+        return min(2.0**attempt, MAX_POD_CREATION_RETRY_DELAY)
+
+    def _queue_due_pod_creation_retries(self) -> None:
+        if not self._pod_creation_retries:
+            return
+        now = time.monotonic()
+        for not_before, task in self._pod_creation_retries:
+            if not_before <= now:
+                self.task_queue.put(task)
+        self._pod_creation_retries = [
+            (not_before, task) for not_before, task in self._pod_creation_retries if not_before > now
+        ]
+
     def _check_worker_pods_pending_timeout(self):
         """Check if any pending worker pods have timed out"""
         if not self.scheduler_job_id:
@@ -662,21 +986,29 @@ class KubernetesExecutor(BaseExecutor):
         timeout = self.kube_config.worker_pods_pending_timeout
         self.log.debug('Looking for pending worker pods older than %d seconds', timeout)
 
-        kwargs = {
-            'limit': self.kube_config.worker_pods_pending_timeout_batch_size,
-            'field_selector': 'status.phase=Pending',
-            'label_selector': f'airflow-worker={self.scheduler_job_id}',
-            **self.kube_config.kube_client_request_args,
-        }
-        if self.kube_config.multi_namespace_mode:
-            pending_pods = functools.partial(self.kube_client.list_pod_for_all_namespaces, **kwargs)
+        cached_pods = self._get_cached_pods(
+            namespace=None if self.kube_config.multi_namespace_mode else self.kube_config.kube_namespace,
+            phase='Pending',
+            **{'airflow-worker': pod_generator.make_safe_label_value(self.scheduler_job_id)},
+        )
+        if cached_pods is not None:
+            pending_pods = cached_pods[: self.kube_config.worker_pods_pending_timeout_batch_size]
         else:
-            pending_pods = functools.partial(
-                self.kube_client.list_namespaced_pod, self.kube_config.kube_namespace, **kwargs
-            )
+            kwargs = {
+                'limit': self.kube_config.worker_pods_pending_timeout_batch_size,
+                'field_selector': 'status.phase=Pending',
+                'label_selector': f'airflow-worker={self.scheduler_job_id}',
+                **self.kube_config.kube_client_request_args,
+            }
+            if self.kube_config.multi_namespace_mode:
+                pending_pods = self.kube_client.list_pod_for_all_namespaces(**kwargs).items
+            else:
+                pending_pods = self.kube_client.list_namespaced_pod(
+                    self.kube_config.kube_namespace, **kwargs
+                ).items
 
         cutoff = timezone.utcnow() - timedelta(seconds=timeout)
-        for pod in pending_pods().items:
+        for pod in pending_pods:
             self.log.debug(
                 'Found a pending pod "%s", created "%s"', pod.metadata.name, pod.metadata.creation_timestamp
             )
@@ -712,9 +1044,17 @@ class KubernetesExecutor(BaseExecutor):
         kube_client: client.CoreV1Api = self.kube_client
         for scheduler_job_id in scheduler_job_ids:
             scheduler_job_id = pod_generator.make_safe_label_value(str(scheduler_job_id))
-            kwargs = {'label_selector': f'airflow-worker={scheduler_job_id}'}
-            pod_list = kube_client.list_namespaced_pod(namespace=self.kube_config.kube_namespace, **kwargs)
-            for pod in pod_list.items:
+            cached_pods = self._get_cached_pods(
+                namespace=self.kube_config.kube_namespace, **{'airflow-worker': scheduler_job_id}
+            )
+            if cached_pods is not None:
+                pods = cached_pods
+            else:
+                kwargs = {'label_selector': f'airflow-worker={scheduler_job_id}'}
+                pods = kube_client.list_namespaced_pod(
+                    namespace=self.kube_config.kube_namespace, **kwargs
+                ).items
+            for pod in pods:
                 self.adopt_launched_task(kube_client, pod, pod_ids)
         self._adopt_completed_pods(kube_client)
         tis_to_flush.extend(pod_ids.values())
@@ -733,18 +1073,13 @@ class KubernetesExecutor(BaseExecutor):
         if not self.scheduler_job_id:
             raise AirflowException(NOT_STARTED_MESSAGE)
         self.log.info("attempting to adopt pod %s", pod.metadata.name)
-        pod.metadata.labels['airflow-worker'] = pod_generator.make_safe_label_value(self.scheduler_job_id)
         pod_id = annotations_to_key(pod.metadata.annotations)
         if pod_id not in pod_ids:
             self.log.error("attempting to adopt taskinstance which was not specified by database: %s", pod_id)
             return
 
         try:
-            kube_client.patch_namespaced_pod(
-                name=pod.metadata.name,
-                namespace=pod.metadata.namespace,
-                body=PodGenerator.serialize_pod(pod),
-            )
+            self._patch_worker_label(kube_client, pod)
             pod_ids.pop(pod_id)
             self.running.add(pod_id)
         except ApiException as e:
@@ -759,23 +1094,43 @@ class KubernetesExecutor(BaseExecutor):
         """
         if not self.scheduler_job_id:
             raise AirflowException(NOT_STARTED_MESSAGE)
-        kwargs = {
-            'field_selector': "status.phase=Succeeded",
-            'label_selector': 'kubernetes_executor=True',
-        }
-        pod_list = kube_client.list_namespaced_pod(namespace=self.kube_config.kube_namespace, **kwargs)
-        for pod in pod_list.items:
+        cached_pods = self._get_cached_pods(
+            namespace=self.kube_config.kube_namespace, phase='Succeeded', kubernetes_executor='True'
+        )
+        if cached_pods is not None:
+            pods = cached_pods
+        else:
+            kwargs = {
+                'field_selector': "status.phase=Succeeded",
+                'label_selector': 'kubernetes_executor=True',
+            }
+            pods = kube_client.list_namespaced_pod(namespace=self.kube_config.kube_namespace, **kwargs).items
+        for pod in pods:
             self.log.info("Attempting to adopt pod %s", pod.metadata.name)
-            pod.metadata.labels['airflow-worker'] = pod_generator.make_safe_label_value(self.scheduler_job_id)
             try:
-                kube_client.patch_namespaced_pod(
-                    name=pod.metadata.name,
-                    namespace=pod.metadata.namespace,
-                    body=PodGenerator.serialize_pod(pod),
-                )
+                self._patch_worker_label(kube_client, pod)
             except ApiException as e:
                 self.log.info("Failed to adopt pod %s. Reason: %s", pod.metadata.name, e)
 
+    def _patch_worker_label(self, kube_client: client.CoreV1Api, pod: k8s.V1Pod) -> None:
+        """
+        Sets the ``airflow-worker`` label of the pod to the id of this scheduler.
+
+        Only the label is patched. The patch carries the resource version the pod was listed or
+        cached with, so it fails with a conflict if the pod changed since then, for instance when
+        another scheduler adopted it first.
+        """
+        metadata: dict[str, Any] = {
+            'labels': {'airflow-worker': pod_generator.make_safe_label_value(self.scheduler_job_id)}
+        }
+        if pod.metadata.resource_version:
+            metadata['resourceVersion'] = pod.metadata.resource_version
+        kube_client.patch_namespaced_pod(
+            name=pod.metadata.name,
+            namespace=pod.metadata.namespace,
+            body={'metadata': metadata},
+        )
+
     def _flush_task_queue(self) -> None:
         if not self.task_queue:
             raise AirflowException(NOT_STARTED_MESSAGE)
@@ -827,6 +1182,7 @@ class KubernetesExecutor(BaseExecutor):
         self.log.info('Shutting down Kubernetes executor')
         self.log.debug('Flushing task_queue...')
         self._flush_task_queue()
+        self._pod_creation_retries.clear()
         self.log.debug('Flushing result_queue...')
         self._flush_result_queue()
         # Both queues should be empty...
@@ -834,6 +1190,8 @@ class KubernetesExecutor(BaseExecutor):
         self.result_queue.join()
         if self.kube_scheduler:
             self.kube_scheduler.terminate()
+        if self._pod_creation_pool:
+            self._pod_creation_pool.shutdown()
         self._manager.shutdown()
 
     def terminate(self):
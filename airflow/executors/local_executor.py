@@ -31,17 +31,21 @@ from abc import abstractmethod
 from multiprocessing import Manager, Process
 from multiprocessing.managers import SyncManager
 from queue import Empty, Queue
-from typing import Any, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 from setproctitle import getproctitle, setproctitle
 
 from airflow import settings
+from airflow.configuration import conf
 from airflow.exceptions import AirflowException
 from airflow.executors.base_executor import NOT_STARTED_MESSAGE, PARALLELISM, BaseExecutor, CommandType
 from airflow.models.taskinstance import TaskInstanceKey, TaskInstanceStateType
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.state import State
 
+if TYPE_CHECKING:
+    from airflow.models.dag import DAG
+
 # This is a work to be executed by a worker.
 # It can Key and Command - but it can also be None, None which is actually a
 # "Poison Pill" - worker seeing Poison Pill should take the pill and ... die instantly.
@@ -80,15 +84,17 @@ class LocalWorkerBase(Process, LoggingMixin):
 
         self.log.info("%s running %s", self.__class__.__name__, command)
         setproctitle(f"airflow worker -- LocalExecutor: {command}")
-        if settings.EXECUTE_TASKS_NEW_PYTHON_INTERPRETER:
-            state = self._execute_work_in_subprocess(command)
-        else:
-            state = self._execute_work_in_fork(command)
+        state = self._execute_work(command)
 
         self.result_queue.put((key, state))
         # Remove the command since the worker is done executing the task
         setproctitle("airflow worker -- LocalExecutor")
 
+    def _execute_work(self, command: CommandType) -> str:
+        if settings.EXECUTE_TASKS_NEW_PYTHON_INTERPRETER:
+            return self._execute_work_in_subprocess(command)
+        return self._execute_work_in_fork(command)
+
     def _execute_work_in_subprocess(self, command: CommandType) -> str:
         try:
             subprocess.check_call(command, close_fds=True)
@@ -97,7 +103,7 @@ class LocalWorkerBase(Process, LoggingMixin):
             self.log.error("Failed to execute task %s.", str(e))
             return State.FAILED
 
-    def _execute_work_in_fork(self, command: CommandType) -> str:
+    def _execute_work_in_fork(self, command: CommandType, dag: DAG | None = None) -> str:
         pid = os.fork()
         if pid:
             # In parent, wait for the child
@@ -123,7 +129,10 @@ class LocalWorkerBase(Process, LoggingMixin):
 
             setproctitle(f"airflow task supervisor: {command}")
 
-            args.func(args)
+            if dag is None:
+                args.func(args)
+            else:
+                args.func(args, dag=dag)
             ret = 0
             return State.SUCCESS
         except Exception as e:
@@ -194,6 +203,74 @@ class QueuedLocalWorker(LocalWorkerBase):
                 self.task_queue.task_done()
 
 
+class WarmQueuedLocalWorker(QueuedLocalWorker):
+    """
+    QueuedLocalWorker that keeps Airflow imported and the DAGs it has run tasks of parsed, and
+    runs each ``airflow tasks run`` command in a fork of itself with the DAG already parsed.
+
+    Compared to the other workers, a task does not pay for starting a python interpreter nor
+    for parsing its DAG file; it is still supervised by a LocalTaskJob. The DAG files are
+    parsed again when they are modified, but the modules they import are not reloaded.
+
+    Pickled DAGs, and commands that are not ``airflow tasks run --local`` for a DAG file, are
+    run as by QueuedLocalWorker.
+
+    :param task_queue: queue from which worker reads tasks
+    :param result_queue: queue where worker puts results after finishing tasks
+    """
+
+    def __init__(self, task_queue: Queue[ExecutorWorkType], result_queue: Queue[TaskInstanceStateType]):
+        super().__init__(task_queue=task_queue, result_queue=result_queue)
+        # DAG id -> (file path, modification time, DAG)
+        self._dags: dict[str, tuple[str, float, DAG]] = {}
+
+    def do_work(self) -> None:
+        # Everything needed to run a task is imported once, before the first task
+        from airflow.cli.cli_parser import get_parser
+        from airflow.cli.commands import task_command  # noqa: F401
+        from airflow.jobs.local_task_job import LocalTaskJob  # noqa: F401
+
+        get_parser()
+        super().do_work()
+
+    def _get_dag(self, dag_id: str, file_path: str) -> DAG:
+        from airflow.models.dagbag import DagBag
+
+        mtime = os.path.getmtime(file_path)
+        cached = self._dags.get(dag_id)
+        if cached and cached[0] == file_path and cached[1] == mtime:
+            return cached[2]
+        dagbag = DagBag(file_path, include_examples=False)
+        if dag_id not in dagbag.dags:
+            raise AirflowException(f"Dag {dag_id!r} could not be found in {file_path}")
+        for dag in dagbag.dags.values():
+            self._dags[dag.dag_id] = (file_path, mtime, dag)
+        return dagbag.dags[dag_id]
+
+    def _execute_work(self, command: CommandType) -> str:
+        from airflow.cli.cli_parser import get_parser
+        from airflow.utils.cli import process_subdir
+
+        try:
+            # [1:] - remove "airflow" from the start of the command
+            args = get_parser().parse_args(command[1:])
+        except SystemExit:
+            # Leave reporting the unparsable command to the usual way of running it
+            return super()._execute_work(command)
+        if getattr(args, "func", None) is None or args.func.__name__ != "task_run":
+            return super()._execute_work(command)
+        file_path = process_subdir(args.subdir)
+        if not args.local or args.pickle or args.cfg_path or not file_path or not os.path.isfile(file_path):
+            return super()._execute_work(command)
+        try:
+            dag = self._get_dag(args.dag_id, file_path)
+        except Exception:
+            self.log.exception("Failed to load %s from %s, running %s", args.dag_id, file_path, command)
+            return super()._execute_work(command)
+        # Run the command as the CLI would, with a LocalTaskJob supervising the task
+        return self._execute_work_in_fork(command, dag=dag)
+
+
 class LocalExecutor(BaseExecutor):
     """
     LocalExecutor executes tasks locally in parallel.
@@ -213,6 +290,7 @@ class LocalExecutor(BaseExecutor):
         self.workers_used: int = 0
         self.workers_active: int = 0
         self.impl: None | (LocalExecutor.UnlimitedParallelism | LocalExecutor.LimitedParallelism) = None
+        self.warm_workers: bool = settings.CAN_FORK and conf.getboolean('core', 'local_executor_warm_workers')
 
     class UnlimitedParallelism:
         """
@@ -289,9 +367,9 @@ class LocalExecutor(BaseExecutor):
             self.queue = self.executor.manager.Queue()
             if not self.executor.result_queue:
                 raise AirflowException(NOT_STARTED_MESSAGE)
+            worker_class = WarmQueuedLocalWorker if self.executor.warm_workers else QueuedLocalWorker
             self.executor.workers = [
-                QueuedLocalWorker(self.queue, self.executor.result_queue)
-                for _ in range(self.executor.parallelism)
+                worker_class(self.queue, self.executor.result_queue) for _ in range(self.executor.parallelism)
             ]
 
             self.executor.workers_used = len(self.executor.workers)
@@ -169,9 +169,9 @@ class BackfillJob(BaseJob):
         refreshed_tis = []
         TI = TaskInstance
 
-        filter_for_tis = TI.filter_for_tis(list(ti_status.running.values()))
-        if filter_for_tis is not None:
-            refreshed_tis = session.query(TI).filter(filter_for_tis).all()
+        with TI.filter_for_many_tis(ti_status.running.values(), session=session) as filter_for_tis:
+            if filter_for_tis is not None:
+                refreshed_tis = session.query(TI).filter(filter_for_tis).all()
 
         for ti in refreshed_tis:
             # Here we remake the key by subtracting 1 to match in memory information
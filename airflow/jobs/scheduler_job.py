@@ -17,20 +17,23 @@
 # under the License.
 from __future__ import annotations
 
+import bisect
+import hashlib
 import itertools
 import logging
 import multiprocessing
 import os
 import signal
+import struct
 import sys
 import time
 import warnings
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Collection, DefaultDict, Iterator
+from typing import TYPE_CHECKING, Any, Collection, DefaultDict, Iterable, Iterator
 
-from sqlalchemy import func, not_, or_, text
+from sqlalchemy import bindparam, false, func, not_, or_, text, true
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import load_only, selectinload
 from sqlalchemy.orm.session import Session, make_transient
@@ -40,6 +43,7 @@ from airflow.callbacks.callback_requests import DagCallbackRequest, SlaCallbackR
 from airflow.callbacks.pipe_callback_sink import PipeCallbackSink
 from airflow.configuration import conf
 from airflow.exceptions import RemovedInAirflow3Warning
+from airflow.executors.base_executor import EventBufferValueType
 from airflow.executors.executor_loader import UNPICKLEABLE_EXECUTORS
 from airflow.jobs.base_job import BaseJob
 from airflow.models.dag import DAG, DagModel
@@ -53,6 +57,8 @@ from airflow.ti_deps.dependencies_states import EXECUTION_STATES
 from airflow.timetables.simple import DatasetTriggeredTimetable
 from airflow.utils import timezone
 from airflow.utils.event_scheduler import EventScheduler
+from airflow.utils.helpers import chunks
+from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.retries import MAX_DB_RETRIES, retry_db_transaction, run_with_db_retries
 from airflow.utils.session import NEW_SESSION, create_session, provide_session
 from airflow.utils.sqlalchemy import (
@@ -69,6 +75,8 @@ from airflow.utils.types import DagRunType
 if TYPE_CHECKING:
     from types import FrameType
 
+    from sqlalchemy.engine import Row
+
     from airflow.dag_processing.manager import DagFileProcessorAgent
 
 TI = TaskInstance
@@ -84,6 +92,185 @@ def _is_parent_process() -> bool:
     return multiprocessing.current_process().name == 'MainProcess'
 
 
+class ConcurrencyLedger(LoggingMixin):
+    """
+    In-process record of the task instances occupying execution slots.
+
+    The critical section needs to know how many task instances are running or queued per pool, per DAG
+    and per task. Rather than aggregating the task instance table on every pass, the ledger is seeded
+    from the database once and then kept up to date from the transitions the scheduler itself makes or
+    observes (queueing, executor events, resets). Changes made elsewhere -- by other schedulers, the UI
+    or the API -- are picked up by a periodic reconciliation against the database.
+
+    :param reconcile_interval: Maximum number of seconds between two reconciliations with the database
+    """
+
+    def __init__(self, reconcile_interval: float) -> None:
+        super().__init__()
+        self.reconcile_interval = reconcile_interval
+        # (dag_id, task_id, run_id, map_index) -> (state, pool, pool_slots)
+        self._entries: dict[tuple[str, str, str, int], tuple[str, str, int]] = {}
+        self._dag_active_tasks: DefaultDict[str, int] = defaultdict(int)
+        self._task_concurrency: DefaultDict[tuple[str, str], int] = defaultdict(int)
+        self._pool_slots: DefaultDict[tuple[str, str], int] = defaultdict(int)
+        self._last_reconciled: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def needs_reconcile(self) -> bool:
+        """Whether the ledger was never seeded or its reconcile interval has elapsed."""
+        if self._last_reconciled is None:
+            return True
+        return time.monotonic() - self._last_reconciled >= self.reconcile_interval
+
+    def invalidate(self) -> None:
+        """Force a reconciliation on the next critical section pass."""
+        self._last_reconciled = None
+
+    def reconcile(self, session: Session) -> None:
+        """Rebuild the ledger from the task instances currently in an execution state."""
+        rows = session.query(
+            TI.dag_id, TI.task_id, TI.run_id, TI.map_index, TI.state, TI.pool, TI.pool_slots
+        ).filter(TI.state.in_(list(EXECUTION_STATES)))
+
+        previous = self._entries
+        self._entries = {}
+        self._dag_active_tasks.clear()
+        self._task_concurrency.clear()
+        self._pool_slots.clear()
+        for dag_id, task_id, run_id, map_index, state, pool, pool_slots in rows:
+            self._add((dag_id, task_id, run_id, map_index), state, pool, pool_slots)
+
+        drift = len(previous.keys() ^ self._entries.keys())
+        if self._last_reconciled is not None and drift:
+            self.log.debug("Concurrency ledger drifted by %d task instances since last reconcile", drift)
+        Stats.gauge('scheduler.concurrency_ledger.drift', drift)
+        self._last_reconciled = time.monotonic()
+
+    def _add(self, key: tuple[str, str, str, int], state: str, pool: str, pool_slots: int) -> None:
+        self._entries[key] = (state, pool, pool_slots)
+        dag_id, task_id = key[0], key[1]
+        self._dag_active_tasks[dag_id] += 1
+        self._task_concurrency[(dag_id, task_id)] += 1
+        self._pool_slots[(pool, state)] += pool_slots
+
+    def discard(self, key: tuple[str, str, str, int]) -> None:
+        """Forget a task instance that no longer occupies an execution slot."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        state, pool, pool_slots = entry
+        dag_id, task_id = key[0], key[1]
+        self._dag_active_tasks[dag_id] -= 1
+        self._task_concurrency[(dag_id, task_id)] -= 1
+        self._pool_slots[(pool, state)] -= pool_slots
+
+    def record(self, ti: TI, state: str | None = None) -> None:
+        """
+        Record the current state of a task instance.
+
+        :param ti: The task instance to record
+        :param state: The state to record, defaults to the state of ``ti``
+        """
+        self.record_key(ti.key.primary, state or ti.state, ti.pool, ti.pool_slots)
+
+    def record_key(
+        self, key: tuple[str, str, str, int], state: str | None, pool: str, pool_slots: int
+    ) -> None:
+        """Record the current state of a task instance given by its primary key."""
+        self.discard(key)
+        if state in EXECUTION_STATES:
+            self._add(key, state, pool, pool_slots)
+
+    def concurrency_maps(self) -> tuple[DefaultDict[str, int], DefaultDict[tuple[str, str], int]]:
+        """Return copies of the per-DAG and per-task maps of task instances in an execution state."""
+        return defaultdict(int, self._dag_active_tasks), defaultdict(int, self._task_concurrency)
+
+    def pool_state_counts(self) -> list[tuple[str, str, int]]:
+        """Return the occupied slots as ``(pool, state, slots)`` rows, as expected by ``Pool.slots_stats``."""
+        return [(pool, state, slots) for (pool, state), slots in self._pool_slots.items() if slots]
+
+
+class DagPartitioner(LoggingMixin):
+    """
+    Consistent-hash partitioning of the DAGs between the running schedulers.
+
+    Every running scheduler job is placed on a hash ring at a number of virtual nodes, and a DAG is owned
+    by the job of the first node following the hash of its dag_id. Each scheduler computes the same ring
+    from the job table, so the partitions do not overlap, and when a scheduler stops heartbeating only
+    its DAGs move to the remaining schedulers -- the others keep their owner.
+
+    :param refresh_interval: Maximum number of seconds between two recomputations of the partition
+    :param virtual_nodes: Number of points each scheduler job has on the hash ring
+    """
+
+    def __init__(self, refresh_interval: float, virtual_nodes: int = 64) -> None:
+        super().__init__()
+        self.refresh_interval = refresh_interval
+        self.virtual_nodes = virtual_nodes
+        self.live_job_ids: list[int] = []
+        self._dag_ids: set[str] | None = None
+        self._last_refreshed: float | None = None
+
+    @property
+    def needs_refresh(self) -> bool:
+        """Whether the partition was never computed or its refresh interval has elapsed."""
+        if self._last_refreshed is None:
+            return True
+        return time.monotonic() - self._last_refreshed >= self.refresh_interval
+
+    @property
+    def dag_ids(self) -> set[str] | None:
+        """The dag_ids owned by this scheduler, or None if it is the only running scheduler."""
+        return self._dag_ids
+
+    @staticmethod
+    def _hash(value: str) -> int:
+        return struct.unpack('>Q', hashlib.sha1(value.encode('utf-8')).digest()[:8])[0]
+
+    def owners(self, dag_ids: Iterable[str]) -> dict[str, int]:
+        """Map each dag_id to the live scheduler job owning it."""
+        ring = sorted(
+            (self._hash(f"{job_id}:{node}"), job_id)
+            for job_id in self.live_job_ids
+            for node in range(self.virtual_nodes)
+        )
+        hashes = [node_hash for node_hash, _ in ring]
+        return {dag_id: ring[bisect.bisect(hashes, self._hash(dag_id)) % len(ring)][1] for dag_id in dag_ids}
+
+    def refresh(self, job_id: int, session: Session) -> None:
+        """Recompute the DAGs owned by ``job_id`` from the running scheduler jobs and the active DAGs."""
+        health_check_threshold = conf.getint('scheduler', 'scheduler_health_check_threshold')
+        live_job_ids = {
+            live_job_id
+            for live_job_id, in session.query(BaseJob.id).filter(
+                BaseJob.job_type == 'SchedulerJob',
+                BaseJob.state == State.RUNNING,
+                BaseJob.latest_heartbeat > timezone.utcnow() - timedelta(seconds=health_check_threshold),
+            )
+        }
+        # Never hand the own DAGs over to the others just because the own heartbeat is late
+        live_job_ids.add(job_id)
+        if sorted(live_job_ids) != self.live_job_ids:
+            self.log.info("Partitioning the DAGs between scheduler jobs %s", sorted(live_job_ids))
+        self.live_job_ids = sorted(live_job_ids)
+        self._last_refreshed = time.monotonic()
+
+        if len(self.live_job_ids) == 1:
+            self._dag_ids = None
+            return
+        dag_ids = (
+            dag_id
+            for dag_id, in session.query(DagModel.dag_id).filter(
+                DagModel.is_active == true(), DagModel.is_paused == false()
+            )
+        )
+        self._dag_ids = {dag_id for dag_id, owner in self.owners(dag_ids).items() if owner == job_id}
+        Stats.gauge('scheduler.partition.owned_dags', len(self._dag_ids))
+
+
 class SchedulerJob(BaseJob):
     """
     This SchedulerJob runs for a specific time interval and schedules the jobs
@@ -155,9 +342,29 @@ class SchedulerJob(BaseJob):
         # Dag Processor agent - not used in Dag Processor standalone mode.
         self.processor_agent: DagFileProcessorAgent | None = None
 
-        self.dagbag = DagBag(dag_folder=self.subdir, read_dags_from_db=True, load_op_links=False)
+        self.dagbag = DagBag(
+            dag_folder=self.subdir,
+            read_dags_from_db=True,
+            load_op_links=False,
+            incremental_db_refresh=conf.getboolean('core', 'incremental_serialized_dag_refresh'),
+        )
         self._paused_dag_without_running_dagruns: set = set()
 
+        self._batch_dagrun_scheduling = conf.getboolean('scheduler', 'batch_dagrun_scheduling')
+        self._concurrency_ledger: ConcurrencyLedger | None = None
+        self._executor_events_bulk_threshold = conf.getint(
+            'scheduler', 'executor_events_bulk_threshold', fallback=1000
+        )
+        if conf.getboolean('scheduler', 'use_concurrency_ledger'):
+            self._concurrency_ledger = ConcurrencyLedger(
+                reconcile_interval=conf.getfloat('scheduler', 'concurrency_ledger_reconcile_interval')
+            )
+        self._dag_partitioner: DagPartitioner | None = None
+        if conf.getboolean('scheduler', 'partition_dags'):
+            self._dag_partitioner = DagPartitioner(
+                refresh_interval=conf.getfloat('scheduler', 'dag_partition_refresh_interval')
+            )
+
     def register_signals(self) -> None:
         """Register signals that stop child processes"""
         signal.signal(signal.SIGINT, self._exit_gracefully)
@@ -263,9 +470,17 @@ class SchedulerJob(BaseJob):
                     "Failed to acquire advisory lock", params=None, orig=RuntimeError('55P03')
                 )
 
+        ledger = self._concurrency_ledger
+        if ledger is not None and ledger.needs_reconcile:
+            ledger.reconcile(session)
+
         # Get the pool settings. We get a lock on the pool rows, treating this as a "critical section"
         # Throws an exception if lock cannot be obtained, rather than blocking
-        pools = Pool.slots_stats(lock_rows=True, session=session)
+        pools = Pool.slots_stats(
+            lock_rows=True,
+            state_count_by_pool=ledger.pool_state_counts() if ledger is not None else None,
+            session=session,
+        )
 
         # If the pools are full, there is no point doing anything!
         # If _somehow_ the pool is overfull, don't let the limit go negative - it breaks SQL
@@ -282,9 +497,12 @@ class SchedulerJob(BaseJob):
         # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
         dag_active_tasks_map: DefaultDict[str, int]
         task_concurrency_map: DefaultDict[tuple[str, str], int]
-        dag_active_tasks_map, task_concurrency_map = self.__get_concurrency_maps(
-            states=list(EXECUTION_STATES), session=session
-        )
+        if ledger is not None:
+            dag_active_tasks_map, task_concurrency_map = ledger.concurrency_maps()
+        else:
+            dag_active_tasks_map, task_concurrency_map = self.__get_concurrency_maps(
+                states=list(EXECUTION_STATES), session=session
+            )
 
         num_tasks_in_executor = 0
         # Number of tasks that cannot be scheduled because of no open slot in pool
@@ -511,6 +729,8 @@ class SchedulerJob(BaseJob):
             )
 
         for ti in executable_tis:
+            if ledger is not None:
+                ledger.record(ti, TaskInstanceState.QUEUED)
             make_transient(ti)
         return executable_tis
 
@@ -526,6 +746,8 @@ class SchedulerJob(BaseJob):
         for ti in task_instances:
             if ti.dag_run.state in State.finished:
                 ti.set_state(State.NONE, session=session)
+                if self._concurrency_ledger is not None:
+                    self._concurrency_ledger.discard(ti.key.primary)
                 continue
             command = ti.command_as_list(
                 local=True,
@@ -601,6 +823,10 @@ class SchedulerJob(BaseJob):
         if not tis_with_right_state:
             return len(event_buffer)
 
+        if 0 < self._executor_events_bulk_threshold <= len(tis_with_right_state):
+            self._process_executor_events_in_bulk(event_buffer, tis_with_right_state, session)
+            return len(event_buffer)
+
         # Check state of finished tasks
         filter_for_tis = TI.filter_for_tis(tis_with_right_state)
         query = session.query(TI).filter(filter_for_tis).options(selectinload('dag_model'))
@@ -612,7 +838,9 @@ class SchedulerJob(BaseJob):
             session=session,
             **skip_locked(session=session),
         )
+        handled_tis: list[TI] = []
         for ti in tis:
+            handled_tis.append(ti)
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
             state, info = event_buffer.pop(buffer_key)
@@ -622,35 +850,7 @@ class SchedulerJob(BaseJob):
                 self.log.info("Setting external_id for %s to %s", ti, info)
                 continue
 
-            msg = (
-                "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, "
-                "run_start_date=%s, run_end_date=%s, "
-                "run_duration=%s, state=%s, executor_state=%s, try_number=%s, max_tries=%s, job_id=%s, "
-                "pool=%s, queue=%s, priority_weight=%d, operator=%s, queued_dttm=%s, "
-                "queued_by_job_id=%s, pid=%s"
-            )
-            self.log.info(
-                msg,
-                ti.dag_id,
-                ti.task_id,
-                ti.run_id,
-                ti.map_index,
-                ti.start_date,
-                ti.end_date,
-                ti.duration,
-                ti.state,
-                state,
-                try_number,
-                ti.max_tries,
-                ti.job_id,
-                ti.pool,
-                ti.queue,
-                ti.priority_weight,
-                ti.operator,
-                ti.queued_dttm,
-                ti.queued_by_job_id,
-                ti.pid,
-            )
+            self._log_task_instance_finished(ti, state, try_number)
 
             # There are two scenarios why the same TI with the same try_number is queued
             # after executor is finished with it:
@@ -667,34 +867,194 @@ class SchedulerJob(BaseJob):
 
             if ti_queued and not ti_requeued:
                 Stats.incr('scheduler.tasks.killed_externally')
-                msg = (
-                    "Executor reports task instance %s finished (%s) although the "
-                    "task says its %s. (Info: %s) Was the task killed externally?"
-                )
-                self.log.error(msg, ti, state, ti.state, info)
-
-                # Get task from the Serialized DAG
-                try:
-                    dag = self.dagbag.get_dag(ti.dag_id)
-                    task = dag.get_task(ti.task_id)
-                except Exception:
-                    self.log.exception("Marking task instance %s as %s", ti, state)
-                    ti.set_state(state)
-                    continue
-                ti.task = task
-                if task.on_retry_callback or task.on_failure_callback:
-                    request = TaskCallbackRequest(
-                        full_filepath=ti.dag_model.fileloc,
-                        simple_task_instance=SimpleTaskInstance.from_ti(ti),
-                        msg=msg % (ti, state, ti.state, info),
-                        processor_subdir=ti.dag_model.processor_subdir,
-                    )
+                request = self._handle_task_killed_externally(ti, state, info, session)
+                if request:
                     self.executor.send_callback(request)
-                else:
-                    ti.handle_failure(error=msg % (ti, state, ti.state, info), session=session)
+
+        if self._concurrency_ledger is not None:
+            for ti in handled_tis:
+                self._concurrency_ledger.record(ti)
 
         return len(event_buffer)
 
+    def _process_executor_events_in_bulk(
+        self,
+        event_buffer: dict[TaskInstanceKey, EventBufferValueType],
+        ti_keys: list[TaskInstanceKey],
+        session: Session,
+    ) -> None:
+        """
+        Respond to the executor events of a large number of task instances.
+
+        The task instances are read in batches of ``max_tis_per_query`` primary keys, selecting only
+        the columns needed to find the task instances killed externally. The external executor ids
+        of the queued task instances are set with one batched UPDATE, and only the task instances
+        killed externally are loaded as ORM objects to be failed.
+        """
+        keys_by_primary = {key.primary: key for key in ti_keys}
+        primary_keys = list(keys_by_primary)
+        chunk_size = self.max_tis_per_query or len(primary_keys)
+        external_executor_ids: list[dict[str, Any]] = []
+        killed_externally: dict[tuple[str, str, str, int], tuple[str, Any]] = {}
+        for chunk in chunks(primary_keys, chunk_size):
+            query = session.query(
+                TI.dag_id,
+                TI.task_id,
+                TI.run_id,
+                TI.map_index,
+                TI.start_date,
+                TI.end_date,
+                TI.duration,
+                TI.state,
+                TI._try_number.label('try_number'),
+                TI.max_tries,
+                TI.job_id,
+                TI.pool,
+                TI.pool_slots,
+                TI.queue,
+                TI.priority_weight,
+                TI.operator,
+                TI.queued_dttm,
+                TI.queued_by_job_id,
+                TI.pid,
+            ).filter(tuple_in_condition((TI.dag_id, TI.task_id, TI.run_id, TI.map_index), chunk))
+            # row lock the task instances to make sure the scheduler doesn't fail when we have
+            # multi-schedulers
+            rows = with_row_locks(query, of=TI, session=session, **skip_locked(session=session))
+            for row in rows:
+                primary_key = (row.dag_id, row.task_id, row.run_id, row.map_index)
+                buffer_key = keys_by_primary[primary_key]
+                state, info = event_buffer.pop(buffer_key)
+                if self._concurrency_ledger is not None:
+                    self._concurrency_ledger.record_key(primary_key, row.state, row.pool, row.pool_slots)
+
+                if state == TaskInstanceState.QUEUED:
+                    self.log.info("Setting external_id for %s to %s", buffer_key, info)
+                    external_executor_ids.append(
+                        {
+                            'b_dag_id': row.dag_id,
+                            'b_task_id': row.task_id,
+                            'b_run_id': row.run_id,
+                            'b_map_index': row.map_index,
+                            'b_external_executor_id': info,
+                        }
+                    )
+                    continue
+
+                self._log_task_instance_finished(row, state, buffer_key.try_number)
+                # The try_number column of a queued task instance is one less than its try number.
+                # Whether the task instance is also in the executor is checked once it is loaded.
+                if (
+                    row.try_number + 1 == buffer_key.try_number
+                    and row.state == TaskInstanceState.QUEUED
+                    and row.queued_by_job_id == self.id
+                ):
+                    killed_externally[primary_key] = state, info
+
+        if external_executor_ids:
+            table = TI.__table__
+            session.execute(
+                table.update()
+                .where(
+                    table.c.dag_id == bindparam('b_dag_id'),
+                    table.c.task_id == bindparam('b_task_id'),
+                    table.c.run_id == bindparam('b_run_id'),
+                    table.c.map_index == bindparam('b_map_index'),
+                )
+                .values(external_executor_id=bindparam('b_external_executor_id')),
+                external_executor_ids,
+            )
+
+        if not killed_externally:
+            return
+        tis = (
+            session.query(TI)
+            .filter(
+                tuple_in_condition((TI.dag_id, TI.task_id, TI.run_id, TI.map_index), list(killed_externally))
+            )
+            .options(selectinload('dag_model'))
+        )
+        num_killed_externally = 0
+        callback_requests: list[TaskCallbackRequest] = []
+        for ti in tis:
+            if self.executor.has_task(ti):
+                continue
+            num_killed_externally += 1
+            state, info = killed_externally[ti.key.primary]
+            request = self._handle_task_killed_externally(ti, state, info, session)
+            if request:
+                callback_requests.append(request)
+            if self._concurrency_ledger is not None:
+                self._concurrency_ledger.record(ti)
+        if num_killed_externally:
+            Stats.incr('scheduler.tasks.killed_externally', num_killed_externally)
+        for request in callback_requests:
+            self.executor.send_callback(request)
+
+    def _log_task_instance_finished(self, ti: TI | Row, state: str, try_number: int) -> None:
+        msg = (
+            "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, "
+            "run_start_date=%s, run_end_date=%s, "
+            "run_duration=%s, state=%s, executor_state=%s, try_number=%s, max_tries=%s, job_id=%s, "
+            "pool=%s, queue=%s, priority_weight=%d, operator=%s, queued_dttm=%s, "
+            "queued_by_job_id=%s, pid=%s"
+        )
+        self.log.info(
+            msg,
+            ti.dag_id,
+            ti.task_id,
+            ti.run_id,
+            ti.map_index,
+            ti.start_date,
+            ti.end_date,
+            ti.duration,
+            ti.state,
+            state,
+            try_number,
+            ti.max_tries,
+            ti.job_id,
+            ti.pool,
+            ti.queue,
+            ti.priority_weight,
+            ti.operator,
+            ti.queued_dttm,
+            ti.queued_by_job_id,
+            ti.pid,
+        )
+
+    def _handle_task_killed_externally(
+        self, ti: TI, state: str, info: Any, session: Session
+    ) -> TaskCallbackRequest | None:
+        """
+        Fail a task instance the executor reports finished while it is still queued.
+
+        :return: the callback request to send if the task has failure or retry callbacks
+        """
+        msg = (
+            "Executor reports task instance %s finished (%s) although the "
+            "task says its %s. (Info: %s) Was the task killed externally?"
+        )
+        self.log.error(msg, ti, state, ti.state, info)
+
+        # Get task from the Serialized DAG
+        try:
+            dag = self.dagbag.get_dag(ti.dag_id)
+            task = dag.get_task(ti.task_id)
+        except Exception:
+            self.log.exception("Marking task instance %s as %s", ti, state)
+            ti.set_state(state)
+            return None
+        ti.task = task
+        if task.on_retry_callback or task.on_failure_callback:
+            return TaskCallbackRequest(
+                full_filepath=ti.dag_model.fileloc,
+                simple_task_instance=SimpleTaskInstance.from_ti(ti),
+                msg=msg % (ti, state, ti.state, info),
+                processor_subdir=ti.dag_model.processor_subdir,
+            )
+        ti.handle_failure(error=msg % (ti, state, ti.state, info), session=session)
+        return None
+
     def _execute(self) -> None:
         from airflow.dag_processing.manager import DagFileProcessorAgent
 
@@ -932,6 +1292,9 @@ class SchedulerJob(BaseJob):
         :return: Number of TIs enqueued in this iteration
         :rtype: int
         """
+        if self._dag_partitioner is not None and self._dag_partitioner.needs_refresh:
+            self._dag_partitioner.refresh(self.id, session)
+
         # Put a check in place to make sure we don't commit unexpectedly
         with prohibit_commit(session) as guard:
             if settings.USE_JOB_SCHEDULE:
@@ -989,15 +1352,24 @@ class SchedulerJob(BaseJob):
 
         return num_queued_tis
 
+    @property
+    def _partitioned_dag_ids(self) -> set[str] | None:
+        """The dag_ids of the partition of this scheduler, or None to schedule all DAGs."""
+        if self._dag_partitioner is None:
+            return None
+        return self._dag_partitioner.dag_ids
+
     @retry_db_transaction
     def _get_next_dagruns_to_examine(self, state: DagRunState, session: Session):
         """Get Next DagRuns to Examine with retries"""
-        return DagRun.next_dagruns_to_examine(state, session)
+        return DagRun.next_dagruns_to_examine(state, session, dag_ids=self._partitioned_dag_ids)
 
     @retry_db_transaction
     def _create_dagruns_for_dags(self, guard: CommitProhibitorGuard, session: Session) -> None:
         """Find Dag Models needing DagRuns and Create Dag Runs with retries in case of OperationalError"""
-        query, dataset_triggered_dag_info = DagModel.dags_needing_dagruns(session)
+        query, dataset_triggered_dag_info = DagModel.dags_needing_dagruns(
+            session, dag_ids=self._partitioned_dag_ids
+        )
         all_dags_needing_dag_runs = set(query.all())
         dataset_triggered_dags = [
             dag for dag in all_dags_needing_dag_runs if dag.dag_id in dataset_triggered_dag_info
@@ -1230,13 +1602,42 @@ class SchedulerJob(BaseJob):
     @retry_db_transaction
     def _schedule_all_dag_runs(self, guard, dag_runs, session):
         """Makes scheduling decisions for all `dag_runs`"""
+        if self._batch_dagrun_scheduling:
+            callback_tuples = self._schedule_dag_runs_in_batch(list(dag_runs), session)
+        else:
+            callback_tuples = []
+            for dag_run in dag_runs:
+                callback_to_run = self._schedule_dag_run(dag_run, session)
+                callback_tuples.append((dag_run, callback_to_run))
+
+        guard.commit()
+
+        return callback_tuples
+
+    def _schedule_dag_runs_in_batch(
+        self, dag_runs: list[DagRun], session: Session
+    ) -> list[tuple[DagRun, DagCallbackRequest | None]]:
+        """
+        Make scheduling decisions about several dag runs at once.
+
+        The task instances of all the dag runs are loaded with a single query, and the task instances
+        found to be schedulable are set to the scheduled state with grouped UPDATE statements.
+
+        :param dag_runs: The DagRuns to schedule
+        :return: The DagRuns along with the callback that needs to be executed for each of them
+        """
+        tis_by_run = DagRun.fetch_task_instances_for_runs(dag_runs, session=session)
         callback_tuples = []
+        schedulable_tis_by_run: dict[tuple[str, str], list[TI]] = {}
         for dag_run in dag_runs:
-            callback_to_run = self._schedule_dag_run(dag_run, session)
+            schedulable_tis, callback_to_run = self._get_dag_run_scheduling_decision(
+                dag_run, session, prefetched_tis=tis_by_run.get((dag_run.dag_id, dag_run.run_id))
+            )
+            if schedulable_tis:
+                schedulable_tis_by_run[(dag_run.dag_id, dag_run.run_id)] = schedulable_tis
             callback_tuples.append((dag_run, callback_to_run))
 
-        guard.commit()
-
+        DagRun.bulk_schedule_tis(schedulable_tis_by_run, session=session)
         return callback_tuples
 
     def _schedule_dag_run(
@@ -1250,13 +1651,35 @@ class SchedulerJob(BaseJob):
         :param dag_run: The DagRun to schedule
         :return: Callback that needs to be executed
         """
+        schedulable_tis, callback_to_run = self._get_dag_run_scheduling_decision(dag_run, session)
+        # This will do one query per dag run. We "could" build up a complex
+        # query to update all the TIs across all the execution dates and dag
+        # IDs in a single query, but it turns out that can be _very very slow_
+        # see #11147/commit ee90807ac for more details
+        dag_run.schedule_tis(schedulable_tis, session)
+
+        return callback_to_run
+
+    def _get_dag_run_scheduling_decision(
+        self,
+        dag_run: DagRun,
+        session: Session,
+        prefetched_tis: list[TI] | None = None,
+    ) -> tuple[list[TI], DagCallbackRequest | None]:
+        """
+        Update the state of an individual dag run and work out which of its task instances can be scheduled
+
+        :param dag_run: The DagRun to schedule
+        :param prefetched_tis: All the task instances of the dag run, if they have already been loaded
+        :return: Task instances to set to the scheduled state and callback that needs to be executed
+        """
         callback: DagCallbackRequest | None = None
 
         dag = dag_run.dag = self.dagbag.get_dag(dag_run.dag_id, session=session)
 
         if not dag:
             self.log.error("Couldn't find dag %s in DagBag/DB!", dag_run.dag_id)
-            return callback
+            return [], callback
         dag_model = DM.get_dagmodel(dag.dag_id, session)
 
         if (
@@ -1290,34 +1713,37 @@ class SchedulerJob(BaseJob):
                 msg='timed_out',
             )
 
-            return callback_to_execute
+            return [], callback_to_execute
 
         if dag_run.execution_date > timezone.utcnow() and not dag.allow_future_exec_dates:
             self.log.error("Execution date is in future: %s", dag_run.execution_date)
-            return callback
+            return [], callback
 
-        self._verify_integrity_if_dag_changed(dag_run=dag_run, session=session)
+        if self._verify_integrity_if_dag_changed(dag_run=dag_run, session=session):
+            # Task instances may have been added or removed, the prefetched ones cannot be trusted
+            prefetched_tis = None
         # TODO[HA]: Rename update_state -> schedule_dag_run, ?? something else?
-        schedulable_tis, callback_to_run = dag_run.update_state(session=session, execute_callbacks=False)
+        schedulable_tis, callback_to_run = dag_run.update_state(
+            session=session, execute_callbacks=False, prefetched_tis=prefetched_tis
+        )
         if dag_run.state in State.finished:
             active_runs = dag.get_num_active_runs(only_running=False, session=session)
             # Work out if we should allow creating a new DagRun now?
             if self._should_update_dag_next_dagruns(dag, dag_model, active_runs):
                 dag_model.calculate_dagrun_date_fields(dag, dag.get_run_data_interval(dag_run))
-        # This will do one query per dag run. We "could" build up a complex
-        # query to update all the TIs across all the execution dates and dag
-        # IDs in a single query, but it turns out that can be _very very slow_
-        # see #11147/commit ee90807ac for more details
-        dag_run.schedule_tis(schedulable_tis, session)
 
-        return callback_to_run
+        return schedulable_tis, callback_to_run
+
+    def _verify_integrity_if_dag_changed(self, dag_run: DagRun, session: Session) -> bool:
+        """
+        Only run DagRun.verify integrity if Serialized DAG has changed since it is slow
 
-    def _verify_integrity_if_dag_changed(self, dag_run: DagRun, session: Session) -> None:
-        """Only run DagRun.verify integrity if Serialized DAG has changed since it is slow"""
+        :return: Whether the integrity of the dag run was verified
+        """
         latest_version = SerializedDagModel.get_latest_version_hash(dag_run.dag_id, session=session)
         if dag_run.dag_hash == latest_version:
             self.log.debug("DAG %s not changed structure, skipping dagrun.verify_integrity", dag_run.dag_id)
-            return
+            return False
 
         dag_run.dag_hash = latest_version
 
@@ -1326,6 +1752,7 @@ class SchedulerJob(BaseJob):
 
         # Verify integrity also takes care of session.flush
         dag_run.verify_integrity(session=session)
+        return True
 
     def _send_dag_callbacks_to_processor(self, dag: DAG, callback: DagCallbackRequest | None = None) -> None:
         self._send_sla_callbacks_to_processor(dag)
@@ -1433,6 +1860,8 @@ class SchedulerJob(BaseJob):
                         reset_tis_message.append(repr(ti))
                         ti.state = State.NONE
                         ti.queued_by_job_id = None
+                        if self._concurrency_ledger is not None:
+                            self._concurrency_ledger.discard((ti.dag_id, ti.task_id, ti.run_id, ti.map_index))
 
                     for ti in set(tis_to_reset_or_adopt) - set(to_reset):
                         ti.queued_by_job_id = self.id
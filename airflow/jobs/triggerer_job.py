@@ -17,16 +17,22 @@
 from __future__ import annotations
 
 import asyncio
+import multiprocessing
+import multiprocessing.connection
 import os
+import pickle
 import signal
 import sys
 import threading
 import time
 from collections import deque
-from typing import Deque
+from multiprocessing.connection import Connection as MultiprocessingConnection
+from typing import Any, Deque
 
+from setproctitle import setproctitle
 from sqlalchemy import func
 
+from airflow import settings
 from airflow.configuration import conf
 from airflow.jobs.base_job import BaseJob
 from airflow.models.trigger import Trigger
@@ -34,6 +40,7 @@ from airflow.stats import Stats
 from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.typing_compat import TypedDict
 from airflow.utils.log.logging_mixin import LoggingMixin
+from airflow.utils.mixins import MultiprocessingStartMethodMixin
 from airflow.utils.module_loading import import_string
 from airflow.utils.session import provide_session
 
@@ -62,8 +69,13 @@ class TriggererJob(BaseJob):
         else:
             raise ValueError(f"Capacity number {capacity} is invalid")
 
-        # Set up runner async thread
-        self.runner = TriggerRunner()
+        # Set up runner async thread, or the subprocesses running the shards of the triggers
+        self.runner: TriggerRunner | ShardedTriggerRunner
+        runner_processes = conf.getint('triggerer', 'runner_processes', fallback=0)
+        if runner_processes > 0:
+            self.runner = ShardedTriggerRunner(runner_processes)
+        else:
+            self.runner = TriggerRunner()
 
     def register_signals(self) -> None:
         """Register signals that stop child processes"""
@@ -120,13 +132,17 @@ class TriggererJob(BaseJob):
         """
         The main-thread trigger loop.
 
-        This runs synchronously and handles all database reads/writes.
+        This runs synchronously and handles all database reads/writes. The triggers are loaded
+        from the database every second, and their events are handled as soon as the runner has them.
         """
+        next_load = time.monotonic()
         while not self.runner.stop:
-            # Clean out unused triggers
-            Trigger.clean_unused()
-            # Load/delete triggers
-            self.load_triggers()
+            if time.monotonic() >= next_load:
+                # Clean out unused triggers
+                Trigger.clean_unused()
+                # Load/delete triggers
+                self.load_triggers()
+                next_load = time.monotonic() + 1
             # Handle events
             self.handle_events()
             # Handle failed triggers
@@ -135,8 +151,8 @@ class TriggererJob(BaseJob):
             self.heartbeat(only_if_necessary=True)
             # Collect stats
             self.emit_metrics()
-            # Idle sleep
-            time.sleep(1)
+            # Idle until the runner has events, or it is time to load the triggers again
+            self.runner.wait_for_events(max(next_load - time.monotonic(), 0))
 
     def load_triggers(self):
         """
@@ -153,13 +169,16 @@ class TriggererJob(BaseJob):
         Handles outbound events from triggers - dispatching them into the Trigger
         model where they are then pushed into the relevant task instances.
         """
+        events = []
         while self.runner.events:
             # Get the event and its trigger ID
-            trigger_id, event = self.runner.events.popleft()
-            # Tell the model to wake up its tasks
-            Trigger.submit_event(trigger_id=trigger_id, event=event)
-            # Emit stat event
-            Stats.incr('triggers.succeeded')
+            events.append(self.runner.events.popleft())
+        if not events:
+            return
+        # Tell the model to wake up the tasks of all the triggers at once
+        Trigger.submit_events(events)
+        # Emit stat event
+        Stats.incr('triggers.succeeded', len(events))
 
     def handle_failed_triggers(self):
         """
@@ -175,6 +194,9 @@ class TriggererJob(BaseJob):
 
     def emit_metrics(self):
         Stats.gauge('triggers.running', len(self.runner.triggers))
+        if isinstance(self.runner, ShardedTriggerRunner):
+            for shard in self.runner.shards:
+                Stats.gauge(f'triggers.running.shard_{shard.index}', len(shard.trigger_ids))
 
 
 class TriggerDetails(TypedDict):
@@ -224,6 +246,11 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
+        # Wakes the event loop up when there are triggers to create, cancel or clean up
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        # Wakes the main thread up when there are events or failed triggers
+        self._events_available = threading.Event()
 
     def run(self):
         """Sync entrypoint - just runs arun in an async loop."""
@@ -236,6 +263,8 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         The loop in here runs trigger addition/deletion/cleanup. Actual
         triggers run in their own separate coroutines.
         """
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         watchdog = asyncio.create_task(self.block_watchdog())
         last_status = time.time()
         while not self.stop:
@@ -243,8 +272,12 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             await self.create_triggers()
             await self.cancel_triggers()
             await self.cleanup_finished_triggers()
-            # Sleep for a bit
-            await asyncio.sleep(1)
+            # Sleep until there is something to do, or for a bit
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=1)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
             # Every minute, log status if at least one trigger is running.
             if time.time() - last_status >= 60:
                 count = len(self.triggers)
@@ -319,6 +352,7 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                         details["name"],
                     )
                     self.failed_triggers.append((trigger_id, saved_exc))
+                    self._events_available.set()
                 del self.triggers[trigger_id]
             await asyncio.sleep(0)
 
@@ -362,15 +396,39 @@ class TriggerRunner(threading.Thread, LoggingMixin):
                 self.log.info("Trigger %s fired: %s", self.triggers[trigger_id]['name'], event)
                 self.triggers[trigger_id]["events"] += 1
                 self.events.append((trigger_id, event))
+                self._events_available.set()
         finally:
             # CancelledError will get injected when we're stopped - which is
             # fine, the cleanup process will understand that, but we want to
             # allow triggers a chance to cleanup, either in that case or if
             # they exit cleanly.
             trigger.cleanup()
+            # Clean the finished trigger up right away
+            self.wakeup()
 
     # Main-thread sync API
 
+    def wakeup(self) -> None:
+        """Wake the event loop up to act on the queues. Can be called from any thread."""
+        if self._loop is None or self._wakeup is None:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            # The event loop is closed already
+            pass
+
+    def wait_for_events(self, timeout: float) -> bool:
+        """
+        Wait up to ``timeout`` seconds for events or failed triggers to handle.
+
+        :return: whether there are events or failed triggers to handle
+        """
+        if not self.events and not self.failed_triggers:
+            self._events_available.wait(timeout)
+        self._events_available.clear()
+        return bool(self.events or self.failed_triggers)
+
     def update_triggers(self, requested_trigger_ids: set[int]):
         """
         Called from the main thread to request that we update what
@@ -408,11 +466,14 @@ class TriggerRunner(threading.Thread, LoggingMixin):
             except BaseException as e:
                 # Either the trigger code or the path to it is bad. Fail the trigger.
                 self.failed_triggers.append((new_id, e))
+                self._events_available.set()
                 continue
             self.to_create.append((new_id, trigger_class(**new_triggers[new_id].kwargs)))
         # Enqueue orphaned triggers for cancellation
         for old_id in cancel_trigger_ids:
             self.to_cancel.append(old_id)
+        if self.to_create or self.to_cancel:
+            self.wakeup()
 
     def get_trigger_by_classpath(self, classpath: str) -> type[BaseTrigger]:
         """
@@ -423,3 +484,258 @@ class TriggerRunner(threading.Thread, LoggingMixin):
         if classpath not in self.trigger_cache:
             self.trigger_cache[classpath] = import_string(classpath)
         return self.trigger_cache[classpath]
+
+
+def _run_trigger_runner_shard(
+    channel: MultiprocessingConnection, parent_channel: MultiprocessingConnection, index: int
+) -> None:
+    """
+    Run a TriggerRunner in a shard subprocess.
+
+    Receives the IDs of the triggers the shard should run from the triggerer, and sends back the events,
+    the failed triggers and the IDs of the running triggers every second.
+    """
+    # The triggerer's end of the pipe was inherited, close it so the pipe breaks when the triggerer dies
+    parent_channel.close()
+    del parent_channel
+
+    setproctitle(f"airflow triggerer -- shard {index}")
+    # Re-configure the ORM engine as there are issues with multiple processes
+    settings.configure_orm()
+
+    runner = TriggerRunner()
+    runner.daemon = True
+
+    def _exit_gracefully(signum, frame) -> None:
+        runner.stop = True
+
+    # The triggerer stops its shards itself when it is interrupted
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _exit_gracefully)
+
+    # Triggers whose events or failures were sent to the triggerer, but which it still requests as it
+    # has not handled them yet. They must not be started again.
+    reported_trigger_ids: set[int] = set()
+    last_status = 0.0
+    runner.start()
+    try:
+        while not runner.stop:
+            # Forward events as soon as they fire, while checking for commands every 50ms
+            has_events = runner.wait_for_events(0.05)
+            updated = False
+            while channel.poll():
+                command, requested_trigger_ids = channel.recv()
+                if command == "stop":
+                    runner.stop = True
+                    break
+                reported_trigger_ids &= requested_trigger_ids
+                runner.update_triggers(requested_trigger_ids - reported_trigger_ids)
+                updated = True
+            if runner.stop or not (has_events or updated or time.monotonic() - last_status >= 1):
+                continue
+            last_status = time.monotonic()
+            events = []
+            while runner.events:
+                events.append(runner.events.popleft())
+            failed_triggers = []
+            while runner.failed_triggers:
+                trigger_id, exc = runner.failed_triggers.popleft()
+                failed_triggers.append((trigger_id, _picklable_exception(exc)))
+            reported_trigger_ids.update(trigger_id for trigger_id, _ in events)
+            reported_trigger_ids.update(trigger_id for trigger_id, _ in failed_triggers)
+            channel.send(("status", events, failed_triggers, set(runner.triggers)))
+    except (EOFError, BrokenPipeError, ConnectionResetError):
+        # The triggerer died, stop running its triggers
+        runner.stop = True
+    finally:
+        runner.stop = True
+        runner.join(30)
+        channel.close()
+        settings.dispose_orm()
+
+
+def _picklable_exception(exc: BaseException | None) -> BaseException | None:
+    """Return the exception, or a RuntimeError describing it if it cannot be sent to the triggerer."""
+    try:
+        pickle.dumps(exc)
+    except Exception:
+        return RuntimeError(f"{type(exc).__name__}: {exc}")
+    return exc
+
+
+class TriggerRunnerShard(LoggingMixin, MultiprocessingStartMethodMixin):
+    """
+    One shard of the triggers of a triggerer, run by a TriggerRunner in its own subprocess.
+
+    :param index: Index of the shard within the triggerer
+    """
+
+    def __init__(self, index: int) -> None:
+        super().__init__()
+        self.index = index
+        # IDs of the triggers the shard reported running
+        self.trigger_ids: set[int] = set()
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self._parent_channel: MultiprocessingConnection | None = None
+
+    def start(self) -> None:
+        """Launch the subprocess of the shard."""
+        context = multiprocessing.get_context(self._get_multiprocessing_start_method())
+        parent_channel, child_channel = context.Pipe()
+        self._process = context.Process(
+            target=_run_trigger_runner_shard,
+            args=(child_channel, parent_channel, self.index),
+            name=f"TriggerRunnerShard{self.index}-Process",
+        )
+        self._process.start()
+        # Close the child side of the pipe now the subprocess has started, so that the pipe breaks
+        # when the subprocess dies
+        child_channel.close()
+        self._parent_channel = parent_channel
+        self.trigger_ids = set()
+
+    @property
+    def pid(self) -> int | None:
+        return self._process.pid if self._process else None
+
+    @property
+    def channel(self) -> MultiprocessingConnection | None:
+        return self._parent_channel
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def send(self, command: str, trigger_ids: set[int]) -> None:
+        """Send a command to the shard, ignoring a shard that died; it is restarted by the caller."""
+        if self._parent_channel is None:
+            return
+        try:
+            self._parent_channel.send((command, trigger_ids))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def receive(self) -> list[tuple[Any, ...]]:
+        """Receive the messages the shard sent since the last call, without blocking."""
+        messages = []
+        if self._parent_channel is None:
+            return messages
+        try:
+            while self._parent_channel.poll():
+                messages.append(self._parent_channel.recv())
+        except (EOFError, ConnectionResetError):
+            pass
+        return messages
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the subprocess to exit, killing it if it does not within ``timeout`` seconds."""
+        if self._process is None:
+            return
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self.log.warning("Killing trigger runner shard %d (PID=%d)", self.index, self._process.pid)
+            self._process.kill()
+            self._process.join()
+        if self._parent_channel is not None:
+            self._parent_channel.close()
+            self._parent_channel = None
+
+
+class ShardedTriggerRunner(LoggingMixin):
+    """
+    Runs the triggers of a triggerer in several TriggerRunner subprocesses.
+
+    Each trigger is assigned to a shard by hashing its ID, so it always runs in the same subprocess, and
+    a trigger hogging its event loop only delays the triggers of its own shard. A shard that dies is
+    restarted with its triggers, without affecting the other shards.
+
+    It is interacted with from the main thread of the triggerer like a TriggerRunner.
+
+    :param num_shards: Number of subprocesses to run the triggers in
+    """
+
+    # Outbound queue of events
+    events: Deque[tuple[int, TriggerEvent]]
+
+    # Outbound queue of failed triggers
+    failed_triggers: Deque[tuple[int, BaseException | None]]
+
+    # Should-we-stop flag
+    stop: bool = False
+
+    def __init__(self, num_shards: int) -> None:
+        super().__init__()
+        self.shards = [TriggerRunnerShard(index) for index in range(num_shards)]
+        self.events = deque()
+        self.failed_triggers = deque()
+
+    @property
+    def triggers(self) -> set[int]:
+        """IDs of the triggers running in all shards."""
+        return set().union(*(shard.trigger_ids for shard in self.shards))
+
+    def shard_for(self, trigger_id: int) -> TriggerRunnerShard:
+        return self.shards[hash(trigger_id) % len(self.shards)]
+
+    def start(self) -> None:
+        for shard in self.shards:
+            if not shard.is_alive():
+                shard.start()
+
+    def join(self, timeout: float | None = None) -> None:
+        """Stop all shards and wait up to ``timeout`` seconds for them to exit."""
+        for shard in self.shards:
+            shard.send("stop", set())
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for shard in self.shards:
+            shard.join(max(deadline - time.monotonic(), 0) if deadline is not None else None)
+
+    def update_triggers(self, requested_trigger_ids: set[int]) -> None:
+        """
+        Called from the main thread to request that we update what triggers we're running.
+
+        Collects what the shards reported since the last call, restarts the shards that died, and
+        sends every shard the IDs of the triggers assigned to it.
+        """
+        self._collect()
+        # Triggers with an event or failure still to be handled must not be started again
+        pending_trigger_ids = {trigger_id for trigger_id, _ in self.events}.union(
+            trigger_id for trigger_id, _ in self.failed_triggers
+        )
+        shard_trigger_ids: dict[int, set[int]] = {shard.index: set() for shard in self.shards}
+        for trigger_id in requested_trigger_ids - pending_trigger_ids:
+            shard_trigger_ids[self.shard_for(trigger_id).index].add(trigger_id)
+        for shard in self.shards:
+            shard.send("update", shard_trigger_ids[shard.index])
+
+    def wait_for_events(self, timeout: float) -> bool:
+        """
+        Wait up to ``timeout`` seconds for events or failed triggers to handle.
+
+        :return: whether there are events or failed triggers to handle
+        """
+        if not self.events and not self.failed_triggers:
+            channels = [shard.channel for shard in self.shards if shard.channel is not None]
+            if channels:
+                multiprocessing.connection.wait(channels, timeout)
+            else:
+                time.sleep(timeout)
+            self._collect()
+        return bool(self.events or self.failed_triggers)
+
+    def _collect(self) -> None:
+        for shard in self.shards:
+            for _, events, failed_triggers, trigger_ids in shard.receive():
+                self.events.extend(events)
+                self.failed_triggers.extend(failed_triggers)
+                shard.trigger_ids = trigger_ids
+            # Shards not started yet are left to start()
+            if not self.stop and shard.pid is not None and not shard.is_alive():
+                self.log.error(
+                    "Trigger runner shard %d (PID=%s) died, restarting it with its %d triggers",
+                    shard.index,
+                    shard.pid,
+                    len(shard.trigger_ids),
+                )
+                Stats.incr('triggers.shard_restarts')
+                shard.join(0)
+                shard.start()
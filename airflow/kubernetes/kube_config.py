@@ -43,6 +43,15 @@ class KubeConfig:
         self.worker_pods_creation_batch_size = conf.getint(
             self.kubernetes_section, 'worker_pods_creation_batch_size'
         )
+        self.worker_pods_creation_parallelism = conf.getint(
+            self.kubernetes_section, 'worker_pods_creation_parallelism', fallback=1
+        )
+        self.worker_pods_creation_rate_limit = conf.getfloat(
+            self.kubernetes_section, 'worker_pods_creation_rate_limit', fallback=0
+        )
+        self.worker_pods_creation_max_retries = conf.getint(
+            self.kubernetes_section, 'worker_pods_creation_max_retries', fallback=3
+        )
 
         self.worker_container_repository = conf.get(self.kubernetes_section, 'worker_container_repository')
         self.worker_container_tag = conf.get(self.kubernetes_section, 'worker_container_tag')
@@ -73,6 +82,7 @@ class KubeConfig:
         self.worker_pods_queued_check_interval = conf.getint(
             self.kubernetes_section, 'worker_pods_queued_check_interval'
         )
+        self.cache_worker_pods = conf.getboolean(self.kubernetes_section, 'cache_worker_pods', fallback=False)
 
         self.kube_client_request_args = conf.getjson(
             self.kubernetes_section, 'kube_client_request_args', fallback={}
@@ -25,11 +25,14 @@ from __future__ import annotations
 import copy
 import datetime
 import hashlib
+import json
 import logging
 import os
 import re
+import threading
 import uuid
 import warnings
+from collections import OrderedDict
 from functools import reduce
 
 from dateutil import parser
@@ -340,35 +343,16 @@ class PodGenerator:
             - executor_config
             - dynamic arguments
         """
-        try:
-            image = pod_override_object.spec.containers[0].image  # type: ignore
-            if not image:
-                image = kube_image
-        except Exception:
-            image = kube_image
-
-        annotations = {
-            'dag_id': dag_id,
-            'task_id': task_id,
-            'try_number': str(try_number),
-        }
-        labels = {
-            'airflow-worker': make_safe_label_value(scheduler_job_id),
-            'dag_id': make_safe_label_value(dag_id),
-            'task_id': make_safe_label_value(task_id),
-            'try_number': str(try_number),
-            'airflow_version': airflow_version.replace('+', '-'),
-            'kubernetes_executor': 'True',
-        }
-        if map_index >= 0:
-            annotations['map_index'] = str(map_index)
-            labels['map_index'] = str(map_index)
-        if date:
-            annotations['execution_date'] = date.isoformat()
-            labels['execution_date'] = datetime_to_label_safe_datestring(date)
-        if run_id:
-            annotations['run_id'] = run_id
-            labels['run_id'] = make_safe_label_value(run_id)
+        image = PodGenerator.get_override_image(pod_override_object) or kube_image
+        annotations, labels = PodGenerator.make_pod_metadata(
+            dag_id=dag_id,
+            task_id=task_id,
+            try_number=try_number,
+            date=date,
+            scheduler_job_id=scheduler_job_id,
+            run_id=run_id,
+            map_index=map_index,
+        )
 
         dynamic_pod = k8s.V1Pod(
             metadata=k8s.V1ObjectMeta(
@@ -398,6 +382,94 @@ class PodGenerator:
         except Exception as e:
             raise PodReconciliationError from e
 
+    @staticmethod
+    def construct_pod_from_template(
+        pod_template: k8s.V1Pod,
+        dag_id: str,
+        task_id: str,
+        pod_id: str,
+        try_number: int,
+        date: datetime.datetime | None,
+        args: list[str],
+        namespace: str,
+        scheduler_job_id: str,
+        run_id: str | None = None,
+        map_index: int = -1,
+    ) -> k8s.V1Pod:
+        """
+        Construct a pod from a template returned by :meth:`PodTemplateCache.get_pod_template`.
+
+        The resulting pod is the same as the one returned by :meth:`construct_pod`, but only
+        the fields set for each task are patched on a copy of the template instead of
+        reconciling the pods again.
+        """
+        annotations, labels = PodGenerator.make_pod_metadata(
+            dag_id=dag_id,
+            task_id=task_id,
+            try_number=try_number,
+            date=date,
+            scheduler_job_id=scheduler_job_id,
+            run_id=run_id,
+            map_index=map_index,
+        )
+        pod = copy.deepcopy(pod_template)
+        pod.metadata = pod.metadata or k8s.V1ObjectMeta()
+        pod.metadata.annotations = {**(pod.metadata.annotations or {}), **annotations}
+        pod.metadata.labels = {**(pod.metadata.labels or {}), **labels}
+        pod.metadata.name = PodGenerator.make_unique_pod_id(pod_id) or pod.metadata.name
+        pod.metadata.namespace = namespace or pod.metadata.namespace
+
+        # The name and image of the base container are already reconciled in the template
+        container = pod.spec.containers[0]
+        container.args = args or container.args
+        container.env = (container.env or []) + [
+            k8s.V1EnvVar(name="AIRFLOW_IS_K8S_EXECUTOR_POD", value="True")
+        ]
+        return pod
+
+    @staticmethod
+    def get_override_image(pod_override_object: k8s.V1Pod | None) -> str | None:
+        """Returns the image of the base container set in the executor_config, if any."""
+        try:
+            return pod_override_object.spec.containers[0].image  # type: ignore
+        except Exception:
+            return None
+
+    @staticmethod
+    def make_pod_metadata(
+        dag_id: str,
+        task_id: str,
+        try_number: int,
+        date: datetime.datetime | None,
+        scheduler_job_id: str,
+        run_id: str | None = None,
+        map_index: int = -1,
+    ) -> tuple[dict[str, str], dict[str, str]]:
+        """Returns the annotations and labels identifying the task instance run by a pod."""
+        annotations = {
+            'dag_id': dag_id,
+            'task_id': task_id,
+            'try_number': str(try_number),
+        }
+        labels = {
+            'airflow-worker': make_safe_label_value(scheduler_job_id),
+            'dag_id': make_safe_label_value(dag_id),
+            'task_id': make_safe_label_value(task_id),
+            'try_number': str(try_number),
+            'airflow_version': airflow_version.replace('+', '-'),
+            'kubernetes_executor': 'True',
+        }
+        if map_index >= 0:
+            annotations['map_index'] = str(map_index)
+            labels['map_index'] = str(map_index)
+        if date:
+            annotations['execution_date'] = date.isoformat()
+            labels['execution_date'] = datetime_to_label_safe_datestring(date)
+        if run_id:
+            annotations['run_id'] = run_id
+            labels['run_id'] = make_safe_label_value(run_id)
+        return annotations, labels
+
     @staticmethod
     def serialize_pod(pod: k8s.V1Pod) -> dict:
         """
@@ -470,6 +542,74 @@ class PodGenerator:
         return f"{trimmed_pod_id}-{safe_uuid}"
 
 
+class PodTemplateCache:
+    """
+    Cache of the worker pod templates reconciled with the ``pod_override`` of the executor_config.
+
+    Reading the pod_template_file and reconciling it with the executor_config is most of the work
+    of constructing a worker pod, and gives the same result for every task using the same
+    pod_template_file and executor_config. The templates are cached per pod_template_file
+    (invalidated when the file is modified) and executor_config, and the pods of the tasks are
+    constructed from them with :meth:`PodGenerator.construct_pod_from_template`.
+
+    :param kube_image: the image of the base container when not set in the executor_config
+    :param max_size: the maximum number of templates kept in the cache
+    """
+
+    def __init__(self, kube_image: str | None, max_size: int = 128):
+        self.kube_image = kube_image
+        self.max_size = max_size
+        self._templates: OrderedDict[tuple, k8s.V1Pod] = OrderedDict()
+        self._lock = threading.Lock()
+        self._api_client = ApiClient()
+
+    def get_pod_template(
+        self, pod_template_file: str, pod_override_object: k8s.V1Pod | None
+    ) -> k8s.V1Pod | None:
+        """
+        Returns the pod_template_file reconciled with the executor_config and the base container
+        of the worker pods.
+
+        The returned template is shared and must not be modified.
+
+        :param pod_template_file: absolute path to a pod_template_file.yaml
+        :param pod_override_object: the ``pod_override`` of the executor_config
+        """
+        try:
+            mtime = os.path.getmtime(pod_template_file)
+        except OSError:
+            mtime = None
+        override = self._api_client.sanitize_for_serialization(pod_override_object)
+        override_hash = hashlib.md5(json.dumps(override, sort_keys=True).encode()).hexdigest()
+        key = (pod_template_file, mtime, override_hash)
+
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                return template
+
+        base_worker_pod = PodGenerator.deserialize_model_file(pod_template_file)
+        if not base_worker_pod:
+            return None
+        image = PodGenerator.get_override_image(pod_override_object) or self.kube_image
+        base_container_pod = k8s.V1Pod(
+            spec=k8s.V1PodSpec(containers=[k8s.V1Container(name="base", image=image)])
+        )
+        try:
+            template = reduce(
+                PodGenerator.reconcile_pods, [base_worker_pod, pod_override_object, base_container_pod]
+            )
+        except Exception as e:
+            raise PodReconciliationError from e
+
+        with self._lock:
+            self._templates[key] = template
+            while len(self._templates) > self.max_size:
+                self._templates.popitem(last=False)
+        return template
+
+
 def merge_objects(base_obj, client_obj):
     """
     :param base_obj: has the base attributes which are overwritten if they exist
@@ -201,6 +201,9 @@ class AbstractOperator(LoggingMixin, DAGNode):
             return set()
 
         if found_descendants is None:
+            topology = dag._topology_index
+            if topology is not None and self.task_id in topology:
+                return topology.get_flat_relative_ids([self.task_id], upstream)
             found_descendants = set()
 
         task_ids_to_trace = self.get_direct_relative_ids(upstream)
@@ -106,6 +106,7 @@ if TYPE_CHECKING:
     from airflow.decorators import TaskDecoratorCollection
     from airflow.models.dagbag import DagBag
     from airflow.models.slamiss import SlaMiss
+    from airflow.serialization.topology import DagTopologyIndex
     from airflow.utils.task_group import TaskGroup
 
 
@@ -372,6 +373,7 @@ class DAG(LoggingMixin):
     """
 
     parent_dag: DAG | None = None  # Gets set when DAGs are loaded
+    _topology_index: DagTopologyIndex | None = None  # Gets set when DAGs are deserialized
 
     # NOTE: When updating arguments here, please also keep arguments in @dag()
     # below in sync. (Search for 'def dag(' in this file.)
@@ -1901,11 +1903,15 @@ class DAG(LoggingMixin):
     @property
     def roots(self) -> list[Operator]:
         """Return nodes with no parents. These are first to execute and are called roots or root nodes."""
+        if self._topology_index is not None:
+            return [self.task_dict[task_id] for task_id in self._topology_index.roots]
         return [task for task in self.tasks if not task.upstream_list]
 
     @property
     def leaves(self) -> list[Operator]:
         """Return nodes with no children. These are last to execute and are called leaves or leaf nodes."""
+        if self._topology_index is not None:
+            return [self.task_dict[task_id] for task_id in self._topology_index.leaves]
         return [task for task in self.tasks if not task.downstream_list]
 
     def topological_sort(self, include_subdag_tasks: bool = False):
@@ -1917,6 +1923,10 @@ class DAG(LoggingMixin):
         """
         from airflow.utils.task_group import TaskGroup
 
+        if self._topology_index is not None and not include_subdag_tasks:
+            task_ids = self._topology_index.task_ids
+            return tuple(self.task_dict[task_ids[i]] for i in self._topology_index.topological_order)
+
         def nested_topo(group):
             for node in group.topological_sort(_include_subdag_tasks=include_subdag_tasks):
                 if isinstance(node, TaskGroup):
@@ -2127,7 +2137,7 @@ class DAG(LoggingMixin):
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ('user_defined_macros', 'user_defined_filters', '_log'):
+            if k not in ('user_defined_macros', 'user_defined_filters', '_log', '_topology_index'):
                 setattr(result, k, copy.deepcopy(v, memo))
 
         result.user_defined_macros = self.user_defined_macros
@@ -2180,11 +2190,24 @@ class DAG(LoggingMixin):
             matched_tasks = [t for t in self.tasks if t.task_id in task_ids_or_regex]
 
         also_include: list[Operator] = []
-        for t in matched_tasks:
+        if self._topology_index is not None:
+            matched_task_ids = [t.task_id for t in matched_tasks]
             if include_downstream:
-                also_include.extend(t.get_flat_relatives(upstream=False))
+                also_include.extend(
+                    self.task_dict[task_id]
+                    for task_id in self._topology_index.get_flat_relative_ids(matched_task_ids)
+                )
             if include_upstream:
-                also_include.extend(t.get_flat_relatives(upstream=True))
+                also_include.extend(
+                    self.task_dict[task_id]
+                    for task_id in self._topology_index.get_flat_relative_ids(matched_task_ids, upstream=True)
+                )
+        else:
+            for t in matched_tasks:
+                if include_downstream:
+                    also_include.extend(t.get_flat_relatives(upstream=False))
+                if include_upstream:
+                    also_include.extend(t.get_flat_relatives(upstream=True))
 
         direct_upstreams: list[Operator] = []
         if include_direct_upstream:
@@ -2356,6 +2379,7 @@ class DAG(LoggingMixin):
         else:
             self.task_dict[task_id] = task
             task.dag = self
+            self._topology_index = None
             # Add task_id to used_group_ids to prevent group_id and task_id collisions.
             self._task_group.used_group_ids.add(task_id)
 
@@ -3267,6 +3291,20 @@ class DagModel(Base):
         paused_dag_ids = {paused_dag_id for paused_dag_id, in paused_dag_ids}
         return paused_dag_ids
 
+    @staticmethod
+    @provide_session
+    def expire_dags(dag_ids: list[str], session: Session = NEW_SESSION) -> None:
+        """
+        Signal that the given DAGs must be refreshed from their files, even if the files did
+        not change. Use this when a DAG is generated from dynamic inputs such as Variables.
+
+        :param dag_ids: List of Dag ids
+        :param session: ORM Session
+        """
+        session.query(DagModel).filter(DagModel.dag_id.in_(dag_ids)).update(
+            {DagModel.last_expired: timezone.utcnow()}, synchronize_session=False
+        )
+
     def get_default_view(self) -> str:
         """
         Get the Default DAG View, returns the default config value if DagModel does not
@@ -3330,13 +3368,17 @@ class DagModel(Base):
                 continue
 
     @classmethod
-    def dags_needing_dagruns(cls, session: Session) -> tuple[Query, dict[str, tuple[datetime, datetime]]]:
+    def dags_needing_dagruns(
+        cls, session: Session, dag_ids: Collection[str] | None = None
+    ) -> tuple[Query, dict[str, tuple[datetime, datetime]]]:
         """
         Return (and lock) a list of Dag objects that are due to create a new DagRun.
 
         This will return a resultset of rows that is row-level-locked with a "SELECT ... FOR UPDATE" query,
         you should ensure that any scheduling decisions are made in a single transaction -- as soon as the
         transaction is committed it will be unlocked.
+
+        :param dag_ids: Only return these DAGs, e.g. the partition of the DAGs owned by a scheduler
         """
         # these dag ids are triggered by datasets, and they are ready to go.
         dataset_triggered_dag_info = {
@@ -3371,21 +3413,19 @@ class DagModel(Base):
                     k: v for k, v in dataset_triggered_dag_info.items() if k not in exclusion_list
                 }
 
-        # We limit so that _one_ scheduler doesn't try to do all the creation of dag runs
-        query = (
-            session.query(cls)
-            .filter(
-                cls.is_paused == expression.false(),
-                cls.is_active == expression.true(),
-                cls.has_import_errors == expression.false(),
-                or_(
-                    cls.next_dagrun_create_after <= func.now(),
-                    cls.dag_id.in_(dataset_triggered_dag_ids),
-                ),
-            )
-            .order_by(cls.next_dagrun_create_after)
-            .limit(cls.NUM_DAGS_PER_DAGRUN_QUERY)
+        query = session.query(cls).filter(
+            cls.is_paused == expression.false(),
+            cls.is_active == expression.true(),
+            cls.has_import_errors == expression.false(),
+            or_(
+                cls.next_dagrun_create_after <= func.now(),
+                cls.dag_id.in_(dataset_triggered_dag_ids),
+            ),
         )
+        if dag_ids is not None:
+            query = query.filter(cls.dag_id.in_(dag_ids))
+        # We limit so that _one_ scheduler doesn't try to do all the creation of dag runs
+        query = query.order_by(cls.next_dagrun_create_after).limit(cls.NUM_DAGS_PER_DAGRUN_QUERY)
 
         return (
             with_row_locks(query, of=cls, session=session, **skip_locked(session=session)),
@@ -88,6 +88,9 @@ class DagBag(LoggingMixin):
     :param load_op_links: Should the extra operator link be loaded via plugins when
         de-serializing the DAG? This flag is set to False in Scheduler so that Extra Operator links
         are not loaded to not run User code in Scheduler.
+    :param incremental_db_refresh: Only used with ``read_dags_from_db``. If ``True``, instead of
+        checking every DAG for updates when it is requested, all the DAGs updated since the last
+        check are found with a single query and only those are refreshed.
     """
 
     def __init__(
@@ -99,6 +102,7 @@ class DagBag(LoggingMixin):
         store_serialized_dags: bool | None = None,
         load_op_links: bool = True,
         collect_dags: bool = True,
+        incremental_db_refresh: bool = False,
     ):
         # Avoid circular import
         from airflow.models.dag import DAG
@@ -135,6 +139,10 @@ class DagBag(LoggingMixin):
         self.dags_last_fetched: dict[str, datetime] = {}
         # Only used by SchedulerJob to compare the dag_hash to identify change in DAGs
         self.dags_hash: dict[str, str] = {}
+        # Only used by read_dags_from_db=True and incremental_db_refresh=True
+        self.incremental_db_refresh = incremental_db_refresh
+        self.last_db_sync: datetime | None = None
+        self.db_sync_watermark: datetime | None = None
 
         self.dagbag_import_error_tracebacks = conf.getboolean('core', 'dagbag_import_error_tracebacks')
         self.dagbag_import_error_traceback_depth = conf.getint('core', 'dagbag_import_error_traceback_depth')
@@ -184,11 +192,17 @@ class DagBag(LoggingMixin):
             # Import here so that serialized dag is only imported when serialization is enabled
             from airflow.models.serialized_dag import SerializedDagModel
 
+            if self.incremental_db_refresh:
+                self._sync_from_db(session=session)
+
             if dag_id not in self.dags:
                 # Load from DB if not (yet) in the bag
                 self._add_dag_from_db(dag_id=dag_id, session=session)
                 return self.dags.get(dag_id)
 
+            if self.incremental_db_refresh:
+                return self.dags.get(dag_id)
+
             # If DAG is in the DagBag, check the following
             # 1. if time has come to check if DAG is updated (controlled by min_serialized_dag_fetch_secs)
             # 2. check the last_updated column in SerializedDag table to see if Serialized DAG is updated
@@ -260,6 +274,9 @@ class DagBag(LoggingMixin):
         if not row:
             return None
 
+        self._add_dag_from_db_row(row)
+
+    def _add_dag_from_db_row(self, row) -> None:
         row.load_op_links = self.load_op_links
         dag = row.dag
         for subdag in dag.subdags:
@@ -268,6 +285,54 @@ class DagBag(LoggingMixin):
         self.dags_last_fetched[dag.dag_id] = timezone.utcnow()
         self.dags_hash[dag.dag_id] = row.dag_hash
 
+    def _remove_dag_from_db_cache(self, dag_id: str) -> None:
+        dag = self.dags.pop(dag_id, None)
+        for subdag in dag.subdags if dag else ():
+            self.dags.pop(subdag.dag_id, None)
+        self.dags_last_fetched.pop(dag_id, None)
+        self.dags_hash.pop(dag_id, None)
+
+    def _sync_from_db(self, session: Session) -> None:
+        """
+        Refresh the DAGs loaded from DB that were updated or deleted since the last sync.
+
+        This runs at most once per ``min_serialized_dag_fetch_interval``. The rows changed since
+        the newest ``last_updated`` seen by the previous sync are fetched in one query, and only
+        the loaded DAGs whose hash changed are deserialized again. The query looks back one more
+        interval so that rows written by hosts with a slightly late clock are not missed.
+        """
+        from airflow.models.serialized_dag import SerializedDagModel
+
+        now = timezone.utcnow()
+        min_serialized_dag_fetch_secs = timedelta(seconds=settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL)
+        if self.last_db_sync and now <= self.last_db_sync + min_serialized_dag_fetch_secs:
+            return
+        self.last_db_sync = now
+        if not self.dags_hash:
+            return
+
+        since = self.db_sync_watermark and self.db_sync_watermark - min_serialized_dag_fetch_secs
+        changed_rows = SerializedDagModel.get_changed_since(since, session=session)
+        if changed_rows:
+            self.db_sync_watermark = max(last_updated for _, last_updated, _ in changed_rows)
+
+        deleted_dag_ids = self.dags_hash.keys() - SerializedDagModel.get_dag_ids(session=session)
+        for dag_id in deleted_dag_ids:
+            self.log.warning("Serialized DAG %s no longer exists", dag_id)
+            self._remove_dag_from_db_cache(dag_id)
+
+        changed_dag_ids = [
+            dag_id
+            for dag_id, _, dag_hash in changed_rows
+            if dag_id in self.dags_hash and self.dags_hash[dag_id] != dag_hash
+        ]
+        if not changed_dag_ids:
+            return
+        self.log.debug("Refreshing %d updated serialized DAGs", len(changed_dag_ids))
+        for row in session.query(SerializedDagModel).filter(SerializedDagModel.dag_id.in_(changed_dag_ids)):
+            self._remove_dag_from_db_cache(row.dag_id)
+            self._add_dag_from_db_row(row)
+
     def process_file(self, filepath, only_if_updated=True, safe_mode=True):
         """
         Given a path to a python module or zip file, this method imports
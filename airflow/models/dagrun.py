@@ -26,6 +26,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Collection,
     Iterable,
     Iterator,
     NamedTuple,
@@ -281,6 +282,7 @@ class DagRun(Base, LoggingMixin):
         state: DagRunState,
         session: Session,
         max_number: int | None = None,
+        dag_ids: Collection[str] | None = None,
     ):
         """
         Return the next DagRuns that the scheduler should attempt to schedule.
@@ -289,6 +291,7 @@ class DagRun(Base, LoggingMixin):
         query, you should ensure that any scheduling decisions are made in a single transaction -- as soon as
         the transaction is committed it will be unlocked.
 
+        :param dag_ids: Only return DagRuns of these DAGs, e.g. the partition of the DAGs owned by a scheduler
         :rtype: list[airflow.models.DagRun]
         """
         from airflow.models.dag import DagModel
@@ -303,6 +306,8 @@ class DagRun(Base, LoggingMixin):
             .join(DagModel, DagModel.dag_id == cls.dag_id)
             .filter(DagModel.is_paused == false(), DagModel.is_active == true())
         )
+        if dag_ids is not None:
+            query = query.filter(cls.dag_id.in_(dag_ids))
         if state == State.QUEUED:
             # For dag runs in the queued state, we check if they have reached the max_active_runs limit
             # and if so we drop them
@@ -455,6 +460,43 @@ class DagRun(Base, LoggingMixin):
             tis = tis.filter(TI.task_id.in_(self.dag.task_ids))
         return tis.all()
 
+    @staticmethod
+    def fetch_task_instances_for_runs(
+        dag_runs: Iterable[DagRun], session: Session
+    ) -> dict[tuple[str, str], list[TI]]:
+        """
+        Load the task instances of several dag runs with a single query.
+
+        :param dag_runs: The dag runs to load the task instances of
+        :param session: Sqlalchemy ORM Session
+        :return: A map of ``(dag_id, run_id)`` to the task instances of that dag run
+        """
+        run_ids_by_dag: dict[str, set[str]] = defaultdict(set)
+        for dag_run in dag_runs:
+            run_ids_by_dag[dag_run.dag_id].add(dag_run.run_id)
+
+        tis_by_run: dict[tuple[str, str], list[TI]] = {
+            (dag_id, run_id): [] for dag_id, run_ids in run_ids_by_dag.items() for run_id in run_ids
+        }
+        if not tis_by_run:
+            return tis_by_run
+
+        query = (
+            session.query(TI)
+            .options(joinedload(TI.dag_run))
+            .filter(
+                or_(
+                    *(
+                        and_(TI.dag_id == dag_id, TI.run_id.in_(run_ids))
+                        for dag_id, run_ids in run_ids_by_dag.items()
+                    )
+                )
+            )
+        )
+        for ti in query:
+            tis_by_run[ti.dag_id, ti.run_id].append(ti)
+        return tis_by_run
+
     @provide_session
     def get_task_instance(
         self,
@@ -515,7 +557,11 @@ class DagRun(Base, LoggingMixin):
 
     @provide_session
     def update_state(
-        self, session: Session = NEW_SESSION, execute_callbacks: bool = True
+        self,
+        session: Session = NEW_SESSION,
+        execute_callbacks: bool = True,
+        *,
+        prefetched_tis: list[TI] | None = None,
     ) -> tuple[list[TI], DagCallbackRequest | None]:
         """
         Determines the overall state of the DagRun based on the state
@@ -524,6 +570,8 @@ class DagRun(Base, LoggingMixin):
         :param session: Sqlalchemy ORM Session
         :param execute_callbacks: Should dag callbacks (success/failure, SLA etc) be invoked
             directly (default: true) or recorded as a pending request in the ``callback`` property
+        :param prefetched_tis: All the task instances of this dag run, if they have already been loaded
+            (see :meth:`fetch_task_instances_for_runs`). They are loaded from the database otherwise.
         :return: Tuple containing tis that can be scheduled in the current loop & `callback` that
             needs to be executed
         """
@@ -553,7 +601,7 @@ class DagRun(Base, LoggingMixin):
         self.last_scheduling_decision = start_dttm
         with Stats.timer(f"dagrun.dependency-check.{self.dag_id}"):
             dag = self.get_dag()
-            info = self.task_instance_scheduling_decisions(session)
+            info = self.task_instance_scheduling_decisions(session, prefetched_tis=prefetched_tis)
 
             tis = info.tis
             schedulable_tis = info.schedulable_tis
@@ -670,8 +718,16 @@ class DagRun(Base, LoggingMixin):
         return schedulable_tis, callback
 
     @provide_session
-    def task_instance_scheduling_decisions(self, session: Session = NEW_SESSION) -> TISchedulingDecision:
-        tis = self.get_task_instances(session=session, state=State.task_states)
+    def task_instance_scheduling_decisions(
+        self,
+        session: Session = NEW_SESSION,
+        *,
+        prefetched_tis: list[TI] | None = None,
+    ) -> TISchedulingDecision:
+        if prefetched_tis is None:
+            tis = self.get_task_instances(session=session, state=State.task_states)
+        else:
+            tis = prefetched_tis
         self.log.debug("number of tis tasks for %s: %s task(s)", self, len(tis))
 
         def _filter_tis_and_exclude_removed(dag: DAG, tis: list[TI]) -> Iterable[TI]:
@@ -1203,6 +1259,39 @@ class DagRun(Base, LoggingMixin):
         All the TIs should belong to this DagRun, but this code is in the hot-path, this is not checked -- it
         is the caller's responsibility to call this function only with TIs from a single dag run.
         """
+        schedulable_ti_ids, dummy_ti_ids = self._split_schedulable_tis(schedulable_tis)
+        return self._schedule_ti_ids(self.dag_id, [self.run_id], schedulable_ti_ids, dummy_ti_ids, session)
+
+    @classmethod
+    @provide_session
+    def bulk_schedule_tis(
+        cls, schedulable_tis_by_run: dict[tuple[str, str], list[TI]], session: Session = NEW_SESSION
+    ) -> int:
+        """
+        Set the given task instances of several dag runs in to the scheduled state.
+
+        This behaves like :meth:`schedule_tis`, but runs of the same DAG which have the same set of task
+        instances to schedule are updated together, with one UPDATE statement per group rather than
+        per dag run.
+
+        :param schedulable_tis_by_run: A map of ``(dag_id, run_id)`` to the task instances to schedule
+        :param session: Sqlalchemy ORM Session
+        """
+        run_ids_by_group: dict[tuple[str, tuple, tuple], list[str]] = defaultdict(list)
+        for (dag_id, run_id), schedulable_tis in schedulable_tis_by_run.items():
+            schedulable_ti_ids, dummy_ti_ids = cls._split_schedulable_tis(schedulable_tis)
+            if not schedulable_ti_ids and not dummy_ti_ids:
+                continue
+            group = (dag_id, tuple(sorted(schedulable_ti_ids)), tuple(sorted(dummy_ti_ids)))
+            run_ids_by_group[group].append(run_id)
+
+        count = 0
+        for (dag_id, schedulable_ti_ids, dummy_ti_ids), run_ids in run_ids_by_group.items():
+            count += cls._schedule_ti_ids(dag_id, run_ids, schedulable_ti_ids, dummy_ti_ids, session)
+        return count
+
+    @staticmethod
+    def _split_schedulable_tis(schedulable_tis: Iterable[TI]) -> tuple[list[tuple[str, int]], list[str]]:
         # Get list of TI IDs that do not need to executed, these are
         # tasks using EmptyOperator and without on_execute_callback / on_success_callback
         dummy_ti_ids = []
@@ -1217,15 +1306,24 @@ class DagRun(Base, LoggingMixin):
                 dummy_ti_ids.append(ti.task_id)
             else:
                 schedulable_ti_ids.append((ti.task_id, ti.map_index))
+        return schedulable_ti_ids, dummy_ti_ids
 
+    @staticmethod
+    def _schedule_ti_ids(
+        dag_id: str,
+        run_ids: Sequence[str],
+        schedulable_ti_ids: Sequence[tuple[str, int]],
+        dummy_ti_ids: Sequence[str],
+        session: Session,
+    ) -> int:
         count = 0
 
         if schedulable_ti_ids:
             count += (
                 session.query(TI)
                 .filter(
-                    TI.dag_id == self.dag_id,
-                    TI.run_id == self.run_id,
+                    TI.dag_id == dag_id,
+                    TI.run_id.in_(run_ids),
                     tuple_in_condition((TI.task_id, TI.map_index), schedulable_ti_ids),
                 )
                 .update({TI.state: State.SCHEDULED}, synchronize_session=False)
@@ -1236,8 +1334,8 @@ class DagRun(Base, LoggingMixin):
             count += (
                 session.query(TI)
                 .filter(
-                    TI.dag_id == self.dag_id,
-                    TI.run_id == self.run_id,
+                    TI.dag_id == dag_id,
+                    TI.run_id.in_(run_ids),
                     TI.task_id.in_(dummy_ti_ids),
                 )
                 .update(
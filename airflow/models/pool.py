@@ -141,6 +141,7 @@ class Pool(Base):
     def slots_stats(
         *,
         lock_rows: bool = False,
+        state_count_by_pool: Iterable[tuple[str, str, int]] | None = None,
         session: Session = NEW_SESSION,
     ) -> dict[str, PoolStats]:
         """
@@ -151,6 +152,8 @@ class Pool(Base):
         OperationalError.
 
         :param lock_rows: Should we attempt to obtain a row-level lock on all the Pool rows returns
+        :param state_count_by_pool: Pre-computed ``(pool, state, slots)`` occupancy rows. When given, they
+            are used instead of aggregating the task instance table.
         :param session: SQLAlchemy ORM Session
         """
         from airflow.models.taskinstance import TaskInstance  # Avoid circular import
@@ -168,11 +171,12 @@ class Pool(Base):
                 total_slots = float('inf')  # type: ignore
             pools[pool_name] = PoolStats(total=total_slots, running=0, queued=0, open=0)
 
-        state_count_by_pool = (
-            session.query(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
-            .filter(TaskInstance.state.in_(list(EXECUTION_STATES)))
-            .group_by(TaskInstance.pool, TaskInstance.state)
-        ).all()
+        if state_count_by_pool is None:
+            state_count_by_pool = (
+                session.query(TaskInstance.pool, TaskInstance.state, func.sum(TaskInstance.pool_slots))
+                .filter(TaskInstance.state.in_(list(EXECUTION_STATES)))
+                .group_by(TaskInstance.pool, TaskInstance.state)
+            ).all()
 
         # calculate queued and running metrics
         for (pool_name, state, count) in state_count_by_pool:
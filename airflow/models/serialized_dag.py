@@ -29,18 +29,45 @@ from sqlalchemy import BigInteger, Column, Index, LargeBinary, String, and_, or_
 from sqlalchemy.orm import Session, backref, foreign, relationship
 from sqlalchemy.sql.expression import func, literal
 
+from airflow.compat.functools import cache
+from airflow.exceptions import AirflowConfigException
 from airflow.models.base import ID_LEN, Base
 from airflow.models.dag import DAG, DagModel
 from airflow.models.dagcode import DagCode
 from airflow.models.dagrun import DagRun
+from airflow.serialization.helpers import msgpack_dumps, msgpack_loads
 from airflow.serialization.serialized_objects import DagDependency, SerializedDAG
-from airflow.settings import COMPRESS_SERIALIZED_DAGS, MIN_SERIALIZED_DAG_UPDATE_INTERVAL, json
+from airflow.settings import (
+    COMPRESS_SERIALIZED_DAGS,
+    MIN_SERIALIZED_DAG_UPDATE_INTERVAL,
+    SERIALIZED_DAG_FORMAT,
+    json,
+)
 from airflow.utils import timezone
 from airflow.utils.session import provide_session
 from airflow.utils.sqlalchemy import UtcDateTime
 
 log = logging.getLogger(__name__)
 
+# MessagePack payloads stored in ``data_compressed`` start with one of these markers, so
+# rows written in different formats can be read side by side. Payloads without a marker
+# are zlib compressed JSON.
+MSGPACK_MARKER = b"\x00msgpack\x00"
+MSGPACK_ZLIB_MARKER = b"\x00msgpack+zlib\x00"
+
+
+@cache
+def _msgpack_installed() -> bool:
+    try:
+        import msgpack  # noqa: F401
+    except ImportError:
+        log.warning(
+            "[core] serialized_dag_format is msgpack, but msgpack is not installed: storing "
+            "serialized DAGs as JSON. Install the apache-airflow[msgpack] extra to use it."
+        )
+        return False
+    return True
+
 
 class SerializedDagModel(Base):
     """A table for serialized DAGs.
@@ -56,6 +83,8 @@ class SerializedDagModel(Base):
       to use a smaller interval such as 60
     * ``[core] compress_serialized_dags``:
       whether compressing the dag data to the Database.
+    * ``[core] serialized_dag_format``:
+      whether the dag data is stored as JSON or MessagePack.
 
     It is used by webserver to load dags
     because reading from database is lightweight compared to importing from files,
@@ -103,9 +132,20 @@ class SerializedDagModel(Base):
         dag_data = SerializedDAG.to_dict(dag)
         dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
 
+        # The hash is always computed on the JSON form, so it does not depend on the storage format.
         self.dag_hash = hashlib.md5(dag_data_json).hexdigest()
 
-        if COMPRESS_SERIALIZED_DAGS:
+        if SERIALIZED_DAG_FORMAT not in ("json", "msgpack"):
+            raise AirflowConfigException(
+                f"Unknown [core] serialized_dag_format {SERIALIZED_DAG_FORMAT!r}, "
+                f"expected 'json' or 'msgpack'"
+            )
+
+        dag_data_msgpack = self._encode_msgpack(dag_data) if SERIALIZED_DAG_FORMAT == "msgpack" else None
+        if dag_data_msgpack is not None:
+            self._data = None
+            self._data_compressed = dag_data_msgpack
+        elif COMPRESS_SERIALIZED_DAGS:
             self._data = None
             self._data_compressed = zlib.compress(dag_data_json)
         else:
@@ -119,6 +159,27 @@ class SerializedDagModel(Base):
     def __repr__(self):
         return f"<SerializedDag: {self.dag_id}>"
 
+    def _encode_msgpack(self, dag_data: dict) -> bytes | None:
+        if not _msgpack_installed():
+            return None
+        try:
+            packed = msgpack_dumps(dag_data)
+        except (TypeError, OverflowError, ValueError) as e:
+            # e.g. integers that do not fit in 64 bits, which JSON can still store.
+            log.warning("Could not encode DAG %s with MessagePack, storing it as JSON: %s", self.dag_id, e)
+            return None
+        if COMPRESS_SERIALIZED_DAGS:
+            return MSGPACK_ZLIB_MARKER + zlib.compress(packed)
+        return MSGPACK_MARKER + packed
+
+    @staticmethod
+    def _decode_data_compressed(data_compressed: bytes) -> dict:
+        if data_compressed.startswith(MSGPACK_MARKER):
+            return msgpack_loads(data_compressed[len(MSGPACK_MARKER) :])
+        if data_compressed.startswith(MSGPACK_ZLIB_MARKER):
+            return msgpack_loads(zlib.decompress(data_compressed[len(MSGPACK_ZLIB_MARKER) :]))
+        return json.loads(zlib.decompress(data_compressed))
+
     @classmethod
     @provide_session
     def write_dag(
@@ -208,7 +269,7 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                self.__data_cache = self._decode_data_compressed(self._data_compressed)
             else:
                 self.__data_cache = self._data
 
@@ -334,6 +395,36 @@ class SerializedDagModel(Base):
         """
         return session.query(cls.last_updated).filter(cls.dag_id == dag_id).scalar()
 
+    @classmethod
+    @provide_session
+    def get_changed_since(
+        cls, last_updated: datetime | None, session: Session = None
+    ) -> list[tuple[str, datetime, str]]:
+        """
+        Get the ``(dag_id, last_updated, dag_hash)`` of the Serialized DAGs updated since a given
+        date in serialized_dag table, or of all of them if no date is given.
+
+        Rows updated at exactly ``last_updated`` are included, so that rows committed later
+        with the same timestamp are not missed; callers should compare the ``dag_hash``.
+
+        :param last_updated: the date to look for updates from
+        :param session: ORM Session
+        """
+        query = session.query(cls.dag_id, cls.last_updated, cls.dag_hash)
+        if last_updated is not None:
+            query = query.filter(cls.last_updated >= last_updated)
+        return query.all()
+
+    @classmethod
+    @provide_session
+    def get_dag_ids(cls, session: Session = None) -> set[str]:
+        """
+        Get the ids of all the DAGs in serialized_dag table
+
+        :param session: ORM Session
+        """
+        return {dag_id for dag_id, in session.query(cls.dag_id)}
+
     @classmethod
     @provide_session
     def get_max_last_updated_datetime(cls, session: Session = None) -> datetime | None:
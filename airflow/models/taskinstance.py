@@ -125,6 +125,7 @@ from airflow.utils.sqlalchemy import (
     ExtendedJSON,
     UtcDateTime,
     tuple_in_condition,
+    tuple_in_temp_table,
     with_row_locks,
 )
 from airflow.utils.state import DagRunState, State, TaskInstanceState
@@ -145,6 +146,33 @@ if TYPE_CHECKING:
     from airflow.models.operator import Operator
 
 
+# The ways filter_for_tis groups task instances: the key columns shared by a group, and the key
+# column its task instances are selected from with IN.
+_FILTER_FOR_TIS_GROUPINGS: tuple[tuple[tuple[str, str, str], str], ...] = (
+    (("dag_id", "run_id", "map_index"), "task_id"),
+    (("dag_id", "task_id", "map_index"), "run_id"),
+    (("dag_id", "run_id", "task_id"), "map_index"),
+)
+# Beyond this many groups, a row-value IN is cheaper to plan than an OR of the groups.
+_FILTER_FOR_TIS_MAX_GROUPS = 32
+
+
+def _group_tis(
+    tis: list[TaskInstance | TaskInstanceKey], group_columns: tuple[str, str, str], in_column: str
+) -> dict[tuple[Any, ...], list[Any]] | None:
+    """Group task instances sharing ``group_columns``, or None if there are too many groups."""
+    groups: dict[tuple[Any, ...], list[Any]] = {}
+    for ti in tis:
+        key = tuple(getattr(ti, column) for column in group_columns)
+        values = groups.get(key)
+        if values is None:
+            if len(groups) == _FILTER_FOR_TIS_MAX_GROUPS:
+                return None
+            values = groups[key] = []
+        values.append(getattr(ti, in_column))
+    return groups
+
+
 @contextlib.contextmanager
 def set_current_context(context: Context) -> Generator[Context, None, None]:
     """
@@ -2499,34 +2527,30 @@ class TaskInstance(Base, LoggingMixin):
         if not tis:
             return None
 
-        first = tis[0]
-
-        dag_id = first.dag_id
-        run_id = first.run_id
-        map_index = first.map_index
-        first_task_id = first.task_id
-        # Common path optimisations: when all TIs are for the same dag_id and run_id, or same dag_id
-        # and task_id -- this can be over 150x faster for huge numbers of TIs (20k+)
-        if all(t.dag_id == dag_id and t.run_id == run_id and t.map_index == map_index for t in tis):
-            return and_(
-                TaskInstance.dag_id == dag_id,
-                TaskInstance.run_id == run_id,
-                TaskInstance.map_index == map_index,
-                TaskInstance.task_id.in_(t.task_id for t in tis),
-            )
-        if all(t.dag_id == dag_id and t.task_id == first_task_id and t.map_index == map_index for t in tis):
-            return and_(
-                TaskInstance.dag_id == dag_id,
-                TaskInstance.run_id.in_(t.run_id for t in tis),
-                TaskInstance.map_index == map_index,
-                TaskInstance.task_id == first_task_id,
-            )
-        if all(t.dag_id == dag_id and t.run_id == run_id and t.task_id == first_task_id for t in tis):
-            return and_(
-                TaskInstance.dag_id == dag_id,
-                TaskInstance.run_id == run_id,
-                TaskInstance.map_index.in_(t.map_index for t in tis),
-                TaskInstance.task_id == first_task_id,
+        # Common path optimisations: when all TIs share three of the four key columns, e.g. they are
+        # for the same dag_id and run_id, select them with an IN on the fourth -- this can be over 150x
+        # faster for huge numbers of TIs (20k+). When they fall into a few such groups, OR the groups.
+        best_groups: dict[tuple[Any, ...], list[Any]] | None = None
+        best_grouping = _FILTER_FOR_TIS_GROUPINGS[0]
+        for grouping in _FILTER_FOR_TIS_GROUPINGS:
+            groups = _group_tis(tis, *grouping)
+            if groups is not None and (best_groups is None or len(groups) < len(best_groups)):
+                best_groups, best_grouping = groups, grouping
+                if len(groups) == 1:
+                    break
+        if best_groups is not None:
+            group_columns, in_column = best_grouping
+            return or_(
+                *(
+                    and_(
+                        *(
+                            getattr(TaskInstance, column) == value
+                            for column, value in zip(group_columns, key)
+                        ),
+                        getattr(TaskInstance, in_column).in_(values),
+                    )
+                    for key, values in best_groups.items()
+                )
             )
 
         return tuple_in_condition(
@@ -2534,6 +2558,32 @@ class TaskInstance(Base, LoggingMixin):
             (ti.key.primary for ti in tis),
         )
 
+    @staticmethod
+    @contextlib.contextmanager
+    def filter_for_many_tis(
+        tis: Iterable[TaskInstance | TaskInstanceKey], *, session: Session
+    ) -> Generator[ColumnOperators | None, None, None]:
+        """
+        Returns SQLAlchemy filter to query selected task instances, usable inside the context.
+
+        When there are at least ``[database] filter_temp_table_threshold`` task instances that
+        :meth:`filter_for_tis` cannot group, their keys are written to a temporary table the filter
+        is matched against, so the size of the query does not grow with the number of task instances.
+        """
+        tis = list(tis)
+        threshold = conf.getint('database', 'filter_temp_table_threshold', fallback=5000)
+        if not 0 < threshold <= len(tis) or any(
+            _group_tis(tis, *grouping) is not None for grouping in _FILTER_FOR_TIS_GROUPINGS
+        ):
+            yield TaskInstance.filter_for_tis(tis)
+            return
+        with tuple_in_temp_table(
+            (TaskInstance.dag_id, TaskInstance.task_id, TaskInstance.run_id, TaskInstance.map_index),
+            (ti.key.primary for ti in tis),
+            session=session,
+        ) as condition:
+            yield condition
+
     @classmethod
     def ti_selector_condition(cls, vals: Collection[str | tuple[str, int]]) -> ColumnOperators:
         """
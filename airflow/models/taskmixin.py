@@ -199,6 +199,9 @@ class DAGNode(DependencyMixin, metaclass=ABCMeta):
             # If this task does not yet have a dag, add it to the same dag as the other task.
             self.dag = dag
 
+        # Any precomputed topology no longer matches the DAG once dependencies change.
+        dag._topology_index = None
+
         def add_only_new(obj, item_set: set[str], item: str) -> None:
             """Adds only new items to item set"""
             if item in item_set:
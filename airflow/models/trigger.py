@@ -20,12 +20,13 @@ import datetime
 from traceback import format_exception
 from typing import Any, Iterable
 
-from sqlalchemy import Column, Integer, String, func, or_
+from sqlalchemy import Column, Integer, String, bindparam, func, or_
 from sqlalchemy.orm import relationship
 
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
-from airflow.triggers.base import BaseTrigger
+from airflow.stats import Stats
+from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.utils import timezone
 from airflow.utils.retries import run_with_db_retries
 from airflow.utils.session import provide_session
@@ -122,17 +123,75 @@ class Trigger(Base):
         Takes an event from an instance of itself, and triggers all dependent
         tasks to resume.
         """
-        for task_instance in session.query(TaskInstance).filter(
-            TaskInstance.trigger_id == trigger_id, TaskInstance.state == State.DEFERRED
-        ):
+        cls.submit_events([(trigger_id, event)], session=session)
+
+    @classmethod
+    @provide_session
+    def submit_events(cls, events: Iterable[tuple[int, TriggerEvent]], session=None) -> None:
+        """
+        Takes events from many triggers, and triggers all their dependent
+        tasks to resume.
+
+        The deferred task instances of all the triggers are found with one
+        query and scheduled with one batched UPDATE. When a trigger sent
+        several events, its tasks resume with the first one, as they would
+        with one submit_event call per event.
+        """
+        payloads: dict[int, Any] = {}
+        for trigger_id, event in events:
+            payloads.setdefault(trigger_id, event.payload)
+        if not payloads:
+            return
+        deferred = (
+            session.query(
+                TaskInstance.dag_id,
+                TaskInstance.task_id,
+                TaskInstance.run_id,
+                TaskInstance.map_index,
+                TaskInstance.trigger_id,
+                TaskInstance.next_kwargs,
+                cls.created_date,
+            )
+            .join(cls, cls.id == TaskInstance.trigger_id)
+            .filter(TaskInstance.trigger_id.in_(payloads), TaskInstance.state == State.DEFERRED)
+            .all()
+        )
+        if not deferred:
+            return
+        now = timezone.utcnow()
+        updates = []
+        created_dates = {}
+        for row in deferred:
             # Add the event's payload into the kwargs for the task
-            next_kwargs = task_instance.next_kwargs or {}
-            next_kwargs["event"] = event.payload
-            task_instance.next_kwargs = next_kwargs
-            # Remove ourselves as its trigger
-            task_instance.trigger_id = None
-            # Finally, mark it as scheduled so it gets re-queued
-            task_instance.state = State.SCHEDULED
+            next_kwargs = dict(row.next_kwargs or {})
+            next_kwargs["event"] = payloads[row.trigger_id]
+            updates.append(
+                {
+                    "b_dag_id": row.dag_id,
+                    "b_task_id": row.task_id,
+                    "b_run_id": row.run_id,
+                    "b_map_index": row.map_index,
+                    "b_next_kwargs": next_kwargs,
+                }
+            )
+            created_dates[row.trigger_id] = row.created_date
+        table = TaskInstance.__table__
+        session.execute(
+            table.update().where(
+                table.c.dag_id == bindparam("b_dag_id"),
+                table.c.task_id == bindparam("b_task_id"),
+                table.c.run_id == bindparam("b_run_id"),
+                table.c.map_index == bindparam("b_map_index"),
+                table.c.state == State.DEFERRED,
+            )
+            # Remove ourselves as their trigger, and mark them as scheduled so they get re-queued
+            .values(next_kwargs=bindparam("b_next_kwargs"), trigger_id=None, state=State.SCHEDULED),
+            updates,
+        )
+        for created_date in created_dates.values():
+            # The trigger was created when its task instances deferred
+            if created_date is not None:
+                Stats.timing('triggers.defer_to_resume', now - created_date)
 
     @classmethod
     @provide_session
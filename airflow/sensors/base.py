@@ -22,7 +22,7 @@ import functools
 import hashlib
 import time
 from datetime import timedelta
-from typing import Any, Callable, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 from airflow import settings
 from airflow.configuration import conf
@@ -39,6 +39,9 @@ from airflow.ti_deps.deps.ready_to_reschedule import ReadyToRescheduleDep
 from airflow.utils import timezone
 from airflow.utils.context import Context
 
+if TYPE_CHECKING:
+    from airflow.triggers.poke import PokeTrigger
+
 # We need to keep the import here because GCSToLocalFilesystemOperator released in
 # Google Provider before 3.0.0 imported apply_defaults from here.
 # See  https://github.com/apache/airflow/issues/16035
@@ -236,6 +239,25 @@ class BaseSensorOperator(BaseOperator, SkipMixin):
         self.log.info("new %s interval is %s", self.mode, new_interval)
         return new_interval
 
+    def defer_to_poke_trigger(self, trigger_class: type[PokeTrigger], **kwargs) -> None:
+        """
+        Defers the rest of the wait to a trigger of ``trigger_class``, which pokes with
+        the interval and backoff of this sensor, and resumes in ``execute_complete``.
+
+        The trigger times out ``timeout`` seconds after deferring; a sensor timing out
+        while deferred fails, even with ``soft_fail``.
+
+        :param trigger_class: The PokeTrigger subclass to defer to.
+        :param kwargs: The arguments of the trigger's own condition.
+        """
+        trigger = trigger_class(
+            poke_interval=self.poke_interval,
+            backoff_factor=2.0 if self.exponential_backoff else 1.0,
+            max_poke_interval=self.timeout,
+            **kwargs,
+        )
+        self.defer(trigger=trigger, method_name="execute_complete", timeout=timedelta(seconds=self.timeout))
+
     def prepare_for_execution(self) -> BaseOperator:
         task = super().prepare_for_execution()
         # Sensors in `poke` mode can block execution of DAGs when running
@@ -20,7 +20,7 @@ from __future__ import annotations
 import datetime
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable
+from typing import TYPE_CHECKING, Any, Callable, Collection, Iterable, NoReturn
 
 import attr
 from sqlalchemy import func
@@ -33,13 +33,16 @@ from airflow.models.dagrun import DagRun
 from airflow.models.taskinstance import TaskInstance
 from airflow.operators.empty import EmptyOperator
 from airflow.sensors.base import BaseSensorOperator
+from airflow.triggers.external_task import ExternalTaskTrigger
 from airflow.utils.helpers import build_airflow_url_with_query
-from airflow.utils.session import provide_session
+from airflow.utils.session import create_session, provide_session
 from airflow.utils.state import State
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Query
 
+    from airflow.utils.context import Context
+
 
 class ExternalDagLink(BaseOperatorLink):
     """
@@ -225,35 +228,39 @@ class ExternalTaskSensor(BaseSensorOperator):
             count_failed = self.get_count(dttm_filter, session, self.failed_states)
 
         if count_failed == len(dttm_filter):
-            if self.external_task_ids:
-                if self.soft_fail:
-                    raise AirflowSkipException(
-                        f'Some of the external tasks {self.external_task_ids} '
-                        f'in DAG {self.external_dag_id} failed. Skipping due to soft_fail.'
-                    )
-                raise AirflowException(
+            self._fail()
+
+        return count_allowed == len(dttm_filter)
+
+    def _fail(self) -> NoReturn:
+        """Raises for the external tasks, task group or DAG having reached the failed states."""
+        if self.external_task_ids:
+            if self.soft_fail:
+                raise AirflowSkipException(
                     f'Some of the external tasks {self.external_task_ids} '
-                    f'in DAG {self.external_dag_id} failed.'
+                    f'in DAG {self.external_dag_id} failed. Skipping due to soft_fail.'
                 )
-            elif self.external_task_group_id:
-                if self.soft_fail:
-                    raise AirflowSkipException(
-                        f"The external task_group '{self.external_task_group_id}' "
-                        f"in DAG '{self.external_dag_id}' failed. Skipping due to soft_fail."
-                    )
-                raise AirflowException(
+            raise AirflowException(
+                f'Some of the external tasks {self.external_task_ids} '
+                f'in DAG {self.external_dag_id} failed.'
+            )
+        elif self.external_task_group_id:
+            if self.soft_fail:
+                raise AirflowSkipException(
                     f"The external task_group '{self.external_task_group_id}' "
-                    f"in DAG '{self.external_dag_id}' failed."
+                    f"in DAG '{self.external_dag_id}' failed. Skipping due to soft_fail."
                 )
+            raise AirflowException(
+                f"The external task_group '{self.external_task_group_id}' "
+                f"in DAG '{self.external_dag_id}' failed."
+            )
 
-            else:
-                if self.soft_fail:
-                    raise AirflowSkipException(
-                        f'The external DAG {self.external_dag_id} failed. Skipping due to soft_fail.'
-                    )
-                raise AirflowException(f'The external DAG {self.external_dag_id} failed.')
-
-        return count_allowed == len(dttm_filter)
+        else:
+            if self.soft_fail:
+                raise AirflowSkipException(
+                    f'The external DAG {self.external_dag_id} failed. Skipping due to soft_fail.'
+                )
+            raise AirflowException(f'The external DAG {self.external_dag_id} failed.')
 
     def _check_for_existence(self, session) -> None:
         dag_to_wait = DagModel.get_current(self.external_dag_id, session)
@@ -354,6 +361,41 @@ class ExternalTaskSensor(BaseSensorOperator):
         return kwargs_callable(logical_date, **kwargs)
 
 
+class ExternalTaskSensorAsync(ExternalTaskSensor):
+    """
+    Waits for a different DAG, a task group, or a task in a different DAG to complete for a
+    specific logical date, deferring itself to avoid taking up a worker slot while it is waiting.
+
+    It is a drop-in replacement for ExternalTaskSensor, poking once before deferring
+    to an ExternalTaskTrigger that pokes with the sensor's ``poke_interval`` and
+    ``exponential_backoff``. The tasks of ``external_task_group_id`` are the ones in
+    the group when the sensor defers. A sensor timing out while deferred fails, even
+    with ``soft_fail``.
+    """
+
+    def execute(self, context: Context):
+        if self.poke(context):
+            return None
+        external_task_ids = self.external_task_ids
+        if self.external_task_group_id:
+            with create_session() as session:
+                external_task_ids = self.get_external_task_group_task_ids(session)
+        self.defer_to_poke_trigger(
+            ExternalTaskTrigger,
+            external_dag_id=self.external_dag_id,
+            execution_dates=self._get_dttm_filter(context),
+            external_task_ids=list(external_task_ids) if external_task_ids else None,
+            allowed_states=self.allowed_states,
+            failed_states=self.failed_states,
+        )
+
+    def execute_complete(self, context, event=None):
+        """Callback for when the trigger fires - fails if the external tasks or DAG failed."""
+        if event["status"] == "failed":
+            self._fail()
+        return None
+
+
 class ExternalTaskMarker(EmptyOperator):
     """
     Use this operator to indicate that a task on a different DAG depends on this task.
@@ -24,6 +24,7 @@ from typing import Sequence
 
 from airflow.hooks.filesystem import FSHook
 from airflow.sensors.base import BaseSensorOperator
+from airflow.triggers.file import FileTrigger
 from airflow.utils.context import Context
 
 
@@ -67,3 +68,33 @@ class FileSensor(BaseSensorOperator):
                 if len(files) > 0:
                     return True
         return False
+
+
+class FileSensorAsync(FileSensor):
+    """
+    Waits for a file or folder to land in a filesystem, deferring itself to
+    avoid taking up a worker slot while it is waiting.
+
+    It is a drop-in replacement for FileSensor, poking once before deferring
+    to a FileTrigger that pokes with the sensor's ``poke_interval`` and
+    ``exponential_backoff``. A sensor timing out while deferred fails, even
+    with ``soft_fail``.
+
+    :param fs_conn_id: reference to the File (path)
+        connection id
+    :param filepath: File or folder name (relative to
+        the base path set within the connection), can be a glob.
+    :param recursive: when set to ``True``, enables recursive directory matching behavior of
+        ``**`` in glob filepath parameter. Defaults to ``False``.
+    """
+
+    def execute(self, context: Context):
+        if self.poke(context):
+            return None
+        full_path = os.path.join(FSHook(self.fs_conn_id).get_path(), self.filepath)
+        self.defer_to_poke_trigger(FileTrigger, filepath=full_path, recursive=self.recursive)
+
+    def execute_complete(self, context, event=None):
+        """Callback for when the trigger fires - returns immediately."""
+        self.log.info('Found File %s', event)
+        return None
@@ -42,3 +42,47 @@ def serialize_template_field(template_field: Any) -> str | dict | list | int | f
         return str(template_field)
     else:
         return template_field
+
+
+def _json_key(key: Any) -> str:
+    # The same conversion json.dumps does for the keys of dicts
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, float):
+        return repr(key)
+    return str(key)
+
+
+def _with_json_keys(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {
+            key if isinstance(key, str) else _json_key(key): _with_json_keys(value)
+            for key, value in obj.items()
+        }
+    if isinstance(obj, (list, tuple)):
+        return [_with_json_keys(value) for value in obj]
+    return obj
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """
+    Return the MessagePack binary of a JSON-serializable object.
+
+    The keys of its dicts are turned into strings as ``json.dumps`` does, so that the object
+    loads back as it would from JSON.
+    """
+    import msgpack
+
+    return msgpack.packb(_with_json_keys(obj), use_bin_type=True)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """Return the object of a MessagePack binary written by ``msgpack_dumps``."""
+    import msgpack
+
+    # Rows written before keys were turned into strings may have other keys
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
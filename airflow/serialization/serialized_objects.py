@@ -20,7 +20,9 @@ from __future__ import annotations
 import collections.abc
 import datetime
 import enum
+import functools
 import logging
+import threading
 import warnings
 import weakref
 from dataclasses import dataclass
@@ -48,8 +50,9 @@ from airflow.models.taskmixin import DAGNode
 from airflow.models.xcom_arg import XComArg, deserialize_xcom_arg, serialize_xcom_arg
 from airflow.providers_manager import ProvidersManager
 from airflow.serialization.enums import DagAttributeTypes as DAT, Encoding
-from airflow.serialization.helpers import serialize_template_field
+from airflow.serialization.helpers import msgpack_dumps, msgpack_loads, serialize_template_field
 from airflow.serialization.json_schema import Validator, load_dag_schema
+from airflow.serialization.topology import DagTopologyIndex
 from airflow.settings import DAGS_FOLDER, json
 from airflow.timetables.base import Timetable
 from airflow.utils.code_utils import get_python_source
@@ -295,6 +298,14 @@ class BaseSerialization:
         """Stringifies DAGs and operators contained by var and returns a JSON string of var."""
         return json.dumps(cls.to_dict(var), ensure_ascii=True)
 
+    @classmethod
+    def to_msgpack(cls, var: DAG | BaseOperator | dict | list | set | tuple) -> bytes:
+        """Stringifies DAGs and operators contained by var and returns a MessagePack binary of var."""
+        try:
+            return msgpack_dumps(cls.to_dict(var))
+        except (TypeError, OverflowError, ValueError) as e:
+            raise SerializationError(f'Failed to encode {var!r} with MessagePack: {e}')
+
     @classmethod
     def to_dict(cls, var: DAG | BaseOperator | dict | list | set | tuple) -> dict:
         """Stringifies DAGs and operators contained by var and returns a dict of var."""
@@ -307,6 +318,11 @@ class BaseSerialization:
         """Deserializes json_str and reconstructs all DAGs and operators it contains."""
         return cls.from_dict(json.loads(serialized_obj))
 
+    @classmethod
+    def from_msgpack(cls, serialized_obj: bytes) -> BaseSerialization | dict | list | set | tuple:
+        """Deserializes a MessagePack binary and reconstructs all DAGs and operators it contains."""
+        return cls.from_dict(msgpack_loads(serialized_obj))
+
     @classmethod
     def from_dict(cls, serialized_obj: dict[Encoding, Any]) -> BaseSerialization | dict | list | set | tuple:
         """Deserializes a python dict stored with type decorators and
@@ -652,6 +668,52 @@ class DependencyDetector:
             )
 
 
+class _DeferredField:
+    """
+    Operator attribute that is only deserialized the first time it is read.
+
+    Lazily deserialized operators keep the encoded value of these attributes in
+    ``_deferred_fields``; the value is decoded and stored on first access. Assigning
+    the attribute drops the pending encoded value.
+    """
+
+    # Guards decoding, so that threads sharing an operator all see the same decoded value.
+    # Reentrant, since decoding ``params`` reads the attribute again.
+    _lock = threading.RLock()
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.default = getattr(BaseOperator, name, None)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        deferred = instance.__dict__.get("_deferred_fields")
+        if deferred and self.name in deferred:
+            with self._lock:
+                decode = deferred.get(self.name)
+                # None while this thread is decoding it, the value from before is returned then
+                if decode is not None:
+                    deferred[self.name] = None
+                    try:
+                        instance.__dict__[self.name] = decode()
+                    except BaseException:
+                        deferred[self.name] = decode
+                        raise
+                    del deferred[self.name]
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            return self.default
+
+    def __set__(self, instance, value):
+        with self._lock:
+            instance.__dict__[self.name] = value
+            deferred = instance.__dict__.get("_deferred_fields")
+            if deferred:
+                deferred.pop(self.name, None)
+
+
 class SerializedBaseOperator(BaseOperator, BaseSerialization):
     """A JSON serializable representation of operator.
 
@@ -661,12 +723,25 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
 
     _decorated_fields = {'executor_config'}
 
+    _lazy_fields = frozenset(
+        {"params", "executor_config", "resources", "inlets", "outlets", "_operator_extra_links"}
+    )
+
     _CONSTRUCTOR_PARAMS = {
         k: v.default
         for k, v in signature(BaseOperator.__init__).parameters.items()
         if v.default is not v.empty
     }
 
+    # Attributes the scheduler does not need to make scheduling decisions, which are
+    # only deserialized on first access when operators are loaded lazily.
+    params = _DeferredField()
+    executor_config = _DeferredField()
+    resources = _DeferredField()
+    inlets = _DeferredField()
+    outlets = _DeferredField()
+    operator_extra_links = _DeferredField()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         # task_type is used by UI to display the correct class type, because UI only
@@ -679,6 +754,19 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         self.template_fields = BaseOperator.template_fields
         self.operator_extra_links = BaseOperator.operator_extra_links
 
+    def __deepcopy__(self, memo):
+        self._load_deferred_fields()
+        return super().__deepcopy__(memo)
+
+    def __getstate__(self):
+        self._load_deferred_fields()
+        return super().__getstate__()
+
+    def _load_deferred_fields(self) -> None:
+        """Deserialize all the attributes that are still pending from a lazy load."""
+        for name in list(self.__dict__.get("_deferred_fields", ())):
+            getattr(self, name)
+
     @property
     def task_type(self) -> str:
         # Overwrites task_type of BaseOperator to use _task_type instead of
@@ -789,7 +877,7 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         return sorted(deps)
 
     @classmethod
-    def populate_operator(cls, op: Operator, encoded_op: dict[str, Any]) -> None:
+    def populate_operator(cls, op: Operator, encoded_op: dict[str, Any], *, lazy: bool = False) -> None:
         if "label" not in encoded_op:
             # Handle deserialization of old data before the introduction of TaskGroup
             encoded_op["label"] = encoded_op["task_id"]
@@ -824,6 +912,11 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
             if op_extra_links_from_plugin and "_operator_extra_links" not in encoded_op:
                 setattr(op, "operator_extra_links", list(op_extra_links_from_plugin.values()))
 
+        if lazy and isinstance(op, SerializedBaseOperator):
+            op._deferred_fields = {}
+        else:
+            lazy = False
+
         for k, v in encoded_op.items():
             # Todo: TODO: Remove in Airflow 3.0 when dummy operator is removed
             if k == "_is_dummy":
@@ -838,48 +931,29 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
             if k == "label":
                 # Label shouldn't be set anymore --  it's computed from task_id now
                 continue
-            elif k == "downstream_task_ids":
-                v = set(v)
-            elif k == "subdag":
-                v = SerializedDAG.deserialize_dag(v)
-            elif k in {"retry_delay", "execution_timeout", "sla", "max_retry_delay"}:
-                v = cls._deserialize_timedelta(v)
-            elif k in encoded_op["template_fields"]:
-                pass
-            elif k == "resources":
-                v = Resources.from_dict(v)
-            elif k.endswith("_date"):
-                v = cls._deserialize_datetime(v)
-            elif k == "_operator_extra_links":
-                if cls._load_operator_extra_links:
-                    op_predefined_extra_links = cls._deserialize_operator_extra_links(v)
-
-                    # If OperatorLinks with the same name exists, Links via Plugin have higher precedence
-                    op_predefined_extra_links.update(op_extra_links_from_plugin)
-                else:
-                    op_predefined_extra_links = {}
-
-                v = list(op_predefined_extra_links.values())
-                k = "operator_extra_links"
-
-            elif k == "deps":
-                v = cls._deserialize_deps(v)
-            elif k == "params":
-                v = cls._deserialize_params_dict(v)
-                if op.params:  # Merge existing params if needed.
-                    v, new = op.params, v
-                    v.update(new)
-            elif k == "partial_kwargs":
-                v = {arg: cls.deserialize(value) for arg, value in v.items()}
-            elif k in {"expand_input", "op_kwargs_expand_input"}:
-                v = _ExpandInputRef(v["type"], cls.deserialize(v["value"]))
-            elif k in cls._decorated_fields or k not in op.get_serialized_fields():
-                v = cls.deserialize(v)
-            elif k in ("outlets", "inlets"):
-                v = cls.deserialize(v)
 
-            # else use v as it is
+            if lazy and k in cls._lazy_fields:
+                name = "operator_extra_links" if k == "_operator_extra_links" else k
+                # Only what decoding this value needs is kept, as it is at deserialization time
+                op._deferred_fields[name] = functools.partial(
+                    cls._deserialize_deferred_field,
+                    op,
+                    k,
+                    v,
+                    encoded_op["template_fields"],
+                    op_extra_links_from_plugin,
+                    cls._load_operator_extra_links,
+                )
+                continue
 
+            k, v = cls._deserialize_operator_field(
+                op,
+                k,
+                v,
+                encoded_op["template_fields"],
+                op_extra_links_from_plugin,
+                cls._load_operator_extra_links,
+            )
             setattr(op, k, v)
 
         for k in op.get_serialized_fields() - encoded_op.keys() - cls._CONSTRUCTOR_PARAMS.keys():
@@ -897,8 +971,74 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         setattr(op, "_is_empty", bool(encoded_op.get("_is_empty", False)))
 
     @classmethod
-    def deserialize_operator(cls, encoded_op: dict[str, Any]) -> Operator:
-        """Deserializes an operator from a JSON object."""
+    def _deserialize_operator_field(
+        cls,
+        op: Operator,
+        k: str,
+        v: Any,
+        template_fields: Collection[str],
+        op_extra_links_from_plugin: dict[str, Any],
+        load_operator_extra_links: bool,
+    ) -> tuple[str, Any]:
+        """Deserializes a single operator attribute, returning the attribute name and value."""
+        if k == "downstream_task_ids":
+            v = set(v)
+        elif k == "subdag":
+            v = SerializedDAG.deserialize_dag(v)
+        elif k in {"retry_delay", "execution_timeout", "sla", "max_retry_delay"}:
+            v = cls._deserialize_timedelta(v)
+        elif k in template_fields:
+            pass
+        elif k == "resources":
+            v = Resources.from_dict(v)
+        elif k.endswith("_date"):
+            v = cls._deserialize_datetime(v)
+        elif k == "_operator_extra_links":
+            if load_operator_extra_links:
+                op_predefined_extra_links = cls._deserialize_operator_extra_links(v)
+
+                # If OperatorLinks with the same name exists, Links via Plugin have higher precedence
+                op_predefined_extra_links.update(op_extra_links_from_plugin)
+            else:
+                op_predefined_extra_links = {}
+
+            v = list(op_predefined_extra_links.values())
+            k = "operator_extra_links"
+
+        elif k == "deps":
+            v = cls._deserialize_deps(v)
+        elif k == "params":
+            v = cls._deserialize_params_dict(v)
+            if op.params:  # Merge existing params if needed.
+                v, new = op.params, v
+                v.update(new)
+        elif k == "partial_kwargs":
+            v = {arg: cls.deserialize(value) for arg, value in v.items()}
+        elif k in {"expand_input", "op_kwargs_expand_input"}:
+            v = _ExpandInputRef(v["type"], cls.deserialize(v["value"]))
+        elif k in cls._decorated_fields or k not in op.get_serialized_fields():
+            v = cls.deserialize(v)
+        elif k in ("outlets", "inlets"):
+            v = cls.deserialize(v)
+
+        # else use v as it is
+
+        return k, v
+
+    @classmethod
+    def _deserialize_deferred_field(cls, *args) -> Any:
+        _, v = cls._deserialize_operator_field(*args)
+        return v
+
+    @classmethod
+    def deserialize_operator(cls, encoded_op: dict[str, Any], *, lazy: bool = False) -> Operator:
+        """
+        Deserializes an operator from a JSON object.
+
+        :param encoded_op: the serialized operator
+        :param lazy: whether attributes the scheduler does not need should only be
+            deserialized on first access. Mapped operators are always loaded eagerly.
+        """
         op: Operator
         if encoded_op.get("_is_mapped", False):
             # Most of these will be loaded later, these are just some stand-ins.
@@ -934,7 +1074,7 @@ class SerializedBaseOperator(BaseOperator, BaseSerialization):
         else:
             op = SerializedBaseOperator(task_id=encoded_op['task_id'])
 
-        cls.populate_operator(op, encoded_op)
+        cls.populate_operator(op, encoded_op, lazy=lazy)
         return op
 
     @classmethod
@@ -1173,7 +1313,11 @@ class SerializedDAG(DAG, BaseSerialization):
 
                 SerializedBaseOperator._load_operator_extra_links = cls._load_operator_extra_links
 
-                v = {task["task_id"]: SerializedBaseOperator.deserialize_operator(task) for task in v}
+                lazy = conf.getboolean('core', 'lazy_load_serialized_operators')
+                v = {
+                    task["task_id"]: SerializedBaseOperator.deserialize_operator(task, lazy=lazy)
+                    for task in v
+                }
                 k = "task_dict"
             elif k == "timezone":
                 v = cls._deserialize_timezone(v)
@@ -1246,6 +1390,8 @@ class SerializedDAG(DAG, BaseSerialization):
                 # Bypass set_upstream etc here - it does more than we want
                 dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
 
+        dag._topology_index = DagTopologyIndex(dag)
+
         return dag
 
     @classmethod
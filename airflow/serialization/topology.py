@@ -0,0 +1,165 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Precomputed task graph of a deserialized DAG"""
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from airflow.compat.functools import cached_property
+from airflow.exceptions import AirflowDagCycleException
+
+if TYPE_CHECKING:
+    from airflow.models.dag import DAG
+    from airflow.models.operator import Operator
+    from airflow.utils.task_group import TaskGroup
+
+
+class DagTopologyIndex:
+    """
+    Read-only index over the task graph of a DAG, set when a DAG is deserialized.
+
+    Tasks are numbered by their position in ``dag.task_dict``. Direct relatives are kept
+    in CSR form (an offsets array and a flat targets array per direction) and the
+    transitive closure of every task is kept as an integer bitset, so that roots, leaves,
+    topological order and flat relatives can be answered without walking the graph.
+
+    Each part is only built the first time it is needed, so DAGs that are deserialized
+    and never walked do not pay for it. The DAG drops the index as soon as tasks or
+    dependencies are added, so the parts built later still describe the same graph.
+
+    :param dag: the DAG to index
+    """
+
+    def __init__(self, dag: DAG) -> None:
+        self._dag = dag
+
+    @cached_property
+    def task_ids(self) -> tuple[str, ...]:
+        return tuple(self._dag.task_dict)
+
+    @cached_property
+    def index(self) -> dict[str, int]:
+        return {task_id: i for i, task_id in enumerate(self.task_ids)}
+
+    @cached_property
+    def _upstream(self) -> tuple[array, array]:
+        return self._build_csr(t.upstream_task_ids for t in self._dag.task_dict.values())
+
+    @cached_property
+    def _downstream(self) -> tuple[array, array]:
+        return self._build_csr(t.downstream_task_ids for t in self._dag.task_dict.values())
+
+    @cached_property
+    def roots(self) -> tuple[str, ...]:
+        offsets, _ = self._upstream
+        return tuple(task_id for i, task_id in enumerate(self.task_ids) if offsets[i] == offsets[i + 1])
+
+    @cached_property
+    def leaves(self) -> tuple[str, ...]:
+        offsets, _ = self._downstream
+        return tuple(task_id for i, task_id in enumerate(self.task_ids) if offsets[i] == offsets[i + 1])
+
+    @cached_property
+    def topological_order(self) -> array:
+        order: list[int] = []
+        if self._dag.task_group is not None:
+            # Keep the exact order produced by the task group aware sort, so callers see no
+            # difference between an indexed and a non-indexed DAG.
+            order = [self.index[task.task_id] for task in self._task_group_sort(self._dag.task_group)]
+        if len(order) != len(self.task_ids):
+            order = self._sort()
+        return array("l", order)
+
+    @cached_property
+    def _ancestors(self) -> list[int]:
+        ancestors = [0] * len(self.task_ids)
+        for i in self.topological_order:
+            bits = 0
+            for parent in self._targets(i, upstream=True):
+                bits |= (1 << parent) | ancestors[parent]
+            ancestors[i] = bits
+        return ancestors
+
+    @cached_property
+    def _descendants(self) -> list[int]:
+        descendants = [0] * len(self.task_ids)
+        for i in reversed(self.topological_order):
+            bits = 0
+            for child in self._targets(i, upstream=False):
+                bits |= (1 << child) | descendants[child]
+            descendants[i] = bits
+        return descendants
+
+    def _task_group_sort(self, group: TaskGroup) -> Iterator[Operator]:
+        """Tasks of the group in the order of ``DAG.topological_sort``, which reads it from this index."""
+        from airflow.utils.task_group import TaskGroup
+
+        for node in group.topological_sort():
+            if isinstance(node, TaskGroup):
+                yield from self._task_group_sort(node)
+            else:
+                yield node
+
+    def _build_csr(self, relatives: Iterable[Iterable[str]]) -> tuple[array, array]:
+        offsets = array("l", [0])
+        targets = array("l")
+        index = self.index
+        for task_relatives in relatives:
+            targets.extend(index[task_id] for task_id in task_relatives if task_id in index)
+            offsets.append(len(targets))
+        return offsets, targets
+
+    def _sort(self) -> list[int]:
+        """Kahn's algorithm over the CSR arrays, visiting ready tasks in ``task_dict`` order."""
+        offsets, _ = self._upstream
+        pending = [offsets[i + 1] - offsets[i] for i in range(len(self.task_ids))]
+        order = [i for i, count in enumerate(pending) if not count]
+        for i in order:
+            for child in self._targets(i, upstream=False):
+                pending[child] -= 1
+                if not pending[child]:
+                    order.append(child)
+        if len(order) != len(self.task_ids):
+            raise AirflowDagCycleException("There are cyclic dependencies between the tasks")
+        return order
+
+    def _targets(self, i: int, upstream: bool) -> array:
+        offsets, targets = self._upstream if upstream else self._downstream
+        return targets[offsets[i] : offsets[i + 1]]
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self.index
+
+    def get_flat_relative_ids(self, task_ids: Iterable[str], upstream: bool = False) -> set[str]:
+        """
+        Get the flat set of relative IDs of all the given tasks, upstream or downstream.
+
+        :param task_ids: the tasks to look up relatives for
+        :param upstream: whether to return ancestors instead of descendants
+        """
+        closure = self._ancestors if upstream else self._descendants
+        bits = 0
+        for task_id in task_ids:
+            bits |= closure[self.index[task_id]]
+        return self._decode(bits)
+
+    def _decode(self, bits: int) -> set[str]:
+        if not bits:
+            return set()
+        task_ids = self.task_ids
+        return {task_ids[i] for i, bit in enumerate(reversed(bin(bits)[2:])) if bit == "1"}
@@ -22,11 +22,13 @@ from typing import TYPE_CHECKING
 import attr
 from sqlalchemy.orm.session import Session
 
+from airflow.configuration import conf
 from airflow.utils.state import State
 
 if TYPE_CHECKING:
     from airflow.models.dagrun import DagRun
     from airflow.models.taskinstance import TaskInstance
+    from airflow.ti_deps.deps.trigger_rule_dep import UpstreamStatesIndex
 
 
 @attr.define
@@ -61,6 +63,8 @@ class DepContext:
         trigger rule
     :param ignore_ti_state: Ignore the task instance's previous failure/success
     :param finished_tis: A list of all the finished task instances of this run
+    :param use_upstream_states_index: Evaluate trigger rules from upstream state counts computed once
+        for the whole run, rather than counting the upstream states of each task instance separately
     """
 
     deps: set = attr.ib(factory=set)
@@ -73,10 +77,16 @@ class DepContext:
     ignore_ti_state: bool = False
     ignore_unmapped_tasks: bool = False
     finished_tis: list[TaskInstance] | None = None
+    use_upstream_states_index: bool = attr.ib(
+        factory=lambda: conf.getboolean('scheduler', 'use_upstream_states_index')
+    )
 
     have_changed_ti_states: bool = False
     """Have any of the TIs state's been changed as a result of evaluating dependencies"""
 
+    upstream_states_index: UpstreamStatesIndex | None = attr.ib(default=None, init=False)
+    """Upstream state counts of the run's tasks, built on first use by the trigger rule dependency"""
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         This method makes sure finished_tis is populated if it's currently None.
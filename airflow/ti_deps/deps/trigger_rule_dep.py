@@ -18,7 +18,7 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 from sqlalchemy import func
 
@@ -31,9 +31,85 @@ from airflow.utils.trigger_rule import TriggerRule as TR
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+    from airflow.models.dag import DAG
     from airflow.models.taskinstance import TaskInstance
 
 
+class UpstreamStatesIndex:
+    """
+    Upstream state counts of every task of a DagRun, computed in a single pass.
+
+    Counting the upstream states of one task instance at a time means going through all the finished
+    task instances of the run for every task instance evaluated. This index instead walks the finished
+    task instances once, adding each of them to the counters of its downstream tasks, so the counts of
+    any task can then be looked up directly.
+
+    :param dag: The DAG the run belongs to
+    :param run_id: The run id of the DagRun
+    :param finished_tis: All the finished task instances of the run
+    """
+
+    COUNTED_STATES = (State.SUCCESS, State.SKIPPED, State.FAILED, State.UPSTREAM_FAILED, State.REMOVED)
+
+    def __init__(self, dag: DAG, run_id: str, finished_tis: Sequence[TaskInstance]) -> None:
+        self.dag = dag
+        self.run_id = run_id
+        self.finished_tis = finished_tis
+        self.num_finished_tis = len(finished_tis)
+
+        task_dict = dag.task_dict
+        self._task_index = {task_id: i for i, task_id in enumerate(task_dict)}
+        # Downstream task indexes of every task, in task index order
+        downstream_indexes = [
+            [self._task_index[t] for t in task.downstream_task_ids if t in self._task_index]
+            for task in task_dict.values()
+        ]
+        num_tasks = len(task_dict)
+        # One counter per counted state (plus one for all finished states), indexed by task index
+        self._counters = [[0] * num_tasks for _ in range(len(self.COUNTED_STATES) + 1)]
+        state_positions = {state: i for i, state in enumerate(self.COUNTED_STATES)}
+        done = self._counters[-1]
+        for ti in finished_tis:
+            task_index = self._task_index.get(ti.task_id)
+            if task_index is None:
+                continue
+            counter = self._counters[state_positions[ti.state]] if ti.state in state_positions else None
+            for downstream_index in downstream_indexes[task_index]:
+                done[downstream_index] += 1
+                if counter is not None:
+                    counter[downstream_index] += 1
+
+        self._has_mapped_upstream: dict[str, bool] = {}
+
+    def is_valid_for(self, ti: TaskInstance, finished_tis: Sequence[TaskInstance]) -> bool:
+        """Whether the index was built for the DagRun of ``ti`` from the given finished task instances."""
+        return (
+            ti.task.dag is self.dag
+            and ti.run_id == self.run_id
+            and finished_tis is self.finished_tis
+            and len(finished_tis) == self.num_finished_tis
+        )
+
+    def get_counts(self, task_id: str) -> tuple[int, int, int, int, int, int]:
+        """
+        Return the upstream states of a task, in the same form as
+        ``TriggerRuleDep._get_states_count_upstream_ti``.
+        """
+        task_index = self._task_index[task_id]
+        success, skipped, failed, upstream_failed, removed, done = (c[task_index] for c in self._counters)
+        return success, skipped, failed, upstream_failed, removed, done
+
+    def has_mapped_upstream(self, task_id: str) -> bool:
+        """Whether any of the upstream tasks of a task is mapped."""
+        try:
+            return self._has_mapped_upstream[task_id]
+        except KeyError:
+            task_dict = self.dag.task_dict
+            has_mapped = any(task_dict[t].is_mapped for t in task_dict[task_id].upstream_task_ids)
+            self._has_mapped_upstream[task_id] = has_mapped
+            return has_mapped
+
+
 class TriggerRuleDep(BaseTIDep):
     """
     Determines if a task's upstream tasks are in a state that allows a given task instance
@@ -73,10 +149,22 @@ class TriggerRuleDep(BaseTIDep):
         if ti.task.trigger_rule == TR.ALWAYS:
             yield self._passing_status(reason="The task had a always trigger rule set.")
             return
-        # see if the task name is in the task upstream for our task
-        successes, skipped, failed, upstream_failed, removed, done = self._get_states_count_upstream_ti(
-            task=ti.task, finished_tis=dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
-        )
+        finished_tis = dep_context.ensure_finished_tis(ti.get_dagrun(session), session)
+        upstream = None
+        if dep_context.use_upstream_states_index and ti.task.dag:
+            index = dep_context.upstream_states_index
+            if index is None or not index.is_valid_for(ti, finished_tis):
+                index = dep_context.upstream_states_index = UpstreamStatesIndex(
+                    ti.task.dag, ti.run_id, finished_tis
+                )
+            successes, skipped, failed, upstream_failed, removed, done = index.get_counts(ti.task_id)
+            if not index.has_mapped_upstream(ti.task_id):
+                upstream = len(ti.task.upstream_task_ids)
+        else:
+            # see if the task name is in the task upstream for our task
+            successes, skipped, failed, upstream_failed, removed, done = self._get_states_count_upstream_ti(
+                task=ti.task, finished_tis=finished_tis
+            )
 
         yield from self._evaluate_trigger_rule(
             ti=ti,
@@ -88,6 +176,7 @@ class TriggerRuleDep(BaseTIDep):
             done=done,
             flag_upstream_failed=dep_context.flag_upstream_failed,
             dep_context=dep_context,
+            upstream=upstream,
             session=session,
         )
 
@@ -128,6 +217,7 @@ class TriggerRuleDep(BaseTIDep):
         done,
         flag_upstream_failed,
         dep_context: DepContext,
+        upstream: int | None = None,
         session: Session = NEW_SESSION,
     ):
         """
@@ -144,10 +234,12 @@ class TriggerRuleDep(BaseTIDep):
             the upstream_failed state creation while checking to see
             whether the task instance is runnable. It was the shortest
             path to add the feature
+        :param upstream: Number of upstream task instances, counted from the database if not given
         :param session: database session
         """
         task = ti.task
-        upstream = self._count_upstreams(ti, session=session)
+        if upstream is None:
+            upstream = self._count_upstreams(ti, session=session)
         trigger_rule = task.trigger_rule
         upstream_done = done >= upstream
         upstream_tasks_state = {
@@ -0,0 +1,104 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+from sqlalchemy import func
+
+from airflow.models.dagrun import DagRun
+from airflow.models.taskinstance import TaskInstance
+from airflow.triggers.poke import PokeTrigger
+from airflow.utils.session import create_session
+
+
+class ExternalTaskTrigger(PokeTrigger):
+    """
+    A trigger that fires once tasks, or a DAG, reach one of the given states
+    for all the given logical dates.
+
+    The event's payload is ``{"status": "success"}`` once all of them are in
+    ``allowed_states``, or ``{"status": "failed"}`` once all of them are in
+    ``failed_states``.
+
+    :param external_dag_id: The dag_id that contains the tasks to wait for.
+    :param execution_dates: The logical dates of the runs to wait for.
+    :param external_task_ids: The task_ids to wait for. If ``None`` (default
+        value) the trigger waits for the DAG runs.
+    :param allowed_states: Iterable of allowed states, default is ``['success']``
+    :param failed_states: Iterable of failed or dis-allowed states, default is ``None``
+    """
+
+    def __init__(
+        self,
+        *,
+        external_dag_id: str,
+        execution_dates: list[datetime.datetime],
+        external_task_ids: list[str] | None = None,
+        allowed_states: list[str] | None = None,
+        failed_states: list[str] | None = None,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.external_dag_id = external_dag_id
+        self.execution_dates = execution_dates
+        self.external_task_ids = external_task_ids
+        self.allowed_states = allowed_states or ["success"]
+        self.failed_states = failed_states or []
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (
+            "airflow.triggers.external_task.ExternalTaskTrigger",
+            {
+                "external_dag_id": self.external_dag_id,
+                "execution_dates": self.execution_dates,
+                "external_task_ids": self.external_task_ids,
+                "allowed_states": self.allowed_states,
+                "failed_states": self.failed_states,
+                **self.backoff_kwargs,
+            },
+        )
+
+    def poke(self) -> dict[str, str] | None:
+        with create_session() as session:
+            if self.failed_states and self.get_count(self.failed_states, session) == len(
+                self.execution_dates
+            ):
+                return {"status": "failed"}
+            if self.get_count(self.allowed_states, session) == len(self.execution_dates):
+                return {"status": "success"}
+        return None
+
+    def get_count(self, states: list[str], session) -> float:
+        """
+        Get the count of the DAG runs, or of the runs of all the tasks, in the
+        given states for the logical dates of the trigger.
+        """
+        if not self.execution_dates:
+            return 0
+        model = TaskInstance if self.external_task_ids else DagRun
+        query = session.query(func.count()).filter(
+            model.dag_id == self.external_dag_id,
+            model.state.in_(states),
+            model.execution_date.in_(self.execution_dates),
+        )
+        if not self.external_task_ids:
+            return query.scalar()
+        return query.filter(TaskInstance.task_id.in_(self.external_task_ids)).scalar() / len(
+            self.external_task_ids
+        )
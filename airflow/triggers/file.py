@@ -0,0 +1,57 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+from glob import glob
+from typing import Any
+
+from airflow.triggers.poke import PokeTrigger
+
+
+class FileTrigger(PokeTrigger):
+    """
+    A trigger that fires once a file or folder lands in a filesystem.
+
+    If the path given is a directory then this trigger will only fire if
+    any files exist inside it (either directly, or within a subdirectory).
+    The event's payload is the path of the file found.
+
+    :param filepath: File or folder name, can be a glob.
+    :param recursive: when set to ``True``, enables recursive directory matching behavior of
+        ``**`` in glob filepath parameter. Defaults to ``False``.
+    """
+
+    def __init__(self, filepath: str, recursive: bool = False, **kwargs):
+        super().__init__(**kwargs)
+        self.filepath = filepath
+        self.recursive = recursive
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return (
+            "airflow.triggers.file.FileTrigger",
+            {"filepath": self.filepath, "recursive": self.recursive, **self.backoff_kwargs},
+        )
+
+    def poke(self) -> str | None:
+        for path in glob(self.filepath, recursive=self.recursive):
+            if os.path.isfile(path):
+                return path
+            for root, _, files in os.walk(path):
+                if files:
+                    return os.path.join(root, files[0])
+        return None
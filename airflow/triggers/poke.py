@@ -0,0 +1,100 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import abc
+import asyncio
+from typing import Any
+
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+
+class PokeTrigger(BaseTrigger):
+    """
+    Base class for triggers that wait for a condition by poking for it, the
+    way sensors do, without taking up a worker slot.
+
+    The blocking ``poke`` is run in the default executor of the triggerer's
+    event loop, so that it does not hold up the other triggers. The trigger
+    waits ``poke_interval`` seconds after the first unsuccessful poke, and
+    that wait is multiplied by ``backoff_factor`` after every other one, up to
+    ``max_poke_interval`` seconds.
+
+    Subclasses implement ``poke`` and ``serialize``, passing the backoff
+    arguments on with ``backoff_kwargs``.
+
+    :param poke_interval: Time in seconds to wait after the first unsuccessful poke.
+    :param backoff_factor: Factor the wait grows by after every unsuccessful poke.
+    :param max_poke_interval: Time in seconds the wait does not grow beyond,
+        defaults to no limit.
+    """
+
+    def __init__(
+        self,
+        *,
+        poke_interval: float = 60,
+        backoff_factor: float = 1.0,
+        max_poke_interval: float | None = None,
+    ):
+        super().__init__()
+        if poke_interval < 0:
+            raise ValueError("The poke_interval must be a non-negative number")
+        if backoff_factor < 1:
+            raise ValueError("The backoff_factor must be at least 1")
+        self.poke_interval = poke_interval
+        self.backoff_factor = backoff_factor
+        self.max_poke_interval = max_poke_interval
+
+    @property
+    def backoff_kwargs(self) -> dict[str, Any]:
+        """The keyword arguments of the backoff, to serialize along with those of the subclass."""
+        return {
+            "poke_interval": self.poke_interval,
+            "backoff_factor": self.backoff_factor,
+            "max_poke_interval": self.max_poke_interval,
+        }
+
+    @abc.abstractmethod
+    def poke(self) -> Any:
+        """
+        Checks for the condition the trigger waits for. Called in a thread, it
+        may block.
+
+        :return: The (Airflow-JSON-encodable) payload of the event to fire once
+            the condition is met, or None to poke again later.
+        """
+        raise NotImplementedError("Poke triggers must implement poke()")
+
+    def next_poke_interval(self, interval: float) -> float:
+        """Returns the time to wait after the unsuccessful poke following a wait of ``interval``."""
+        interval *= self.backoff_factor
+        if self.max_poke_interval is not None:
+            interval = min(interval, self.max_poke_interval)
+        return interval
+
+    async def run(self):
+        """Pokes until the condition is met, backing off between unsuccessful pokes."""
+        loop = asyncio.get_running_loop()
+        interval = self.poke_interval
+        while True:
+            payload = await loop.run_in_executor(None, self.poke)
+            if payload is not None:
+                # Send our single event and then we're done
+                yield TriggerEvent(payload)
+                return
+            await asyncio.sleep(interval)
+            interval = self.next_poke_interval(interval)
@@ -18,11 +18,156 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-from typing import Any
+import math
+import weakref
+from typing import Any, Tuple
 
 from airflow.triggers.base import BaseTrigger, TriggerEvent
 from airflow.utils import timezone
 
+_Timer = Tuple[float, "asyncio.Future[None]"]
+
+
+class TimerWheel:
+    """
+    A hierarchical timer wheel that fires the timers of temporal triggers.
+
+    Rather than every trigger waking up regularly to check the time, each one
+    awaits a future registered here, and a single task per event loop wakes
+    up once every ``resolution`` seconds to resolve the futures of all the
+    timers that are due.
+
+    Timers are kept in ``levels`` wheels of ``slots`` slots, each level
+    spanning ``slots`` times as long as the one below it, and are cascaded
+    down a level as they come closer. Timers further away than the top level
+    can reach wait in an overflow list.
+    """
+
+    _wheels_by_loop: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __init__(self, resolution: float = 1.0, slots: int = 64, levels: int = 4):
+        self.resolution = resolution
+        self.slots = slots
+        self.levels = levels
+        self._wheels: list[list[list[_Timer]]] = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._overflow: list[_Timer] = []
+        # The last tick whose timers were fired
+        self._tick = self._floor_tick(timezone.utcnow().timestamp())
+        # The number of timers whose futures are not done yet
+        self._pending = 0
+        self._task: asyncio.Task | None = None
+
+    @classmethod
+    def for_running_loop(cls) -> TimerWheel:
+        """Returns the timer wheel of the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        wheel = cls._wheels_by_loop.get(loop)
+        if wheel is None:
+            wheel = cls._wheels_by_loop[loop] = cls()
+        return wheel
+
+    def __len__(self) -> int:
+        return self._pending
+
+    async def wait(self, moment: datetime.datetime) -> None:
+        """Waits until the given moment has passed."""
+        deadline = moment.timestamp()
+        now = timezone.utcnow().timestamp()
+        if deadline <= now:
+            return
+        if self._task is None:
+            # The wheel is empty while it is idle, so it can start again from now
+            self._tick = self._floor_tick(now)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._add((deadline, future))
+        self._pending += 1
+        # Cancelled futures are left in their slots and skipped when they are due
+        future.add_done_callback(self._discard)
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        await future
+
+    def _discard(self, future: asyncio.Future[None]) -> None:
+        self._pending -= 1
+
+    def _floor_tick(self, timestamp: float) -> int:
+        return math.floor(timestamp / self.resolution)
+
+    def _add(self, timer: _Timer) -> None:
+        # A timer is due once the tick it was rounded up to has passed
+        next_tick = self._tick + 1
+        tick = max(math.ceil(timer[0] / self.resolution), next_tick)
+        # Each level holds the timers due before the next tick has gone round it
+        delta = tick - next_tick
+        for level, wheel in enumerate(self._wheels):
+            if delta < self.slots ** (level + 1):
+                wheel[(tick // self.slots**level) % self.slots].append(timer)
+                return
+        self._overflow.append(timer)
+
+    def _drain(self) -> list[_Timer]:
+        timers = self._overflow
+        self._overflow = []
+        for wheel in self._wheels:
+            for slot in wheel:
+                timers.extend(slot)
+                slot.clear()
+        return timers
+
+    def _fire(self, timers: list[_Timer]) -> None:
+        for _, future in timers:
+            if not future.done():
+                future.set_result(None)
+
+    def advance(self, now: float) -> None:
+        """Fires all the timers due at the given timestamp."""
+        now_tick = self._floor_tick(now)
+        if now_tick == self._tick:
+            return
+        if now_tick < self._tick or now_tick - self._tick > self.slots**2:
+            # The clock went backwards, or jumped further forward than it is worth
+            # stepping through one tick at a time, so lay out all the timers again
+            timers = self._drain()
+            self._fire([timer for timer in timers if timer[0] <= now])
+            self._tick = now_tick
+            for timer in timers:
+                if timer[0] > now:
+                    self._add(timer)
+            return
+        for tick in range(self._tick + 1, now_tick + 1):
+            # Cascade the timers of the upper levels whose span starts at this tick,
+            # from the top down, so that they land in the slots fired below
+            self._tick = tick - 1
+            if tick % self.slots**self.levels == 0:
+                timers, self._overflow = self._overflow, []
+                for timer in timers:
+                    self._add(timer)
+            for level in range(self.levels - 1, 0, -1):
+                span = self.slots**level
+                if tick % span == 0:
+                    slot = self._wheels[level][(tick // span) % self.slots]
+                    timers = slot[:]
+                    slot.clear()
+                    for timer in timers:
+                        self._add(timer)
+            slot = self._wheels[0][tick % self.slots]
+            timers = slot[:]
+            slot.clear()
+            self._tick = tick
+            self._fire(timers)
+
+    async def _run(self) -> None:
+        try:
+            while self._pending:
+                now = timezone.utcnow().timestamp()
+                self.advance(now)
+                # Wake up right after the next tick, when its timers are due
+                await asyncio.sleep(self.resolution - now % self.resolution)
+            # Only cancelled timers are left
+            self._drain()
+        finally:
+            self._task = None
+
 
 class DateTimeTrigger(BaseTrigger):
     """
@@ -49,19 +194,14 @@ class DateTimeTrigger(BaseTrigger):
 
     async def run(self):
         """
-        Simple time delay loop until the relevant time is met.
+        Waits on the timer wheel of the event loop until the relevant time is met.
 
-        We do have a two-phase delay to save some cycles, but sleeping is so
-        cheap anyway that it's pretty loose. We also don't just sleep for
-        "the number of seconds until the time" in case the system clock changes
-        unexpectedly, or handles a DST change poorly.
+        The wheel checks the time every second for all the temporal triggers of
+        the loop, rather than just sleeping for "the number of seconds until the
+        time" in case the system clock changes unexpectedly, or handles a DST
+        change poorly.
         """
-        # Sleep an hour at a time while it's more than 2 hours away
-        while (self.moment - timezone.utcnow()).total_seconds() > 2 * 3600:
-            await asyncio.sleep(3600)
-        # Sleep a second at a time otherwise
-        while self.moment > timezone.utcnow():
-            await asyncio.sleep(1)
+        await TimerWheel.for_running_loop().wait(self.moment)
         # Send our single event and then we're done
         yield TriggerEvent(self.moment)
 
@@ -198,6 +198,34 @@ def open_maybe_zipped(fileloc, mode='r'):
         return open(fileloc, mode=mode)
 
 
+def _add_ignore_patterns(
+    patterns: list[_IgnoreRule],
+    base_dir: Path,
+    directory: Path,
+    ignore_file_name: str,
+    ignore_rule_type: type[_IgnoreRule],
+) -> list[_IgnoreRule]:
+    """Add the patterns of the ignore file in the directory, if any, to the patterns in effect."""
+    ignore_file_path = directory / ignore_file_name
+    if ignore_file_path.is_file():
+        with open(ignore_file_path) as ifile:
+            lines_no_comments = [re.sub(r"\s*#.*", "", line) for line in ifile.read().split("\n")]
+            # append new patterns and filter out "None" objects, which are invalid patterns
+            patterns += [
+                p
+                for p in [
+                    ignore_rule_type.compile(line, base_dir, ignore_file_path)
+                    for line in lines_no_comments
+                    if line
+                ]
+                if p is not None
+            ]
+            # evaluation order of patterns is important with negation
+            # so that later patterns can override earlier patterns
+            patterns = list(OrderedDict.fromkeys(patterns).keys())
+    return patterns
+
+
 def _find_path_from_directory(
     base_dir_path: str,
     ignore_file_name: str,
@@ -218,23 +246,9 @@ def _find_path_from_directory(
     for root, dirs, files in os.walk(base_dir_path, followlinks=True):
         patterns: list[_IgnoreRule] = patterns_by_dir.get(Path(root).resolve(), [])
 
-        ignore_file_path = Path(root) / ignore_file_name
-        if ignore_file_path.is_file():
-            with open(ignore_file_path) as ifile:
-                lines_no_comments = [re.sub(r"\s*#.*", "", line) for line in ifile.read().split("\n")]
-                # append new patterns and filter out "None" objects, which are invalid patterns
-                patterns += [
-                    p
-                    for p in [
-                        ignore_rule_type.compile(line, Path(base_dir_path), ignore_file_path)
-                        for line in lines_no_comments
-                        if line
-                    ]
-                    if p is not None
-                ]
-                # evaluation order of patterns is important with negation
-                # so that later patterns can override earlier patterns
-                patterns = list(OrderedDict.fromkeys(patterns).keys())
+        patterns = _add_ignore_patterns(
+            patterns, Path(base_dir_path), Path(root), ignore_file_name, ignore_rule_type
+        )
 
         dirs[:] = [subdir for subdir in dirs if not ignore_rule_type.match(Path(root) / subdir, patterns)]
 
@@ -257,6 +271,31 @@ def _find_path_from_directory(
             yield str(abs_file_path)
 
 
+def _is_path_ignored(
+    base_dir_path: str,
+    path: str,
+    ignore_file_name: str,
+    ignore_rule_type: type[_IgnoreRule],
+) -> bool:
+    """
+    Check whether the path would be left out by _find_path_from_directory, because of the ignore
+    files of the directories between the base path and the path.
+    """
+    base_dir = Path(base_dir_path)
+    try:
+        relative_parts = Path(path).relative_to(base_dir).parts
+    except ValueError:
+        return True
+    patterns: list[_IgnoreRule] = []
+    current = base_dir
+    for part in relative_parts:
+        patterns = _add_ignore_patterns(patterns, base_dir, current, ignore_file_name, ignore_rule_type)
+        current = current / part
+        if ignore_rule_type.match(current, patterns):
+            return True
+    return False
+
+
 def find_path_from_directory(
     base_dir_path: str,
     ignore_file_name: str,
@@ -317,22 +356,53 @@ def find_dag_file_paths(directory: str | pathlib.Path, safe_mode: bool) -> list[
     file_paths = []
 
     for file_path in find_path_from_directory(str(directory), ".airflowignore"):
-        try:
-            if not os.path.isfile(file_path):
-                continue
-            _, file_ext = os.path.splitext(os.path.split(file_path)[-1])
-            if file_ext != '.py' and not zipfile.is_zipfile(file_path):
-                continue
-            if not might_contain_dag(file_path, safe_mode):
-                continue
-
+        if _is_dag_file(file_path, safe_mode):
             file_paths.append(file_path)
-        except Exception:
-            log.exception("Error while examining %s", file_path)
 
     return file_paths
 
 
+def is_dag_file_path(
+    directory: str | pathlib.Path,
+    file_path: str,
+    safe_mode: bool = conf.getboolean('core', 'DAG_DISCOVERY_SAFE_MODE', fallback=True),
+) -> bool:
+    """
+    Check whether a single file would be found by find_dag_file_paths, without listing the directory.
+
+    :param directory: the DAG directory the file is in
+    :param file_path: the file to check
+    :param safe_mode: whether to use a heuristic to determine whether a file
+        contains Airflow DAG definitions
+    """
+    if os.path.basename(file_path) == ".airflowignore":
+        return False
+    ignore_file_syntax = conf.get_mandatory_value('core', 'DAG_IGNORE_FILE_SYNTAX', fallback="regexp")
+    ignore_rule_type: type[_IgnoreRule]
+    if ignore_file_syntax == "glob":
+        ignore_rule_type = _GlobIgnoreRule
+    elif ignore_file_syntax == "regexp" or not ignore_file_syntax:
+        ignore_rule_type = _RegexpIgnoreRule
+    else:
+        raise ValueError(f"Unsupported ignore_file_syntax: {ignore_file_syntax}")
+    if _is_path_ignored(str(directory), file_path, ".airflowignore", ignore_rule_type):
+        return False
+    return _is_dag_file(file_path, safe_mode)
+
+
+def _is_dag_file(file_path: str, safe_mode: bool) -> bool:
+    try:
+        if not os.path.isfile(file_path):
+            return False
+        _, file_ext = os.path.splitext(os.path.split(file_path)[-1])
+        if file_ext != '.py' and not zipfile.is_zipfile(file_path):
+            return False
+        return might_contain_dag(file_path, safe_mode)
+    except Exception:
+        log.exception("Error while examining %s", file_path)
+        return False
+
+
 COMMENT_PATTERN = re.compile(r"\s*#.*")
 
 
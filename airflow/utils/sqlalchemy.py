@@ -17,15 +17,31 @@
 # under the License.
 from __future__ import annotations
 
+import contextlib
 import copy
 import datetime
 import json
 import logging
-from typing import Any, Iterable
+import uuid
+from typing import Any, Iterable, Iterator
 
 import pendulum
 from dateutil import relativedelta
-from sqlalchemy import TIMESTAMP, PickleType, and_, event, false, nullsfirst, or_, true, tuple_
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    MetaData,
+    PickleType,
+    Table,
+    and_,
+    event,
+    exists,
+    false,
+    nullsfirst,
+    or_,
+    true,
+    tuple_,
+)
 from sqlalchemy.dialects import mssql, mysql
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm.session import Session
@@ -424,6 +440,45 @@ def tuple_in_condition(
     return or_(*clauses)
 
 
+@contextlib.contextmanager
+def tuple_in_temp_table(
+    columns: tuple[ColumnElement, ...],
+    collection: Iterable[Any],
+    *,
+    session: Session,
+) -> Iterator[ColumnOperators]:
+    """Generates a tuple-in-collection operator backed by a temporary table.
+
+    The collection is inserted into a temporary table created on the connection of the
+    session, and the generated ``EXISTS`` clause matches the columns against its rows.
+    Unlike ``tuple_in_condition``, the size of the statement does not grow with the
+    collection, so this keeps planning cheap and stays within the bind parameter limits
+    of the backends for very large collections. The operator can only be used inside the
+    context, after which the temporary table is dropped.
+
+    :meta private:
+    """
+    name = f"tmp_tuple_in_{uuid.uuid4().hex[:16]}"
+    if session.get_bind().dialect.name == "mssql":
+        # MSSQL has no TEMPORARY keyword, temporary tables are prefixed with a hash instead
+        table = Table(f"#{name}", MetaData(), *(Column(f"c{i}", c.type) for i, c in enumerate(columns)))
+    else:
+        table = Table(
+            name,
+            MetaData(),
+            *(Column(f"c{i}", c.type) for i, c in enumerate(columns)),
+            prefixes=["TEMPORARY"],
+        )
+    table.create(bind=session.connection())
+    rows = [{f"c{i}": v for i, v in enumerate(values)} for values in collection]
+    if rows:
+        session.execute(table.insert(), rows)
+    yield exists().where(*(c == t for c, t in zip(columns, table.c)))
+    # Not dropped when the context exits with an error, as the transaction may be aborted. The
+    # table then goes away with the transaction or the connection, and its name is never reused.
+    table.drop(bind=session.connection())
+
+
 def tuple_not_in_condition(
     columns: tuple[ColumnElement, ...],
     collection: Iterable[Any],
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import os
 
+from airflow.configuration import conf
 from airflow.models import DagBag
 from airflow.settings import DAGS_FOLDER
 
@@ -30,4 +31,8 @@ def init_dagbag(app):
     if os.environ.get('SKIP_DAGS_PARSING') == 'True':
         app.dag_bag = DagBag(os.devnull, include_examples=False)
     else:
-        app.dag_bag = DagBag(DAGS_FOLDER, read_dags_from_db=True)
+        app.dag_bag = DagBag(
+            DAGS_FOLDER,
+            read_dags_from_db=True,
+            incremental_db_refresh=conf.getboolean('core', 'incremental_serialized_dag_refresh'),
+        )
@@ -300,6 +300,9 @@ ldap = [
     'python-ldap',
 ]
 leveldb = ['plyvel; platform_machine != "aarch64"']
+msgpack = [
+    'msgpack>=1.0.0',
+]
 pandas = [
     'pandas>=0.17.1',
 ]
@@ -469,6 +472,7 @@ CORE_EXTRAS_DEPENDENCIES: dict[str, list[str]] = {
     'kerberos': kerberos,
     'ldap': ldap,
     'leveldb': leveldb,
+    'msgpack': msgpack,
     'pandas': pandas,
     'password': password,
     'rabbitmq': rabbitmq,
@@ -0,0 +1,74 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import pytest
+
+from airflow.dag_processing.dag_dir_watcher import DagDirectoryWatcher
+
+pytestmark = pytest.mark.skipif(not DagDirectoryWatcher.is_supported(), reason="inotify is not available")
+
+
+class TestDagDirectoryWatcher:
+    @pytest.fixture
+    def watcher(self, tmp_path):
+        watcher = DagDirectoryWatcher(str(tmp_path))
+        yield watcher
+        watcher.close()
+
+    def test_file_changes(self, watcher, tmp_path):
+        (tmp_path / "subdir").mkdir()
+        watcher.read_changes()
+
+        (tmp_path / "subdir" / "dag.py").write_text("# dag", encoding="utf-8")
+        (tmp_path / "other.py").write_text("# dag", encoding="utf-8")
+        changes = watcher.read_changes()
+        assert changes.paths == {str(tmp_path / "subdir" / "dag.py"), str(tmp_path / "other.py")}
+        assert not changes.rescan_needed
+
+        (tmp_path / "other.py").unlink()
+        assert watcher.read_changes().paths == {str(tmp_path / "other.py")}
+        assert watcher.read_changes().paths == set()
+
+    def test_directory_moves(self, watcher, tmp_path):
+        outside = tmp_path.parent / f"{tmp_path.name}_outside"
+        (outside / "nested").mkdir(parents=True)
+        (outside / "nested" / "dag.py").write_text("# dag", encoding="utf-8")
+
+        # The files of a directory moved into the tree are reported, and then watched
+        outside.rename(tmp_path / "moved")
+        changes = watcher.read_changes()
+        assert str(tmp_path / "moved" / "nested" / "dag.py") in changes.paths
+        (tmp_path / "moved" / "nested" / "dag.py").write_text("# changed", encoding="utf-8")
+        assert watcher.read_changes().paths == {str(tmp_path / "moved" / "nested" / "dag.py")}
+
+        # A directory moved away is reported, and no longer watched
+        (tmp_path / "moved").rename(outside)
+        assert watcher.read_changes().paths == {str(tmp_path / "moved")}
+        (outside / "nested" / "dag.py").write_text("# changed again", encoding="utf-8")
+        assert watcher.read_changes().paths == set()
+
+    def test_directory_deleted(self, tmp_path):
+        (tmp_path / "dags").mkdir()
+        watcher = DagDirectoryWatcher(str(tmp_path / "dags"))
+        try:
+            (tmp_path / "dags").rmdir()
+            with pytest.raises(FileNotFoundError):
+                watcher.read_changes()
+        finally:
+            watcher.close()
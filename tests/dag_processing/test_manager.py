@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+import errno
 import logging
 import multiprocessing
 import os
@@ -45,6 +46,7 @@ from airflow.dag_processing.manager import (
     DagFileStat,
     DagParsingSignal,
     DagParsingStat,
+    ParsedFileFingerprint,
 )
 from airflow.dag_processing.processor import DagFileProcessorProcess
 from airflow.models import DagBag, DagModel, DbCallbackRequest, errors
@@ -787,6 +789,203 @@ class TestDagFileProcessorManager:
             'dag_processing.last_duration.temp_dag', timedelta(seconds=last_runtime)
         )
 
+    @conf_vars(
+        {
+            ('core', 'load_examples'): 'False',
+            ('scheduler', 'min_file_process_interval'): '0',
+            ('scheduler', 'skip_unchanged_dag_files'): 'True',
+        }
+    )
+    @mock.patch('airflow.dag_processing.manager.Stats.incr')
+    def test_skip_unchanged_dag_files(self, statsd_incr_mock, tmpdir):
+        filename_to_parse = tmpdir / 'temp_dag.py'
+        helper_module = tmpdir / 'temp_dag_helper.py'
+        helper_module.write_text("SCHEDULE = '0 0 * * *'\n", encoding="utf-8")
+        filename_to_parse.write_text(
+            dedent(
+                """
+            import os, sys
+            sys.path.insert(0, os.path.dirname(__file__))
+            from airflow import DAG
+            from temp_dag_helper import SCHEDULE
+            dag = DAG(dag_id='temp_dag', schedule=SCHEDULE)
+            """
+            ),
+            encoding="utf-8",
+        )
+
+        child_pipe, parent_pipe = multiprocessing.Pipe()
+        async_mode = 'sqlite' not in conf.get('database', 'sql_alchemy_conn')
+        manager = DagFileProcessorManager(
+            dag_directory=tmpdir,
+            max_runs=2,
+            processor_timeout=timedelta(days=365),
+            signal_conn=child_pipe,
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=async_mode,
+        )
+
+        if not async_mode:
+            # One more loop is needed to get to the second run
+            parent_pipe.send(DagParsingSignal.AGENT_RUN_ONCE)
+        self.run_processor_manager_one_loop(manager, parent_pipe)
+        child_pipe.close()
+        parent_pipe.close()
+
+        file_path = str(filename_to_parse)
+        # The file was parsed once, then counted as processed without being parsed again
+        assert manager.get_run_count(file_path) == 2
+        assert manager.get_last_dag_count(file_path) == 1
+        statsd_incr_mock.assert_any_call('dag_processing.unchanged_files_skipped', 1)
+        fingerprint = manager._file_fingerprints[file_path]
+        assert fingerprint.dependencies == (str(helper_module),)
+        with create_session() as session:
+            assert session.query(DagModel).get('temp_dag').last_parsed_time > fingerprint.parsed_at
+
+        content_hash = manager._hash_file_content(file_path)
+        assert manager._is_file_unchanged(file_path, content_hash)
+        helper_module.write_text("SCHEDULE = '0 1 * * *'\n", encoding="utf-8")
+        assert not manager._is_file_unchanged(file_path, content_hash)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is only available on Linux")
+    @conf_vars({('core', 'load_examples'): 'False', ('scheduler', 'dag_dir_watcher'): 'inotify'})
+    @mock.patch("airflow.dag_processing.manager.list_py_file_paths")
+    def test_dag_dir_changes_are_watched(self, mock_list_py_file_paths, tmpdir):
+        old_dag = tmpdir / 'old_dag.py'
+        old_dag.write_text("from airflow import DAG\n", encoding="utf-8")
+        other_dag = tmpdir / 'other_dag.py'
+        other_dag.write_text("from airflow import DAG\n", encoding="utf-8")
+        mock_list_py_file_paths.return_value = [str(old_dag), str(other_dag)]
+        manager = DagFileProcessorManager(
+            dag_directory=str(tmpdir),
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        try:
+            manager._refresh_dag_dir()
+            assert manager._dag_dir_watcher is not None
+            manager._file_path_queue = [str(old_dag), str(other_dag)]
+
+            new_dag = tmpdir / 'new_dag.py'
+            new_dag.write_text("from airflow import DAG\n", encoding="utf-8")
+            (tmpdir / 'not_a_dag.py').write_text("print('hello')\n", encoding="utf-8")
+            other_dag.write_text("from airflow import DAG\n# changed\n", encoding="utf-8")
+            old_dag.remove()
+            manager._refresh_dag_dir()
+
+            # The directory was only listed once, the changes were applied as they were reported
+            mock_list_py_file_paths.assert_called_once()
+            assert sorted(manager._file_paths) == [str(new_dag), str(other_dag)]
+            assert manager._file_path_queue == [str(new_dag), str(other_dag)]
+
+            # Any change to the ignore files lists the directory again
+            (tmpdir / '.airflowignore').write_text("other_dag\n", encoding="utf-8")
+            manager._refresh_dag_dir()
+            assert mock_list_py_file_paths.call_count == 2
+        finally:
+            manager._dag_dir_watcher.close()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is only available on Linux")
+    @conf_vars({('core', 'load_examples'): 'False', ('scheduler', 'dag_dir_watcher'): 'inotify'})
+    @mock.patch("airflow.dag_processing.manager.list_py_file_paths", return_value=[])
+    def test_dag_dir_watcher_errors_fall_back_to_listing(self, mock_list_py_file_paths, tmpdir):
+        manager = DagFileProcessorManager(
+            dag_directory=str(tmpdir),
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        manager._refresh_dag_dir()
+        watcher = manager._dag_dir_watcher
+        assert watcher is not None
+
+        with mock.patch.object(
+            watcher, "read_changes", side_effect=OSError(errno.ENOSPC, "No space left on device")
+        ):
+            manager._refresh_dag_dir()
+
+        # The directory is listed again, and from then on only periodically
+        assert manager._dag_dir_watcher is None
+        assert watcher._fd == -1
+        assert mock_list_py_file_paths.call_count == 2
+        manager._refresh_dag_dir()
+        assert manager._dag_dir_watcher is None
+
+    @conf_vars(
+        {
+            ('core', 'load_examples'): 'False',
+            ('scheduler', 'parsing_worker_pool'): 'True',
+        }
+    )
+    def test_parse_with_worker_pool(self, tmpdir):
+        filename_to_parse = tmpdir / 'temp_dag.py'
+        filename_to_parse.write_text(
+            "from airflow import DAG\ndag = DAG(dag_id='temp_dag', schedule=None)\n", encoding="utf-8"
+        )
+
+        child_pipe, parent_pipe = multiprocessing.Pipe()
+        async_mode = 'sqlite' not in conf.get('database', 'sql_alchemy_conn')
+        manager = DagFileProcessorManager(
+            dag_directory=tmpdir,
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=child_pipe,
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=async_mode,
+        )
+
+        try:
+            self.run_processor_manager_one_loop(manager, parent_pipe)
+            assert manager.get_last_dag_count(str(filename_to_parse)) == 1
+            # The worker is kept for the next files
+            assert len(manager._processor_pool.get_all_pids()) == 1
+        finally:
+            manager.terminate()
+            child_pipe.close()
+            parent_pipe.close()
+        assert manager._processor_pool.get_all_pids() == []
+        with create_session() as session:
+            assert session.query(DagModel).get('temp_dag') is not None
+
+    @conf_vars({('scheduler', 'skip_unchanged_dag_files'): 'True'})
+    def test_expired_dags_are_parsed_again(self, tmpdir):
+        manager = DagFileProcessorManager(
+            dag_directory=tmpdir,
+            max_runs=1,
+            processor_timeout=timedelta(days=365),
+            signal_conn=MagicMock(),
+            dag_ids=[],
+            pickle_dags=False,
+            async_mode=True,
+        )
+        file_path = str(TEST_DAG_FOLDER / "test_example_bash_operator.py")
+        parsed_at = timezone.utcnow() - timedelta(minutes=1)
+        manager._file_fingerprints[file_path] = ParsedFileFingerprint(
+            content_hash=manager._hash_file_content(file_path),
+            dependencies=(),
+            dependency_stats=(),
+            num_dags=1,
+            parsed_at=parsed_at,
+        )
+        with create_session() as session:
+            session.add(DagModel(dag_id='test_example_bash_operator', fileloc=file_path))
+
+        manager._expire_file_fingerprints()
+        assert file_path in manager._file_fingerprints
+
+        DagModel.expire_dags(['test_example_bash_operator'])
+        manager._expire_file_fingerprints()
+        assert file_path not in manager._file_fingerprints
+
     def test_refresh_dags_dir_doesnt_delete_zipped_dags(self, tmpdir):
         """Test DagFileProcessorManager._refresh_dag_dir method"""
         manager = DagFileProcessorManager(
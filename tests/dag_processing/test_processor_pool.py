@@ -0,0 +1,108 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from textwrap import dedent
+from unittest import mock
+
+import pytest
+
+from airflow.dag_processing.processor_pool import DagFileProcessorPool
+from tests.test_utils.db import clear_db_dags, clear_db_serialized_dags
+
+
+def run_processor(pool, file_path, dag_directory):
+    processor = pool.create_processor(str(file_path), False, None, str(dag_directory), [])
+    processor.start()
+    deadline = time.monotonic() + 60
+    while not processor.done:
+        assert time.monotonic() < deadline, "The worker did not process the file in time"
+        time.sleep(0.05)
+    return processor
+
+
+class TestDagFileProcessorPool:
+    def setup_method(self):
+        clear_db_dags()
+        clear_db_serialized_dags()
+
+    def teardown_method(self):
+        clear_db_dags()
+        clear_db_serialized_dags()
+
+    @pytest.fixture
+    def dag_file(self, tmp_path):
+        (tmp_path / "pool_dag_helper.py").write_text("NUM_DAGS = 1\n", encoding="utf-8")
+        dag_file = tmp_path / "pool_dag.py"
+        dag_file.write_text(
+            dedent(
+                """
+            import os, sys
+            sys.path.insert(0, os.path.dirname(__file__))
+            from airflow import DAG
+            from pool_dag_helper import NUM_DAGS
+            for i in range(NUM_DAGS):
+                globals()[f"dag_{i}"] = DAG(dag_id=f"pool_dag_{i}", schedule=None)
+            """
+            ),
+            encoding="utf-8",
+        )
+        return dag_file
+
+    @mock.patch('airflow.dag_processing.processor_pool.Stats')
+    def test_workers_are_reused_then_recycled(self, mock_stats, dag_file, tmp_path):
+        pool = DagFileProcessorPool(
+            max_workers=1, max_files_per_worker=2, max_memory_growth=0, preload_modules=["json"]
+        )
+        try:
+            first = run_processor(pool, dag_file, tmp_path)
+            assert first.result == (1, 0)
+            assert first.dependencies == [str(dag_file), str(tmp_path / "pool_dag_helper.py")]
+
+            # The worker forgot the helper module, so it sees the change
+            (tmp_path / "pool_dag_helper.py").write_text("NUM_DAGS = 2\n", encoding="utf-8")
+            second = run_processor(pool, dag_file, tmp_path)
+            assert second.result == (2, 0)
+            assert second.pid == first.pid
+
+            # The worker is replaced after its second file
+            third = run_processor(pool, dag_file, tmp_path)
+            assert third.result == (2, 0)
+            assert third.pid != first.pid
+            assert pool.get_all_pids() == [third.pid]
+        finally:
+            pool.shutdown()
+
+        mock_stats.incr.assert_called_once_with('dag_processing.worker_recycled')
+        assert mock_stats.gauge.call_args.args[0] == 'dag_processing.worker.0.throughput'
+
+    def test_killed_worker_is_replaced(self, dag_file, tmp_path):
+        pool = DagFileProcessorPool(
+            max_workers=1, max_files_per_worker=100, max_memory_growth=0, preload_modules=[]
+        )
+        try:
+            processor = pool.create_processor(str(dag_file), False, None, str(tmp_path), [])
+            processor.start()
+            processor.kill()
+            assert processor.done
+            assert pool.get_all_pids() == []
+
+            assert run_processor(pool, dag_file, tmp_path).result == (1, 0)
+        finally:
+            pool.shutdown()
@@ -22,7 +22,7 @@ from unittest import mock
 
 from pytest import mark
 
-from airflow.executors.base_executor import QUEUEING_ATTEMPTS, BaseExecutor
+from airflow.executors.base_executor import QUEUEING_ATTEMPTS, BaseExecutor, QueuedTasks
 from airflow.models.baseoperator import BaseOperator
 from airflow.models.taskinstance import TaskInstanceKey
 from airflow.utils import timezone
@@ -61,6 +61,31 @@ def test_gauge_executor_metrics(mock_stats_gauge, mock_trigger_tasks, mock_sync)
     mock_stats_gauge.assert_has_calls(calls)
 
 
+def test_queued_tasks_by_priority():
+    date = timezone.utcnow()
+    keys = [TaskInstanceKey("my_dag", f"my_task{i}", date, 1) for i in range(5)]
+    queued_tasks = QueuedTasks({keys[0]: (["airflow"], 1, None, None)})
+    queued_tasks[keys[1]] = (["airflow"], 3, None, None)
+    queued_tasks[keys[2]] = (["airflow"], 2, None, None)
+    queued_tasks[keys[3]] = (["airflow"], 3, None, None)
+    queued_tasks[keys[4]] = (["airflow"], 5, None, None)
+
+    # Same priority tasks are taken in the order they were queued
+    assert [key for key, _ in queued_tasks.peek_by_priority(3)] == [keys[4], keys[1], keys[3]]
+    assert len(queued_tasks) == 5
+
+    # Removed and re-queued tasks are taken into account
+    del queued_tasks[keys[4]]
+    queued_tasks.pop(keys[1])
+    queued_tasks[keys[0]] = (["airflow"], 4, None, None)
+    assert queued_tasks.peek_by_priority(10) == [
+        (keys[0], (["airflow"], 4, None, None)),
+        (keys[3], (["airflow"], 3, None, None)),
+        (keys[2], (["airflow"], 2, None, None)),
+    ]
+    assert queued_tasks.peek_by_priority(0) == []
+
+
 def setup_dagrun(dag_maker):
     date = timezone.utcnow()
     start_date = date - timedelta(days=2)
@@ -23,6 +23,7 @@ import logging
 import os
 import signal
 import sys
+import threading
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
@@ -30,7 +31,7 @@ from unittest import mock
 # leave this it is used by the test worker
 import celery.contrib.testing.tasks  # noqa: F401
 import pytest
-from celery import Celery
+from celery import Celery, states as celery_states
 from celery.backends.base import BaseBackend, BaseKeyValueStoreBackend
 from celery.backends.database import DatabaseBackend
 from celery.contrib.testing.worker import start_worker
@@ -50,6 +51,7 @@ from airflow.operators.bash import BashOperator
 from airflow.utils import timezone
 from airflow.utils.state import State
 from tests.test_utils import db
+from tests.test_utils.config import conf_vars
 
 
 def _prepare_test_bodies():
@@ -197,6 +199,85 @@ class TestCeleryExecutor:
         assert 0 == len(executor.queued_tasks), "Task should no longer be queued"
         assert executor.event_buffer[('fail', 'fake_simple_ti', when, 0)][0] == State.FAILED
 
+    @conf_vars(
+        {('celery', 'async_task_submission'): 'True', ('celery', 'max_in_flight_task_submissions'): '1'}
+    )
+    def test_async_task_submission(self):
+        broker_available = threading.Event()
+
+        def apply_async(args, queue):
+            broker_available.wait(timeout=30)
+            return mock.MagicMock(task_id=f"celery_{args[0]}", state=celery_states.PENDING)
+
+        mock_execute_command = mock.MagicMock()
+        mock_execute_command.apply_async.side_effect = apply_async
+        with mock.patch.object(celery_executor, 'execute_command', mock_execute_command):
+            executor = celery_executor.CeleryExecutor()
+            executor.bulk_state_fetcher = mock.MagicMock()
+            executor.bulk_state_fetcher.get_many.side_effect = lambda results: {
+                result.task_id: (celery_states.PENDING, None) for result in results
+            }
+            when = datetime.now()
+            key_1 = TaskInstanceKey('dag', 'task_1', when, 1)
+            key_2 = TaskInstanceKey('dag', 'task_2', when, 1)
+            executor.queued_tasks[key_1] = ('command_1', 2, None, mock.MagicMock(executor_config=None))
+            executor.queued_tasks[key_2] = ('command_2', 1, None, mock.MagicMock(executor_config=None))
+
+            # The heartbeat does not wait for the broker, tasks stay queued until they are sent
+            executor.heartbeat()
+            assert executor.task_sender.is_sending(key_1)
+            assert not executor.task_sender.is_sending(key_2), "Only one task can be sent at a time"
+            assert set(executor.queued_tasks) == {key_1, key_2}
+            assert executor.event_buffer == {}
+
+            broker_available.set()
+            executor._collect_sent_tasks(wait_for_all=True)
+            assert executor.running == {key_1}
+            assert executor.event_buffer[key_1] == (State.QUEUED, 'celery_command_1')
+
+            executor.heartbeat()
+            executor.end()
+        assert executor.running == {key_1, key_2}
+        assert executor.event_buffer[key_2] == (State.QUEUED, 'celery_command_2')
+        assert executor.queued_tasks == {}
+        assert mock_execute_command.apply_async.call_count == 2
+
+    @conf_vars(
+        {('celery', 'track_task_events'): 'True', ('celery', 'task_state_reconciliation_interval'): '600'}
+    )
+    def test_task_states_from_events(self):
+        executor = celery_executor.CeleryExecutor()
+        executor.bulk_state_fetcher = mock.MagicMock()
+        executor.bulk_state_fetcher.get_many.side_effect = lambda results: {
+            result.task_id: (celery_states.PENDING, None) for result in results
+        }
+        when = datetime.now()
+        key_1 = TaskInstanceKey('dag', 'task_1', when, 1)
+        key_2 = TaskInstanceKey('dag', 'task_2', when, 1)
+        executor.tasks = {key_1: mock.MagicMock(task_id='celery_1')}
+        executor.running = {key_1, key_2}
+        receiver = executor.event_receiver
+
+        receiver._on_task_event({'type': 'task-started', 'uuid': 'celery_1'})
+        receiver._on_task_event({'type': 'task-succeeded', 'uuid': 'celery_1', 'result': None})
+        # The task can finish before the result of sending it is processed
+        receiver._on_task_event({'type': 'task-failed', 'uuid': 'celery_2', 'exception': 'ValueError()'})
+        executor.sync()
+        assert executor.event_buffer == {key_1: (State.SUCCESS, None)}
+        executor.bulk_state_fetcher.get_many.assert_not_called()
+
+        executor.tasks[key_2] = mock.MagicMock(task_id='celery_2')
+        executor.sync()
+        assert executor.event_buffer[key_2] == (State.FAILED, 'ValueError()')
+        assert executor.running == set()
+        assert executor._unmatched_task_events == {}
+
+        # The result backend is only polled from time to time, to catch up with missed events
+        executor.tasks[key_1] = mock.MagicMock(task_id='celery_3')
+        executor.sync()
+        executor.sync()
+        assert executor.bulk_state_fetcher.get_many.call_count == 1
+
     @pytest.mark.integration("redis")
     @pytest.mark.integration("rabbitmq")
     @pytest.mark.backend("mysql", "postgres")
@@ -21,6 +21,7 @@ import random
 import re
 import string
 import sys
+import threading
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
@@ -40,10 +41,13 @@ from tests.test_utils.config import conf_vars
 
 try:
     from airflow.executors.kubernetes_executor import (
+        MAX_POD_CREATION_RETRY_DELAY,
         AirflowKubernetesScheduler,
         KubernetesExecutor,
         KubernetesJobWatcher,
+        PodCreationRateLimiter,
         ResourceVersion,
+        WorkerPodCache,
         create_pod_id,
         get_base_pod_from_template,
     )
@@ -207,6 +211,57 @@ class TestAirflowKubernetesScheduler:
         kube_executor.kube_scheduler.delete_pod(pod_id, namespace)
         mock_delete_namespace.assert_called_with(pod_id, namespace, body=mock_client.V1DeleteOptions())
 
+    @mock.patch('airflow.executors.kubernetes_executor.time')
+    def test_pod_creation_rate_limiter(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        rate_limiter = PodCreationRateLimiter(rate=4)
+        rate_limiter.wait("namespace_1")
+        rate_limiter.wait("namespace_1")
+        rate_limiter.wait("namespace_2")
+        rate_limiter.wait("namespace_1")
+        assert mock_time.sleep.call_args_list == [mock.call(0.25), mock.call(0.5)]
+
+        mock_time.sleep.reset_mock()
+        unlimited = PodCreationRateLimiter(rate=0)
+        for _ in range(10):
+            unlimited.wait("namespace_1")
+        mock_time.sleep.assert_not_called()
+
+    def test_worker_pod_cache(self):
+        def make_pod(name, namespace, phase, **labels):
+            return k8s.V1Pod(
+                metadata=k8s.V1ObjectMeta(name=name, namespace=namespace, labels=labels),
+                status=k8s.V1PodStatus(phase=phase),
+            )
+
+        cache = WorkerPodCache()
+        cache.process_event('ADDED', [make_pod('ignored', 'default', 'Pending')])
+        cache.process_event(
+            'SYNC',
+            [
+                make_pod('pod_1', 'default', 'Pending', **{'airflow-worker': '1'}),
+                make_pod('pod_2', 'default', 'Running', **{'airflow-worker': '2'}),
+                make_pod('pod_3', 'other', 'Pending', **{'airflow-worker': '1'}),
+            ],
+        )
+        assert cache.synced
+        assert len(cache) == 3
+
+        cache.process_event(
+            'MODIFIED', [make_pod('pod_2', 'default', 'Succeeded', **{'airflow-worker': '2'})]
+        )
+        cache.process_event('DELETED', [make_pod('pod_3', 'other', 'Pending', **{'airflow-worker': '1'})])
+        cache.process_event('ADDED', [make_pod('pod_4', 'default', 'Pending', **{'airflow-worker': '2'})])
+
+        assert {pod.metadata.name for pod in cache.get_pods()} == {'pod_1', 'pod_2', 'pod_4'}
+        assert [pod.metadata.name for pod in cache.get_pods(phase='Succeeded')] == ['pod_2']
+        pending_pods = cache.get_pods(namespace='default', phase='Pending', **{'airflow-worker': '2'})
+        assert [pod.metadata.name for pod in pending_pods] == ['pod_4']
+        assert cache.get_pods(namespace='other') == []
+
+        cache.invalidate()
+        assert not cache.synced
+
 
 class TestKubernetesExecutor:
     """
@@ -329,6 +384,108 @@ class TestKubernetesExecutor:
             assert kubernetes_executor.event_buffer[task_instance_key][0] == State.FAILED
             assert kubernetes_executor.event_buffer[task_instance_key][1].args[0] == fail_msg
 
+    @pytest.mark.skipif(
+        AirflowKubernetesScheduler is None, reason='kubernetes python package is not installed'
+    )
+    @mock.patch('airflow.executors.kubernetes_executor.time.sleep')
+    @mock.patch('airflow.executors.kubernetes_executor.KubernetesJobWatcher')
+    @mock.patch('airflow.executors.kubernetes_executor.get_kube_client')
+    def test_pod_creation_retries(self, mock_get_kube_client, mock_kubernetes_job_watcher, mock_sleep):
+        path = sys.path[0] + '/tests/kubernetes/pod_generator_base_with_secrets.yaml'
+        throttled = ApiException(
+            http_resp=HTTPResponse(
+                body='{"message": "throttled"}',
+                status=429,
+                headers={'Retry-After': '3600'},
+                reason='Too Many',
+            )
+        )
+        unavailable = ApiException(
+            http_resp=HTTPResponse(body='{"message": "unavailable"}', status=503, reason='Unavailable')
+        )
+        mock_kube_client = mock_get_kube_client.return_value
+        mock_kube_client.create_namespaced_pod.side_effect = [throttled, unavailable, "created"]
+        mock_kube_client.api_client.sanitize_for_serialization.return_value = {}
+        config = {
+            ('kubernetes', 'pod_template_file'): path,
+            ('kubernetes_executor', 'worker_pods_creation_max_retries'): '1',
+        }
+        with conf_vars(config):
+            kubernetes_executor = KubernetesExecutor()
+            kubernetes_executor.job_id = 5
+            kubernetes_executor.start()
+            key = TaskInstanceKey('dag', 'task', 'run_id', 1)
+            kubernetes_executor.execute_async(
+                key=key, queue=None, command=['airflow', 'tasks', 'run', 'true', 'some_parameter']
+            )
+            with mock.patch('airflow.executors.kubernetes_executor.time.monotonic', return_value=100.0):
+                kubernetes_executor.sync()
+            # The retry waits for a later sync rather than sleeping, and not as long as asked for
+            mock_sleep.assert_not_called()
+            assert kubernetes_executor.task_queue.empty()
+            [(not_before, task)] = kubernetes_executor._pod_creation_retries
+            assert not_before == 100.0 + MAX_POD_CREATION_RETRY_DELAY
+            assert task[0] == key
+
+            with mock.patch('airflow.executors.kubernetes_executor.time.monotonic', return_value=110.0):
+                kubernetes_executor.sync()
+            assert mock_kube_client.create_namespaced_pod.call_count == 1
+            with mock.patch('airflow.executors.kubernetes_executor.time.monotonic', return_value=130.0):
+                kubernetes_executor.sync()
+            assert mock_kube_client.create_namespaced_pod.call_count == 2
+            # The retries are exhausted, so the task is queued again for the next sync
+            assert not kubernetes_executor._pod_creation_retries
+            assert kubernetes_executor.task_queue.qsize() == 1
+            kubernetes_executor.sync()
+            assert mock_kube_client.create_namespaced_pod.call_count == 3
+            assert kubernetes_executor._pod_creation_attempts == {}
+
+    @pytest.mark.skipif(
+        AirflowKubernetesScheduler is None, reason='kubernetes python package is not installed'
+    )
+    @mock.patch('airflow.executors.kubernetes_executor.KubernetesJobWatcher')
+    @mock.patch('airflow.executors.kubernetes_executor.get_kube_client')
+    def test_concurrent_pod_creation(self, mock_get_kube_client, mock_kubernetes_job_watcher):
+        path = sys.path[0] + '/tests/kubernetes/pod_generator_base_with_secrets.yaml'
+        # Only returns once 4 pods are being created at the same time
+        all_creating = threading.Barrier(4, timeout=30)
+        lock = threading.Lock()
+        created_pods = []
+
+        def create_namespaced_pod(body, namespace, **kwargs):
+            all_creating.wait()
+            with lock:
+                created_pods.append(body)
+                if len(created_pods) == 1:
+                    raise ApiException(http_resp=HTTPResponse(body='{"message": "quota"}', status=403))
+
+        mock_kube_client = mock_get_kube_client.return_value
+        mock_kube_client.create_namespaced_pod.side_effect = create_namespaced_pod
+        mock_kube_client.api_client.sanitize_for_serialization.return_value = {}
+        config = {
+            ('kubernetes', 'pod_template_file'): path,
+            ('kubernetes_executor', 'worker_pods_creation_batch_size'): '8',
+            ('kubernetes_executor', 'worker_pods_creation_parallelism'): '4',
+        }
+        with conf_vars(config):
+            kubernetes_executor = KubernetesExecutor()
+            kubernetes_executor.job_id = 5
+            kubernetes_executor.start()
+            try:
+                for i in range(8):
+                    kubernetes_executor.execute_async(
+                        key=TaskInstanceKey('dag', f'task_{i}', 'run_id', 1),
+                        queue=None,
+                        command=['airflow', 'tasks', 'run', 'true', 'some_parameter'],
+                    )
+                kubernetes_executor.sync()
+
+                assert mock_kube_client.create_namespaced_pod.call_count == 8
+                # The task whose pod could not be created is queued again
+                assert kubernetes_executor.task_queue.qsize() == 1
+            finally:
+                kubernetes_executor._pod_creation_pool.shutdown()
+
     @mock.patch('airflow.executors.kubernetes_executor.KubeConfig')
     @mock.patch('airflow.executors.kubernetes_executor.KubernetesExecutor.sync')
     @mock.patch('airflow.executors.base_executor.BaseExecutor.trigger_tasks')
@@ -613,17 +770,19 @@ class TestKubernetesExecutor:
         }
         ti_key = annotations_to_key(annotations)
         pod = k8s.V1Pod(
-            metadata=k8s.V1ObjectMeta(name="foo", labels={"airflow-worker": "bar"}, annotations=annotations)
+            metadata=k8s.V1ObjectMeta(
+                name="foo", labels={"airflow-worker": "bar"}, annotations=annotations, resource_version="42"
+            )
         )
         pod_ids = {ti_key: {}}
 
         executor.adopt_launched_task(mock_kube_client, pod=pod, pod_ids=pod_ids)
+        # Only the label is patched, and only if the pod did not change since it was listed
         assert mock_kube_client.patch_namespaced_pod.call_args[1] == {
             'body': {
                 'metadata': {
                     'labels': {'airflow-worker': 'modified'},
-                    'annotations': annotations,
-                    'name': 'foo',
+                    'resourceVersion': '42',
                 }
             },
             'name': 'foo',
@@ -747,6 +906,115 @@ class TestKubernetesExecutor:
         )
         mock_delete_pod.assert_called_once_with('foo90', 'anothernamespace')
 
+    @mock.patch('airflow.executors.kubernetes_executor.KubernetesJobWatcher')
+    @mock.patch('airflow.executors.kubernetes_executor.get_kube_client')
+    def test_pod_cache(self, mock_get_kube_client, mock_kubernetes_job_watcher):
+        mock_kube_client = mock_get_kube_client.return_value
+        now = timezone.utcnow()
+        annotations = {'dag_id': 'dag', 'run_id': 'run_id', 'task_id': 'task', 'try_number': '1'}
+        ti_key = annotations_to_key(annotations)
+
+        def make_pod(name, phase, age, scheduler_job_id, annotations=None):
+            return k8s.V1Pod(
+                metadata=k8s.V1ObjectMeta(
+                    name=name,
+                    namespace='default',
+                    labels={'airflow-worker': scheduler_job_id, 'kubernetes_executor': 'True'},
+                    annotations=annotations,
+                    creation_timestamp=now - timedelta(seconds=age),
+                    resource_version=str(age),
+                ),
+                status=k8s.V1PodStatus(phase=phase),
+            )
+
+        with conf_vars({('kubernetes_executor', 'cache_worker_pods'): 'True'}):
+            executor = KubernetesExecutor()
+            executor.job_id = 123
+            executor.start()
+            try:
+                # The pods are listed until the watcher populated the cache
+                assert executor._get_cached_pods() is None
+                executor.kube_scheduler.pod_event_queue.put(
+                    (
+                        'SYNC',
+                        [
+                            make_pod('pending_new', 'Pending', 10, '123'),
+                            make_pod('pending_old', 'Pending', 1000, '123'),
+                            make_pod('running', 'Running', 1000, '1', annotations),
+                            make_pod(
+                                'succeeded', 'Succeeded', 1000, '1', {**annotations, 'task_id': 'other'}
+                            ),
+                        ],
+                    )
+                )
+                mock_kube_client.reset_mock()
+
+                with mock.patch.object(executor.kube_scheduler, 'delete_pod') as mock_delete_pod:
+                    executor._check_worker_pods_pending_timeout()
+                mock_delete_pod.assert_called_once_with('pending_old', 'default')
+
+                mock_ti = mock.MagicMock(queued_by_job_id='1', key=ti_key)
+                assert executor.try_adopt_task_instances([mock_ti]) == []
+                assert executor.running == {ti_key}
+                adopted_pods = [
+                    (call.kwargs['name'], call.kwargs['body'])
+                    for call in mock_kube_client.patch_namespaced_pod.call_args_list
+                ]
+                # The patches carry the resource versions of the cached pods
+                assert adopted_pods == [
+                    (
+                        'running',
+                        {'metadata': {'labels': {'airflow-worker': '123'}, 'resourceVersion': '1000'}},
+                    ),
+                    (
+                        'succeeded',
+                        {'metadata': {'labels': {'airflow-worker': '123'}, 'resourceVersion': '1000'}},
+                    ),
+                ]
+                # The adoption does not modify the cached pods
+                assert len(executor._get_cached_pods(**{'airflow-worker': '1'})) == 2
+
+                mock_kube_client.list_namespaced_pod.assert_not_called()
+                mock_kube_client.list_pod_for_all_namespaces.assert_not_called()
+            finally:
+                executor.end()
+
+    def test_clear_not_launched_queued_tasks_from_pod_cache(self, dag_maker, session):
+        with dag_maker(dag_id='test_clear'):
+            op = BashOperator.partial(task_id="bash").expand(bash_command=["echo 0", "echo 1"])
+        dag_run = dag_maker.create_dagrun()
+        tis = [dag_run.get_task_instance(op.task_id, session, map_index=index) for index in (0, 1)]
+        for ti in tis:
+            ti.state = State.QUEUED
+            ti.queued_by_job_id = 1
+        session.flush()
+
+        executor = self.kubernetes_executor
+        executor.kube_client = mock.MagicMock()
+        executor.kube_config.cache_worker_pods = True
+        executor.kube_scheduler = mock.MagicMock()
+        executor.kube_scheduler.get_cached_pods.return_value = [
+            k8s.V1Pod(
+                metadata=k8s.V1ObjectMeta(
+                    name='pod',
+                    labels={
+                        'dag_id': 'test_clear',
+                        'task_id': 'bash',
+                        'airflow-worker': '1',
+                        'map_index': '0',
+                        'run_id': 'test',
+                    },
+                )
+            )
+        ]
+        executor.clear_not_launched_queued_tasks(session=session)
+
+        for ti in tis:
+            ti.refresh_from_db()
+        assert [ti.state for ti in tis] == [State.QUEUED, State.SCHEDULED]
+        executor.kube_scheduler.get_cached_pods.assert_called_once_with(namespace='default')
+        executor.kube_client.list_namespaced_pod.assert_not_called()
+
     def test_clear_not_launched_queued_tasks_not_launched(self, dag_maker, create_dummy_dag, session):
         """If a pod isn't found for a TI, reset the state to scheduled"""
         mock_kube_client = mock.MagicMock()
@@ -1016,6 +1284,44 @@ class TestKubernetesJobWatcher:
         with pytest.raises(AirflowException, match=error_message):
             self._run()
 
+    def test_sync_pods_for_pod_cache(self):
+        self.watcher.pod_event_queue = mock.MagicMock()
+        self.pod.metadata.labels = {'airflow-worker': '123'}
+        self.pod.status.phase = 'Succeeded'
+        other_pod = k8s.V1Pod(
+            metadata=k8s.V1ObjectMeta(
+                name='other',
+                labels={'airflow-worker': '1'},
+                annotations=self.core_annotations,
+                namespace='airflow',
+                resource_version='500',
+            ),
+            status=k8s.V1PodStatus(phase='Failed'),
+        )
+        self.kube_client.list_namespaced_pod.return_value = k8s.V1PodList(
+            metadata=k8s.V1ListMeta(resource_version='400'), items=[self.pod, other_pod]
+        )
+        self.events.append({"type": 'MODIFIED', "object": other_pod})
+
+        with mock.patch('airflow.executors.kubernetes_executor.watch') as mock_watch:
+            mock_watch.Watch.return_value.stream.return_value = self.events
+            assert self.watcher._run(self.kube_client, '0', '123', self.watcher.kube_config) == '500'
+            assert mock_watch.Watch.return_value.stream.call_args.kwargs['resource_version'] == '400'
+            # The watch resumes from the last resource_version without listing the pods again
+            self.events.clear()
+            assert self.watcher._run(self.kube_client, '500', '123', self.watcher.kube_config) == '500'
+
+        self.kube_client.list_namespaced_pod.assert_called_once_with(
+            'airflow', label_selector='kubernetes_executor=True'
+        )
+        pod_events = [
+            (call.args[0][0], [pod.metadata.name for pod in call.args[0][1]])
+            for call in self.watcher.pod_event_queue.put.call_args_list
+        ]
+        assert pod_events == [('SYNC', ['foo', 'other']), ('MODIFIED', ['other'])]
+        # Only the pods of this scheduler change the state of the task instances
+        self.assert_watcher_queue_called_once_with_state(None)
+
     def test_recover_from_resource_too_old(self):
         # too old resource
         mock_underscore_run = mock.MagicMock()
@@ -19,12 +19,20 @@ from __future__ import annotations
 
 import datetime
 import subprocess
+from textwrap import dedent
 from unittest import mock
 
+import pytest
+
 from airflow import settings
 from airflow.exceptions import AirflowException
-from airflow.executors.local_executor import LocalExecutor
+from airflow.executors.local_executor import LocalExecutor, WarmQueuedLocalWorker
+from airflow.models.dagbag import DagBag
+from airflow.utils import timezone
 from airflow.utils.state import State
+from airflow.utils.types import DagRunType
+from tests.test_utils.config import conf_vars
+from tests.test_utils.db import clear_db_dags, clear_db_runs
 
 
 class TestLocalExecutor:
@@ -113,6 +121,75 @@ class TestLocalExecutor:
     def test_execution_limited_parallelism_fork(self):
         self.execution_parallelism_fork(parallelism=2)
 
+    @pytest.mark.skipif(not settings.CAN_FORK, reason="Warm workers fork the tasks")
+    @conf_vars({('core', 'local_executor_warm_workers'): 'True'})
+    def test_execution_warm_workers(self, tmp_path):
+        parse_log = tmp_path / "parsed"
+        dag_file = tmp_path / "warm_dag.py"
+        dag_file.write_text(
+            dedent(
+                f"""
+            import pendulum
+            from airflow import DAG
+            from airflow.operators.python import PythonOperator
+
+            with open({str(parse_log)!r}, "a") as parse_log:
+                parse_log.write("parsed\\n")
+
+            def fail():
+                raise ValueError("Failed")
+
+            with DAG("warm_dag", start_date=pendulum.datetime(2022, 1, 1), schedule=None):
+                PythonOperator(task_id="succeed", python_callable=lambda: None)
+                PythonOperator(task_id="fail", python_callable=fail)
+            """
+            ),
+            encoding="utf-8",
+        )
+        clear_db_runs()
+        clear_db_dags()
+        dag = DagBag(str(dag_file), include_examples=False).dags["warm_dag"]
+        dag.sync_to_db()
+        dag_run = dag.create_dagrun(
+            run_type=DagRunType.MANUAL,
+            execution_date=timezone.datetime(2022, 1, 1),
+            data_interval=(timezone.datetime(2022, 1, 1), timezone.datetime(2022, 1, 1)),
+            state=State.RUNNING,
+        )
+        tis = {ti.task_id: ti for ti in dag_run.get_task_instances()}
+
+        executor = LocalExecutor(parallelism=1)
+        executor.start()
+        try:
+            assert isinstance(executor.workers[0], WarmQueuedLocalWorker)
+            for task_id in ("succeed", "fail"):
+                ti = tis[task_id]
+                ti.task = dag.get_task(task_id)
+                command = ti.command_as_list(local=True, pool=ti.pool)
+                command[command.index("--subdir") + 1] = str(dag_file)
+                executor.running.add(ti.key)
+                executor.execute_async(key=ti.key, command=command)
+            # An unparsable command fails without taking the worker down
+            bad_key = tis["succeed"].key.with_try_number(99)
+            executor.running.add(bad_key)
+            executor.execute_async(key=bad_key, command=["airflow", "tasks", "run", "--no-such-option"])
+        finally:
+            executor.end()
+
+        # The task failure is recorded by the task, running it worked
+        assert {executor.event_buffer[ti.key][0] for ti in tis.values()} == {State.SUCCESS}
+        assert executor.event_buffer[bad_key][0] == State.FAILED
+        for ti in tis.values():
+            ti.refresh_from_db()
+        assert tis["succeed"].state == State.SUCCESS
+        assert tis["fail"].state == State.FAILED
+        # The tasks were supervised by a LocalTaskJob
+        assert all(ti.job_id is not None for ti in tis.values())
+        # Once when syncing the DAG above, once in the worker
+        assert parse_log.read_text().count("parsed") == 2
+        clear_db_runs()
+        clear_db_dags()
+
     @mock.patch('airflow.executors.local_executor.LocalExecutor.sync')
     @mock.patch('airflow.executors.base_executor.BaseExecutor.trigger_tasks')
     @mock.patch('airflow.executors.base_executor.Stats.gauge')
@@ -45,7 +45,7 @@ from airflow.executors.base_executor import BaseExecutor
 from airflow.jobs.backfill_job import BackfillJob
 from airflow.jobs.base_job import BaseJob
 from airflow.jobs.local_task_job import LocalTaskJob
-from airflow.jobs.scheduler_job import SchedulerJob
+from airflow.jobs.scheduler_job import DagPartitioner, SchedulerJob
 from airflow.models import DAG, DagBag, DagModel, DbCallbackRequest, Pool, TaskInstance
 from airflow.models.dagrun import DagRun
 from airflow.models.dataset import DatasetDagRunQueue, DatasetEvent, DatasetModel
@@ -450,6 +450,60 @@ class TestSchedulerJob:
         self.scheduler_job.executor.callback_sink.send.assert_not_called()
         mock_stats_incr.assert_not_called()
 
+    @mock.patch('airflow.jobs.scheduler_job.TaskCallbackRequest')
+    @mock.patch('airflow.jobs.scheduler_job.Stats.incr')
+    def test_process_executor_events_in_bulk(self, mock_stats_incr, mock_task_callback, dag_maker, session):
+        with dag_maker(dag_id='test_process_executor_events_in_bulk', fileloc='/test_path1/'):
+            EmptyOperator(task_id='killed')
+            EmptyOperator(task_id='killed_with_callback', on_failure_callback=lambda x: print("hi"))
+            EmptyOperator(task_id='handed_back')
+            EmptyOperator(task_id='success')
+            EmptyOperator(task_id='queued')
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+        for task_id in ('killed', 'killed_with_callback', 'handed_back', 'queued'):
+            tis[task_id].state = State.QUEUED
+            tis[task_id].queued_by_job_id = 1
+        tis['success'].state = State.SUCCESS
+        session.flush()
+        mock_stats_incr.reset_mock()
+
+        executor = MockExecutor(do_update=False)
+        executor.has_task = mock.MagicMock(side_effect=lambda ti: ti.task_id == 'handed_back')
+        with conf_vars({('scheduler', 'executor_events_bulk_threshold'): '2'}):
+            self.scheduler_job = SchedulerJob(executor=executor)
+        self.scheduler_job.id = 1
+        self.scheduler_job.max_tis_per_query = 2
+        self.scheduler_job.processor_agent = mock.MagicMock()
+        for task_id in ('killed', 'killed_with_callback', 'handed_back', 'success'):
+            executor.event_buffer[tis[task_id].key] = State.FAILED, None
+        executor.event_buffer[tis['queued'].key] = State.QUEUED, 'celery-task-id'
+
+        with mock.patch.object(
+            self.scheduler_job,
+            '_process_executor_events_in_bulk',
+            wraps=self.scheduler_job._process_executor_events_in_bulk,
+        ) as bulk:
+            self.scheduler_job._process_executor_events(session=session)
+        bulk.assert_called_once()
+        session.expire_all()
+
+        states = {
+            ti.task_id: (ti.state, ti.external_executor_id) for ti in dr.get_task_instances(session=session)
+        }
+        assert states == {
+            'killed': (State.FAILED, None),
+            # The callback of the task fails it in the DAG processor
+            'killed_with_callback': (State.QUEUED, None),
+            'handed_back': (State.QUEUED, None),
+            'success': (State.SUCCESS, None),
+            'queued': (State.QUEUED, 'celery-task-id'),
+        }
+        assert mock_task_callback.call_count == 1
+        assert mock_task_callback.call_args.kwargs['simple_task_instance'].task_id == 'killed_with_callback'
+        executor.callback_sink.send.assert_called_once_with(mock_task_callback.return_value)
+        mock_stats_incr.assert_any_call('scheduler.tasks.killed_externally', 2)
+
     def test_execute_task_instances_is_paused_wont_execute(self, session, dag_maker):
         dag_id = 'SchedulerJobTest.test_execute_task_instances_is_paused_wont_execute'
         task_id_1 = 'dummy_task'
@@ -1005,6 +1059,81 @@ class TestSchedulerJob:
         assert res[0].key == ti3.key
         session.rollback()
 
+    @conf_vars({('scheduler', 'use_concurrency_ledger'): 'True'})
+    def test_find_executable_task_instances_concurrency_with_ledger(self, dag_maker, session):
+        dag_id = 'SchedulerJobTest.test_find_executable_task_instances_concurrency_with_ledger'
+        with dag_maker(dag_id=dag_id, max_active_tasks=2, session=session):
+            EmptyOperator(task_id='dummy', pool='a')
+        session.add(Pool(pool='a', slots=2, description='haha'))
+
+        self.scheduler_job = SchedulerJob(subdir=os.devnull)
+        ledger = self.scheduler_job._concurrency_ledger
+        assert ledger is not None
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        dr3 = dag_maker.create_dagrun_after(dr2, run_type=DagRunType.SCHEDULED)
+
+        ti1 = dr1.task_instances[0]
+        ti2 = dr2.task_instances[0]
+        ti3 = dr3.task_instances[0]
+        ti1.state = State.RUNNING
+        ti2.state = State.SCHEDULED
+        ti3.state = State.SCHEDULED
+        session.merge(ti1)
+        session.merge(ti2)
+        session.merge(ti3)
+        session.flush()
+
+        res = self.scheduler_job._executable_task_instances_to_queued(max_tis=32, session=session)
+
+        assert [ti.key for ti in res] == [ti2.key]
+        assert len(ledger) == 2
+        dag_map, task_map = ledger.concurrency_maps()
+        assert dag_map[dag_id] == 2
+        assert task_map[(dag_id, 'dummy')] == 2
+        assert sorted(ledger.pool_state_counts()) == [('a', State.QUEUED, 1), ('a', State.RUNNING, 1)]
+
+        # The ledger is not reconciled before its interval elapses, so the queued task counts against
+        # the limits without any aggregate query.
+        with assert_queries_count(3):
+            res = self.scheduler_job._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert res == []
+        session.rollback()
+
+    @conf_vars({('scheduler', 'use_concurrency_ledger'): 'True'})
+    def test_concurrency_ledger_reconcile(self, dag_maker, session):
+        dag_id = 'SchedulerJobTest.test_concurrency_ledger_reconcile'
+        with dag_maker(dag_id=dag_id, max_active_tasks=1, session=session):
+            EmptyOperator(task_id='dummy')
+
+        self.scheduler_job = SchedulerJob(subdir=os.devnull)
+        ledger = self.scheduler_job._concurrency_ledger
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        ti1 = dr1.task_instances[0]
+        ti2 = dr2.task_instances[0]
+        ti1.state = State.RUNNING
+        ti2.state = State.SCHEDULED
+        session.merge(ti1)
+        session.merge(ti2)
+        session.flush()
+
+        assert self.scheduler_job._executable_task_instances_to_queued(max_tis=32, session=session) == []
+        assert len(ledger) == 1
+
+        # The running task finished without the scheduler seeing it, e.g. it was marked success in the UI
+        ti1.state = State.SUCCESS
+        session.merge(ti1)
+        session.flush()
+        assert self.scheduler_job._executable_task_instances_to_queued(max_tis=32, session=session) == []
+
+        ledger.invalidate()
+        res = self.scheduler_job._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert [ti.key for ti in res] == [ti2.key]
+        session.rollback()
+
     # TODO: This is a hack, I think I need to just remove the setting and have it on always
     def test_find_executable_task_instances_max_active_tis_per_dag(self, dag_maker):
         dag_id = 'SchedulerJobTest.test_find_executable_task_instances_max_active_tis_per_dag'
@@ -1674,6 +1803,53 @@ class TestSchedulerJob:
         session.rollback()
         session.close()
 
+    @conf_vars({('scheduler', 'batch_dagrun_scheduling'): 'True'})
+    def test_schedule_all_dag_runs_in_batch(self, dag_maker, session):
+        with dag_maker(dag_id='test_schedule_all_dag_runs_in_batch', session=session):
+            op1 = BashOperator(task_id='op1', bash_command='true')
+            op2 = BashOperator(task_id='op2', bash_command='true')
+            empty = EmptyOperator(task_id='empty')
+            op1 >> op2
+
+        dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+        dr3 = dag_maker.create_dagrun_after(dr2, run_type=DagRunType.SCHEDULED)
+        ti = dr3.get_task_instance(op1.task_id, session=session)
+        ti.state = State.SUCCESS
+        latest_version = SerializedDagModel.get_latest_version_hash(dr1.dag_id, session=session)
+        for dr in (dr1, dr2, dr3):
+            dr.dag_hash = latest_version
+        session.commit()
+
+        self.scheduler_job = SchedulerJob(subdir=os.devnull)
+        self.scheduler_job.dagbag = dag_maker.dagbag
+        self.scheduler_job.processor_agent = mock.Mock()
+
+        with mock.patch.object(DagRun, 'get_task_instances') as mock_get_tis, mock.patch.object(
+            DagRun, 'bulk_schedule_tis', wraps=DagRun.bulk_schedule_tis
+        ) as mock_bulk_schedule_tis:
+            callbacks = self.scheduler_job._schedule_all_dag_runs(mock.Mock(), [dr1, dr2, dr3], session)
+        mock_get_tis.assert_not_called()
+        mock_bulk_schedule_tis.assert_called_once()
+        assert [dag_run for dag_run, _ in callbacks] == [dr1, dr2, dr3]
+
+        session.expire_all()
+        states = {
+            (ti.run_id, ti.task_id): ti.state
+            for ti in session.query(TaskInstance).filter(TaskInstance.dag_id == dr1.dag_id)
+        }
+        assert states == {
+            (dr1.run_id, op1.task_id): State.SCHEDULED,
+            (dr1.run_id, op2.task_id): None,
+            (dr1.run_id, empty.task_id): State.SUCCESS,
+            (dr2.run_id, op1.task_id): State.SCHEDULED,
+            (dr2.run_id, op2.task_id): None,
+            (dr2.run_id, empty.task_id): State.SUCCESS,
+            (dr3.run_id, op1.task_id): State.SUCCESS,
+            (dr3.run_id, op2.task_id): State.SCHEDULED,
+            (dr3.run_id, empty.task_id): State.SUCCESS,
+        }
+
     def test_dagrun_timeout_fails_run(self, dag_maker):
         """
         Test if a a dagrun will be set failed if timeout, even without max_active_runs
@@ -2944,6 +3120,72 @@ class TestSchedulerJob:
         if old_job.processor_agent:
             old_job.processor_agent.end()
 
+    def test_dag_partitioner(self, session):
+        dag_ids = [f"test_dag_partitioner_{i}" for i in range(100)]
+        session.add_all(DagModel(dag_id=dag_id, is_active=True, is_paused=False) for dag_id in dag_ids)
+        session.add(DagModel(dag_id="test_dag_partitioner_paused", is_active=True, is_paused=True))
+        jobs = [SchedulerJob(subdir=os.devnull) for _ in range(4)]
+        for job in jobs:
+            job.state = State.RUNNING
+            job.latest_heartbeat = timezone.utcnow()
+        jobs[3].latest_heartbeat = timezone.utcnow() - timedelta(minutes=15)
+        session.add_all(jobs)
+        session.flush()
+
+        partitions = {}
+        for job in jobs[:3]:
+            partitioner = DagPartitioner(refresh_interval=10)
+            assert partitioner.needs_refresh
+            partitioner.refresh(job.id, session)
+            assert not partitioner.needs_refresh
+            assert partitioner.live_job_ids == sorted(job.id for job in jobs[:3])
+            partitions[job.id] = partitioner.dag_ids
+        # The partitions of the live schedulers cover the active DAGs without overlapping
+        assert all(partitions.values())
+        assert sorted(dag_id for partition in partitions.values() for dag_id in partition) == sorted(dag_ids)
+
+        # The DAGs of a scheduler that stopped heartbeating move to the others, which keep their own
+        jobs[0].latest_heartbeat = timezone.utcnow() - timedelta(minutes=15)
+        session.flush()
+        partitioner = DagPartitioner(refresh_interval=10)
+        partitioner.refresh(jobs[1].id, session)
+        assert partitions[jobs[1].id] < partitioner.dag_ids
+        assert not partitions[jobs[2].id] & partitioner.dag_ids
+
+        # The only running scheduler schedules all DAGs
+        jobs[2].state = State.FAILED
+        session.flush()
+        partitioner.refresh(jobs[1].id, session)
+        assert partitioner.live_job_ids == [jobs[1].id]
+        assert partitioner.dag_ids is None
+        session.rollback()
+
+    def test_partition_dags(self, dag_maker, session):
+        for dag_id in ("test_partition_dags_1", "test_partition_dags_2"):
+            with dag_maker(dag_id=dag_id, schedule="@daily", session=session):
+                EmptyOperator(task_id="dummy")
+            dag_maker.create_dagrun(
+                run_type=DagRunType.MANUAL,
+                state=DagRunState.RUNNING,
+                execution_date=DEFAULT_DATE - timedelta(days=1),
+            )
+
+        with conf_vars({("scheduler", "partition_dags"): "True"}):
+            self.scheduler_job = SchedulerJob(executor=self.null_exec)
+        self.scheduler_job.processor_agent = mock.MagicMock()
+        assert self.scheduler_job._dag_partitioner is not None
+
+        with mock.patch.object(
+            DagPartitioner, "dag_ids", new_callable=mock.PropertyMock, return_value={"test_partition_dags_1"}
+        ):
+            dag_runs = self.scheduler_job._get_next_dagruns_to_examine(DagRunState.RUNNING, session)
+            assert [dag_run.dag_id for dag_run in dag_runs] == ["test_partition_dags_1"]
+
+            self.scheduler_job._create_dagruns_for_dags(session, session)
+        created_runs = session.query(DagRun.dag_id).filter(DagRun.state == DagRunState.QUEUED).all()
+        assert created_runs == [("test_partition_dags_1",)]
+        session.rollback()
+
     def test_adopt_or_reset_orphaned_tasks_only_fails_scheduler_jobs(self, caplog):
         """Make sure we only set SchedulerJobs to failed, not all jobs"""
         session = settings.Session()
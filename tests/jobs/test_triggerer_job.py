@@ -19,12 +19,14 @@ from __future__ import annotations
 
 import asyncio
 import datetime
+import os
+import signal
 import time
 from threading import Thread
 
 import pytest
 
-from airflow.jobs.triggerer_job import TriggererJob, TriggerRunner
+from airflow.jobs.triggerer_job import ShardedTriggerRunner, TriggererJob, TriggerRunner
 from airflow.models import DagModel, DagRun, TaskInstance, Trigger
 from airflow.operators.empty import EmptyOperator
 from airflow.operators.python import PythonOperator
@@ -34,6 +36,7 @@ from airflow.triggers.testing import FailureTrigger, SuccessTrigger
 from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.state import State, TaskInstanceState
+from tests.test_utils.config import conf_vars
 from tests.test_utils.db import clear_db_dags, clear_db_runs
 
 
@@ -179,6 +182,31 @@ def test_trigger_lifecycle(session):
         job.runner.stop = True
 
 
+def test_trigger_runner_wakeup(session):
+    """
+    Checks that the trigger runner starts new triggers and hands their events over right away,
+    rather than on its next loop.
+    """
+    trigger_orm = Trigger.from_object(SuccessTrigger())
+    trigger_orm.id = 1
+    session.add(trigger_orm)
+    session.commit()
+    runner = TriggerRunner()
+    runner.daemon = True
+    runner.start()
+    try:
+        # Let the runner go idle
+        assert not runner.wait_for_events(0.2)
+        start = time.monotonic()
+        runner.update_triggers({1})
+        assert runner.wait_for_events(5)
+        assert time.monotonic() - start < 0.5
+        assert list(runner.events) == [(1, TriggerEvent(True))]
+    finally:
+        runner.stop = True
+        runner.join(5)
+
+
 def test_trigger_create_race_condition_18392(session, tmp_path):
     """
     This verifies the resolution of race condition documented in github issue #18392.
@@ -395,6 +423,60 @@ def test_trigger_failing(session):
         job.runner.stop = True
 
 
+def test_sharded_trigger_runner(session):
+    """
+    Checks that the triggers are run in shard subprocesses, and that a shard that dies is restarted
+    with its triggers without affecting the other shards.
+    """
+    for trigger_id, trigger in (
+        (1, SuccessTrigger()),
+        (2, FailureTrigger()),
+        (3, TimeDeltaTrigger(datetime.timedelta(days=7))),
+        (4, TimeDeltaTrigger(datetime.timedelta(days=7))),
+    ):
+        trigger_orm = Trigger.from_object(trigger)
+        trigger_orm.id = trigger_id
+        session.add(trigger_orm)
+    session.commit()
+    with conf_vars({("triggerer", "runner_processes"): "2"}):
+        job = TriggererJob()
+    runner = job.runner
+    assert isinstance(runner, ShardedTriggerRunner)
+    assert runner.shard_for(3) is not runner.shard_for(4)
+
+    def wait_for(condition, message):
+        # Wait for up to 10 seconds for the shards to report back
+        for _ in range(100):
+            runner.update_triggers({1, 2, 3, 4})
+            if condition():
+                return
+            time.sleep(0.1)
+        pytest.fail(message)
+
+    runner.start()
+    try:
+        wait_for(lambda: runner.events and runner.failed_triggers, "The shards never ran the triggers")
+        assert list(runner.events) == [(1, TriggerEvent(True))]
+        [(trigger_id, exc)] = runner.failed_triggers
+        assert trigger_id == 2
+        assert isinstance(exc, ValueError)
+        wait_for(lambda: runner.triggers == {3, 4}, "The shards never reported their triggers")
+
+        killed_shard, other_shard = runner.shard_for(3), runner.shard_for(4)
+        killed_pid, other_pid = killed_shard.pid, other_shard.pid
+        os.kill(killed_pid, signal.SIGKILL)
+        wait_for(lambda: killed_shard.pid != killed_pid, "The shard was never restarted")
+        wait_for(lambda: runner.triggers == {3, 4}, "The restarted shard never ran its triggers")
+        assert other_shard.pid == other_pid
+        # The triggers that already fired are not started again
+        assert list(runner.events) == [(1, TriggerEvent(True))]
+        assert len(runner.failed_triggers) == 1
+    finally:
+        runner.stop = True
+        runner.join(30)
+    assert not any(shard.is_alive() for shard in runner.shards)
+
+
 def test_trigger_cleanup(session):
     """
     Checks that the triggerer will correctly clean up triggers that do not
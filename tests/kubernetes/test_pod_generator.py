@@ -33,6 +33,7 @@ from airflow.exceptions import AirflowConfigException, PodReconciliationError
 from airflow.kubernetes.pod_generator import (
     PodDefaults,
     PodGenerator,
+    PodTemplateCache,
     datetime_to_label_safe_datestring,
     extend_object_field,
     merge_objects,
@@ -577,6 +578,91 @@ class TestPodGenerator:
         assert 'a' * 512 == result.metadata.annotations['dag_id']
         assert 'a' * 512 == result.metadata.annotations['task_id']
 
+    @pytest.mark.parametrize(
+        'executor_config',
+        [
+            pytest.param(None, id='no_executor_config'),
+            pytest.param(
+                k8s.V1Pod(
+                    metadata=k8s.V1ObjectMeta(labels={'app': 'override'}),
+                    spec=k8s.V1PodSpec(
+                        containers=[
+                            k8s.V1Container(
+                                name='',
+                                image='override-image',
+                                env=[k8s.V1EnvVar(name='OVERRIDE', value='1')],
+                                resources=k8s.V1ResourceRequirements(limits={'cpu': '1m'}),
+                            )
+                        ]
+                    ),
+                ),
+                id='executor_config',
+            ),
+        ],
+    )
+    @pytest.mark.parametrize('map_index', [-1, 2])
+    @mock.patch('uuid.uuid4')
+    def test_construct_pod_from_template(self, mock_uuid, map_index, executor_config):
+        mock_uuid.return_value = self.static_uuid
+        path = sys.path[0] + '/tests/kubernetes/pod_generator_base_with_secrets.yaml'
+        pod_args = dict(
+            dag_id='dag_id',
+            task_id='task_id',
+            pod_id='pod_id',
+            try_number=3,
+            date=self.execution_date,
+            args=['command'],
+            namespace='namespace',
+            scheduler_job_id='uuid',
+            run_id='run_id',
+            map_index=map_index,
+        )
+
+        expected = PodGenerator.construct_pod(
+            kube_image='test-image',
+            pod_override_object=executor_config,
+            base_worker_pod=PodGenerator.deserialize_model_file(path),
+            **pod_args,
+        )
+        pod_template = PodTemplateCache('test-image').get_pod_template(path, executor_config)
+        result = PodGenerator.construct_pod_from_template(pod_template=pod_template, **pod_args)
+
+        assert self.k8s_client.sanitize_for_serialization(
+            result
+        ) == self.k8s_client.sanitize_for_serialization(expected)
+        # The template is not modified by the pods constructed from it
+        assert result.spec.containers[0].env[-1].name == 'AIRFLOW_IS_K8S_EXECUTOR_POD'
+        assert pod_template.spec.containers[0].env[-1].name != 'AIRFLOW_IS_K8S_EXECUTOR_POD'
+
+    def test_pod_template_cache(self, tmp_path):
+        template_file = tmp_path / 'pod_template.yaml'
+        with open(sys.path[0] + '/tests/kubernetes/pod_generator_base.yaml') as f:
+            template_file.write_text(f.read())
+        executor_config = k8s.V1Pod(spec=k8s.V1PodSpec(containers=[k8s.V1Container(name='', image='a')]))
+        cache = PodTemplateCache('test-image', max_size=2)
+
+        with mock.patch.object(
+            PodGenerator, 'deserialize_model_file', wraps=PodGenerator.deserialize_model_file
+        ) as mock_deserialize:
+            template = cache.get_pod_template(str(template_file), executor_config)
+            # An equal executor_config shares the same template
+            same_config = k8s.V1Pod(spec=k8s.V1PodSpec(containers=[k8s.V1Container(name='', image='a')]))
+            assert cache.get_pod_template(str(template_file), same_config) is template
+            assert mock_deserialize.call_count == 1
+            assert template.spec.containers[0].image == 'a'
+
+            no_config_template = cache.get_pod_template(str(template_file), None)
+            assert no_config_template is not template
+            assert no_config_template.spec.containers[0].image == 'test-image'
+            assert mock_deserialize.call_count == 2
+
+            # The templates are read again when the pod_template_file is modified
+            stat = template_file.stat()
+            os.utime(template_file, (stat.st_atime, stat.st_mtime + 10))
+            assert cache.get_pod_template(str(template_file), executor_config) is not template
+            assert mock_deserialize.call_count == 3
+            assert len(cache._templates) == 2
+
     def test_merge_objects_empty(self):
         annotations = {'foo1': 'bar1'}
         base_obj = k8s.V1ObjectMeta(annotations=annotations)
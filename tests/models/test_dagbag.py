@@ -981,6 +981,49 @@ class TestDagBag:
         assert set(updated_ser_dag_1.tags) == {"example", "example2", "new_tag"}
         assert updated_ser_dag_1_update_time > ser_dag_1_update_time
 
+    @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_UPDATE_INTERVAL", 5)
+    @patch("airflow.models.dagbag.settings.MIN_SERIALIZED_DAG_FETCH_INTERVAL", 5)
+    def test_get_dag_with_incremental_db_refresh(self):
+        """
+        Test that only the Serialized DAGs updated since the last sync are refreshed in the
+        DagBag, and that deleted ones are removed.
+        """
+        db.clear_db_serialized_dags()
+        example_dags = DagBag(include_examples=True).dags
+        dag_ids = ["example_bash_operator", "example_branch_operator", "example_python_operator"]
+
+        with freeze_time(tz.datetime(2020, 1, 5, 0, 0, 0)):
+            for dag_id in dag_ids:
+                SerializedDagModel.write_dag(dag=example_dags[dag_id])
+
+            dag_bag = DagBag(read_dags_from_db=True, incremental_db_refresh=True)
+            for dag_id in dag_ids:
+                dag_bag.get_dag(dag_id)
+            unchanged_dag = dag_bag.dags["example_branch_operator"]
+
+        # Nothing is fetched until min_serialized_dag_fetch_interval has passed
+        with freeze_time(tz.datetime(2020, 1, 5, 0, 0, 4)):
+            with assert_queries_count(0):
+                for dag_id in dag_ids:
+                    dag_bag.get_dag(dag_id)
+
+        with freeze_time(tz.datetime(2020, 1, 5, 0, 0, 6)):
+            example_dags["example_bash_operator"].tags += ["new_tag"]
+            SerializedDagModel.write_dag(dag=example_dags["example_bash_operator"])
+            SerializedDagModel.remove_dag("example_python_operator")
+
+        # One sync finds the changed and deleted DAGs for all the DAGs in the bag
+        with freeze_time(tz.datetime(2020, 1, 5, 0, 0, 12)):
+            with assert_queries_count(3):
+                dag_bag.get_dag("example_bash_operator")
+                dag_bag.get_dag("example_branch_operator")
+            assert "example_python_operator" not in dag_bag.dags
+            assert dag_bag.get_dag("example_python_operator") is None
+
+        assert "new_tag" in dag_bag.dags["example_bash_operator"].tags
+        assert dag_bag.dags["example_branch_operator"] is unchanged_dag
+        assert dag_bag.db_sync_watermark == tz.datetime(2020, 1, 5, 0, 0, 6)
+
     def test_collect_dags_from_db(self):
         """DAGs are collected from Database"""
         db.clear_db_dags()
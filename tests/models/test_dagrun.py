@@ -41,6 +41,7 @@ from airflow.utils.state import DagRunState, State, TaskInstanceState
 from airflow.utils.trigger_rule import TriggerRule
 from airflow.utils.types import DagRunType
 from tests.models import DEFAULT_DATE as _DEFAULT_DATE
+from tests.test_utils.asserts import assert_queries_count
 from tests.test_utils.db import (
     clear_db_dags,
     clear_db_datasets,
@@ -1830,6 +1831,47 @@ def test_schedule_tis_map_index(dag_maker, session):
     assert ti2.state == TaskInstanceState.SUCCESS
 
 
+def test_bulk_schedule_tis(dag_maker, session):
+    with dag_maker(session=session, dag_id="test_bulk_schedule_tis"):
+        task_1 = BaseOperator(task_id='task_1')
+        task_2 = BaseOperator(task_id='task_2')
+
+    dr1 = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+    dr2 = dag_maker.create_dagrun_after(dr1, run_type=DagRunType.SCHEDULED)
+    dr3 = dag_maker.create_dagrun_after(dr2, run_type=DagRunType.SCHEDULED)
+
+    tis_by_run = DagRun.fetch_task_instances_for_runs([dr1, dr2, dr3], session=session)
+    assert {key: sorted(ti.task_id for ti in tis) for key, tis in tis_by_run.items()} == {
+        (dr.dag_id, dr.run_id): [task_1.task_id, task_2.task_id] for dr in (dr1, dr2, dr3)
+    }
+
+    def tis_to_schedule(dr, *task_ids):
+        tis = [ti for ti in tis_by_run[dr.dag_id, dr.run_id] if ti.task_id in task_ids]
+        for ti in tis:
+            ti.task = dag_maker.dag.get_task(ti.task_id)
+        return tis
+
+    schedulable_tis_by_run = {
+        (dr1.dag_id, dr1.run_id): tis_to_schedule(dr1, task_1.task_id),
+        (dr2.dag_id, dr2.run_id): tis_to_schedule(dr2, task_1.task_id),
+        (dr3.dag_id, dr3.run_id): tis_to_schedule(dr3, task_1.task_id, task_2.task_id),
+    }
+    # dr1 and dr2 schedule the same task, so they are updated together
+    with assert_queries_count(2):
+        assert DagRun.bulk_schedule_tis(schedulable_tis_by_run, session=session) == 4
+
+    session.expire_all()
+    states = {(ti.run_id, ti.task_id): ti.state for ti in session.query(TI).filter(TI.dag_id == dr1.dag_id)}
+    assert states == {
+        (dr1.run_id, "task_1"): TaskInstanceState.SCHEDULED,
+        (dr1.run_id, "task_2"): None,
+        (dr2.run_id, "task_1"): TaskInstanceState.SCHEDULED,
+        (dr2.run_id, "task_2"): None,
+        (dr3.run_id, "task_1"): TaskInstanceState.SCHEDULED,
+        (dr3.run_id, "task_2"): TaskInstanceState.SCHEDULED,
+    }
+
+
 def test_mapped_expand_kwargs(dag_maker):
     with dag_maker():
 
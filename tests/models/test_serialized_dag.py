@@ -26,8 +26,10 @@ from parameterized import parameterized, parameterized_class
 from airflow import DAG, example_dags as example_dags_module
 from airflow.models import DagBag
 from airflow.models.dagcode import DagCode
-from airflow.models.serialized_dag import SerializedDagModel as SDM
+from airflow.models.serialized_dag import MSGPACK_MARKER, MSGPACK_ZLIB_MARKER, SerializedDagModel as SDM
+from airflow.operators.python import PythonOperator
 from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.utils import timezone
 from airflow.utils.session import create_session
 from tests.test_utils.asserts import assert_queries_count
 
@@ -48,22 +50,30 @@ def clear_db_serialized_dags():
     [
         {"compress_serialized_dags": "False"},
         {"compress_serialized_dags": "True"},
+        {"compress_serialized_dags": False, "serialized_dag_format": "msgpack"},
+        {"compress_serialized_dags": True, "serialized_dag_format": "msgpack"},
     ]
 )
 class SerializedDagModelTest(unittest.TestCase):
     """Unit tests for SerializedDagModel."""
 
     compress_serialized_dags = "False"
+    serialized_dag_format = "json"
 
     def setUp(self):
         self.patcher = mock.patch(
             'airflow.models.serialized_dag.COMPRESS_SERIALIZED_DAGS', self.compress_serialized_dags
         )
         self.patcher.start()
+        self.format_patcher = mock.patch(
+            'airflow.models.serialized_dag.SERIALIZED_DAG_FORMAT', self.serialized_dag_format
+        )
+        self.format_patcher.start()
 
         clear_db_serialized_dags()
 
     def tearDown(self):
+        self.format_patcher.stop()
         self.patcher.stop()
         clear_db_serialized_dags()
 
@@ -184,6 +194,40 @@ class SerializedDagModelTest(unittest.TestCase):
         SDM.remove_deleted_dags(example_dag_files)
         assert not SDM.has_dag(dag_removed_by_file.dag_id)
 
+    def test_read_dags_written_in_other_format(self):
+        """Rows written in JSON and MessagePack can be read side by side, with the same hash."""
+        example_dags = make_example_dags(example_dags_module)
+        dag_ids = ["example_bash_operator", "example_python_operator"]
+        other_format = "json" if self.serialized_dag_format == "msgpack" else "msgpack"
+        with mock.patch('airflow.models.serialized_dag.SERIALIZED_DAG_FORMAT', other_format):
+            other_sdm = SDM(example_dags[dag_ids[0]])
+            SDM.write_dag(example_dags[dag_ids[0]])
+        SDM.write_dag(example_dags[dag_ids[1]])
+
+        assert other_sdm.dag_hash == SDM(example_dags[dag_ids[0]]).dag_hash
+        with create_session() as session:
+            for dag_id in dag_ids:
+                row = session.query(SDM).filter(SDM.dag_id == dag_id).one()
+                assert set(row.dag.task_dict) == set(example_dags[dag_id].task_dict)
+                SerializedDAG.validate_schema(row.data)
+
+    def test_non_str_dict_keys_round_trip(self):
+        """Dict keys that are not strings are read back as strings, as from JSON."""
+        with DAG("non_str_keys", start_date=timezone.datetime(2022, 1, 1), schedule=None) as dag:
+            PythonOperator(task_id="task", python_callable=print, op_kwargs={1: "x", 2: "y"})
+        SDM.write_dag(dag)
+        with create_session() as session:
+            row = session.query(SDM).filter(SDM.dag_id == "non_str_keys").one()
+            assert row.dag.get_task("task").op_kwargs == {"1": "x", "2": "y"}
+
+    def test_msgpack_not_installed(self):
+        """Serialized DAGs are stored as JSON when msgpack is not installed."""
+        dag = make_example_dags(example_dags_module)["example_bash_operator"]
+        with mock.patch("airflow.models.serialized_dag._msgpack_installed", return_value=False):
+            sdm = SDM(dag)
+        assert not (sdm._data_compressed or b"").startswith((MSGPACK_MARKER, MSGPACK_ZLIB_MARKER))
+        assert set(sdm.dag.task_dict) == set(dag.task_dict)
+
     def test_bulk_sync_to_db(self):
         dags = [
             DAG("dag_1"),
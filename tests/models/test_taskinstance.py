@@ -2843,6 +2843,36 @@ def test_refresh_from_task(pool_override):
     assert ti.max_tries == expected_max_tries
 
 
+@pytest.mark.parametrize(
+    "max_groups, temp_table_threshold",
+    [
+        pytest.param(32, "0", id="grouped"),
+        pytest.param(1, "0", id="tuple-in"),
+        pytest.param(1, "1", id="temp-table"),
+    ],
+)
+def test_filter_for_tis(dag_maker, session, max_groups, temp_table_threshold):
+    with dag_maker("test_filter_for_tis", session=session):
+        for task_id in ("t1", "t2", "t3"):
+            EmptyOperator(task_id=task_id)
+    dr1 = dag_maker.create_dagrun(run_id="run_1", execution_date=DEFAULT_DATE)
+    dr2 = dag_maker.create_dagrun(run_id="run_2", execution_date=DEFAULT_DATE + datetime.timedelta(days=1))
+    all_tis = dr1.task_instances + dr2.task_instances
+    same_run = [ti for ti in dr1.task_instances if ti.task_id != "t3"]
+    same_task = [ti for ti in all_tis if ti.task_id == "t2"]
+    mixed = same_run + [ti for ti in dr2.task_instances if ti.task_id == "t3"]
+
+    with mock.patch("airflow.models.taskinstance._FILTER_FOR_TIS_MAX_GROUPS", max_groups), conf_vars(
+        {("database", "filter_temp_table_threshold"): temp_table_threshold}
+    ):
+        for tis in (same_run, same_task, mixed, all_tis):
+            with TI.filter_for_many_tis((ti.key for ti in tis), session=session) as filter_for_tis:
+                selected = {ti.key for ti in session.query(TI).filter(filter_for_tis)}
+            assert selected == {ti.key for ti in tis}
+        with TI.filter_for_many_tis([], session=session) as filter_for_tis:
+            assert filter_for_tis is None
+
+
 class TestRunRawTaskQueriesCount:
     """
     These tests are designed to detect changes in the number of queries executed
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import datetime
+from unittest import mock
 
 import pytest
 
@@ -101,7 +102,8 @@ def test_submit_event(session, create_task_instance):
     task_instance.next_kwargs = {"cheesecake": True}
     session.commit()
     # Call submit_event
-    Trigger.submit_event(trigger.id, TriggerEvent(42), session=session)
+    with mock.patch("airflow.models.trigger.Stats.timing") as mock_stats_timing:
+        Trigger.submit_event(trigger.id, TriggerEvent(42), session=session)
     # commit changes made by submit event and expire all cache to read from db.
     session.flush()
     session.expunge_all()
@@ -109,6 +111,61 @@ def test_submit_event(session, create_task_instance):
     updated_task_instance = session.query(TaskInstance).one()
     assert updated_task_instance.state == State.SCHEDULED
     assert updated_task_instance.next_kwargs == {"event": 42, "cheesecake": True}
+    # Check that the time from the deferral to the resumption is measured
+    mock_stats_timing.assert_called_once_with("triggers.defer_to_resume", mock.ANY)
+    assert mock_stats_timing.call_args[0][1] >= datetime.timedelta(0)
+
+
+def test_submit_events(session, create_task_instance):
+    """
+    Tests that events submitted in bulk re-wake the deferred task instances
+    of all their triggers, each with the first event of its trigger.
+    """
+    # Make three triggers
+    for trigger_id in (1, 2, 3):
+        trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+        trigger.id = trigger_id
+        session.add(trigger)
+    session.commit()
+    # Make two TaskInstances deferred on the first trigger, one on the second, and
+    # one that is no longer deferred on the third
+    task_instance = create_task_instance(
+        session=session, task_id="fake1", state=State.DEFERRED, execution_date=timezone.utcnow()
+    )
+    task_instance.trigger_id = 1
+    task_instance.next_kwargs = {"cheesecake": True}
+    for task_id, state, trigger_id in (
+        ("fake2", State.DEFERRED, 1),
+        ("fake3", State.DEFERRED, 2),
+        ("fake4", State.SUCCESS, 3),
+    ):
+        fake_task = EmptyOperator(task_id=task_id, dag=task_instance.task.dag)
+        other_task_instance = TaskInstance(task=fake_task, run_id=task_instance.run_id)
+        other_task_instance.state = state
+        other_task_instance.trigger_id = trigger_id
+        session.add(other_task_instance)
+    session.commit()
+    # Call submit_events
+    events = [(1, TriggerEvent(42)), (2, TriggerEvent("two")), (3, TriggerEvent(3)), (1, TriggerEvent(43))]
+    with mock.patch("airflow.models.trigger.Stats.timing") as mock_stats_timing:
+        Trigger.submit_events(events, session=session)
+    session.flush()
+    session.expunge_all()
+    # Check that only the deferred task instances are now scheduled, with their trigger's event
+    task_instances = {ti.task_id: ti for ti in session.query(TaskInstance)}
+    assert {task_id: ti.state for task_id, ti in task_instances.items()} == {
+        "fake1": State.SCHEDULED,
+        "fake2": State.SCHEDULED,
+        "fake3": State.SCHEDULED,
+        "fake4": State.SUCCESS,
+    }
+    assert task_instances["fake1"].next_kwargs == {"event": 42, "cheesecake": True}
+    assert task_instances["fake2"].next_kwargs == {"event": 42}
+    assert task_instances["fake3"].next_kwargs == {"event": "two"}
+    assert task_instances["fake4"].trigger_id == 3
+    assert all(task_instances[task_id].trigger_id is None for task_id in ("fake1", "fake2", "fake3"))
+    # Check that the resumption is measured once per trigger that resumed tasks
+    assert mock_stats_timing.call_count == 2
 
 
 def test_submit_failure(session, create_task_instance):
@@ -24,15 +24,21 @@ from datetime import time, timedelta
 import pytest
 
 from airflow import exceptions, settings
-from airflow.exceptions import AirflowException, AirflowSensorTimeout
+from airflow.exceptions import AirflowException, AirflowSensorTimeout, TaskDeferred
 from airflow.models import DagBag, DagRun, TaskInstance
 from airflow.models.dag import DAG
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.operators.bash import BashOperator
 from airflow.operators.empty import EmptyOperator
-from airflow.sensors.external_task import ExternalTaskMarker, ExternalTaskSensor, ExternalTaskSensorLink
+from airflow.sensors.external_task import (
+    ExternalTaskMarker,
+    ExternalTaskSensor,
+    ExternalTaskSensorAsync,
+    ExternalTaskSensorLink,
+)
 from airflow.sensors.time_sensor import TimeSensor
 from airflow.serialization.serialized_objects import SerializedBaseOperator
+from airflow.triggers.external_task import ExternalTaskTrigger
 from airflow.utils.session import provide_session
 from airflow.utils.state import DagRunState, State, TaskInstanceState
 from airflow.utils.task_group import TaskGroup
@@ -85,6 +91,29 @@ class TestExternalTaskSensor(unittest.TestCase):
         )
         op.run(start_date=DEFAULT_DATE, end_date=DEFAULT_DATE, ignore_ti_state=True)
 
+    def test_external_task_sensor_async(self):
+        op = ExternalTaskSensorAsync(
+            task_id='test_external_task_sensor_async_check',
+            external_dag_id=TEST_DAG_ID,
+            external_task_id=TEST_TASK_ID,
+            failed_states=["failed"],
+            dag=self.dag,
+        )
+        with pytest.raises(TaskDeferred) as exc_info:
+            op.execute({'logical_date': DEFAULT_DATE})
+        trigger = exc_info.value.trigger
+        assert isinstance(trigger, ExternalTaskTrigger)
+        assert trigger.execution_dates == [DEFAULT_DATE]
+        assert trigger.external_task_ids == [TEST_TASK_ID]
+        assert trigger.poke() is None
+
+        self.add_time_sensor()
+        assert trigger.poke() == {"status": "success"}
+        assert op.execute({'logical_date': DEFAULT_DATE}) is None
+        assert op.execute_complete({}, {"status": "success"}) is None
+        with pytest.raises(AirflowException, match="failed"):
+            op.execute_complete({}, {"status": "failed"})
+
     def test_external_task_sensor_multiple_task_ids(self):
         self.add_time_sensor(task_id=TEST_TASK_ID)
         self.add_time_sensor(task_id=TEST_TASK_ID_ALTERNATE)
@@ -316,6 +345,28 @@ class TestExternalTaskSensor(unittest.TestCase):
         )
         op.run(start_date=DEFAULT_DATE, end_date=DEFAULT_DATE, ignore_ti_state=True)
 
+    def test_external_dag_sensor_async_failed_states(self):
+        other_dag = DAG('other_dag', default_args=self.args, end_date=DEFAULT_DATE, schedule='@once')
+        dag_run = other_dag.create_dagrun(
+            run_id='test', start_date=DEFAULT_DATE, execution_date=DEFAULT_DATE, state=State.RUNNING
+        )
+        op = ExternalTaskSensorAsync(
+            task_id='test_external_dag_sensor_async_check',
+            external_dag_id='other_dag',
+            failed_states=[State.FAILED],
+            dag=self.dag,
+        )
+        with pytest.raises(TaskDeferred) as exc_info:
+            op.execute({'logical_date': DEFAULT_DATE})
+        trigger = exc_info.value.trigger
+        assert trigger.external_task_ids is None
+        assert trigger.poke() is None
+
+        dag_run.set_state(State.FAILED)
+        settings.Session().merge(dag_run)
+        settings.Session().commit()
+        assert trigger.poke() == {"status": "failed"}
+
     def test_external_dag_sensor_soft_fail_as_skipped(self):
         other_dag = DAG('other_dag', default_args=self.args, end_date=DEFAULT_DATE, schedule='@once')
         other_dag.create_dagrun(
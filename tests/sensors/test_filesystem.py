@@ -20,12 +20,15 @@ from __future__ import annotations
 import os
 import shutil
 import tempfile
+from unittest import mock
 
 import pytest
 
-from airflow.exceptions import AirflowSensorTimeout
+from airflow.exceptions import AirflowSensorTimeout, TaskDeferred
+from airflow.models.connection import Connection
 from airflow.models.dag import DAG
-from airflow.sensors.filesystem import FileSensor
+from airflow.sensors.filesystem import FileSensor, FileSensorAsync
+from airflow.triggers.file import FileTrigger
 from airflow.utils.timezone import datetime
 
 TEST_DAG_ID = 'unit_tests_file_sensor'
@@ -216,3 +219,36 @@ class TestFileSensor:
         with pytest.raises(AirflowSensorTimeout):
             task.run(start_date=DEFAULT_DATE, end_date=DEFAULT_DATE, ignore_ti_state=True)
             shutil.rmtree(temp_dir)
+
+
+@mock.patch('airflow.hooks.filesystem.FSHook.get_connection', return_value=Connection(conn_type='fs'))
+class TestFileSensorAsync:
+    def setup_method(self):
+        args = {'owner': 'airflow', 'start_date': DEFAULT_DATE}
+        self.dag = DAG(TEST_DAG_ID + 'test_async', default_args=args)
+
+    def test_file_present(self, mock_get_connection, tmp_path):
+        (tmp_path / 'data.csv').write_text('')
+        task = FileSensorAsync(
+            task_id='test', filepath=str(tmp_path / '*.csv'), fs_conn_id='fs_default', dag=self.dag
+        )
+        assert task.execute({}) is None
+
+    def test_defers_until_file_lands(self, mock_get_connection, tmp_path):
+        task = FileSensorAsync(
+            task_id='test',
+            filepath=str(tmp_path / '*.csv'),
+            fs_conn_id='fs_default',
+            dag=self.dag,
+            poke_interval=5,
+            exponential_backoff=True,
+            timeout=600,
+        )
+        with pytest.raises(TaskDeferred) as exc_info:
+            task.execute({})
+        trigger = exc_info.value.trigger
+        assert isinstance(trigger, FileTrigger)
+        assert trigger.filepath == str(tmp_path / '*.csv')
+        assert (trigger.poke_interval, trigger.backoff_factor, trigger.max_poke_interval) == (5, 2.0, 600)
+        assert exc_info.value.method_name == 'execute_complete'
+        assert exc_info.value.timeout.total_seconds() == 600
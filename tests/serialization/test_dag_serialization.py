@@ -25,6 +25,7 @@ import json
 import multiprocessing
 import os
 import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from glob import glob
 from pathlib import Path
@@ -373,6 +374,17 @@ class TestStringifiedDAGs:
         # Compares with the ground truth of JSON string.
         self.validate_serialized_dag(serialized_dags['simple_dag'], serialized_simple_dag_ground_truth)
 
+    def test_msgpack_roundtrip(self):
+        """MessagePack encoding should deserialize to the same DAG as JSON."""
+        pytest.importorskip("msgpack")
+
+        dag = make_simple_dag()["simple_dag"]
+        json_dag = SerializedDAG.from_json(SerializedDAG.to_json(dag))
+        msgpack_dag = SerializedDAG.from_msgpack(SerializedDAG.to_msgpack(dag))
+
+        assert SerializedDAG.to_dict(msgpack_dag) == SerializedDAG.to_dict(json_dag)
+        self.validate_deserialized_dag(msgpack_dag, dag)
+
     @pytest.mark.parametrize(
         "timetable, serialized_timetable",
         [
@@ -1217,6 +1229,73 @@ class TestStringifiedDAGs:
         assert deserialized_task.resources == task.resources
         assert isinstance(deserialized_task.resources, Resources)
 
+    @conf_vars({("core", "lazy_load_serialized_operators"): "True"})
+    def test_lazy_operator_deserialization(self):
+        """
+        Test attributes not needed for scheduling are only deserialized on first access.
+        """
+        with DAG("test_lazy_operator_deserialization", start_date=datetime(2020, 1, 1)) as dag:
+            task = BashOperator(
+                task_id="task1",
+                bash_command="true",
+                params={"my_param": Param(1, type="integer")},
+                resources={"cpus": 0.1, "ram": 2048},
+                executor_config={"pod_override": k8s.V1Pod(metadata=k8s.V1ObjectMeta(name="x"))},
+            )
+
+        deserialized_task = SerializedDAG.from_json(SerializedDAG.to_json(dag)).get_task("task1")
+        assert {"params", "resources", "executor_config"} <= deserialized_task._deferred_fields.keys()
+        assert deserialized_task.trigger_rule == task.trigger_rule
+        assert deserialized_task.bash_command == "true"
+
+        assert deserialized_task.resources == task.resources
+        assert deserialized_task.params.get_param("my_param").value == 1
+        assert "resources" not in deserialized_task._deferred_fields
+        assert "params" not in deserialized_task._deferred_fields
+
+        # Copies get all the pending attributes.
+        copied_task = copy.deepcopy(deserialized_task)
+        assert not deserialized_task._deferred_fields
+        assert PodGenerator.serialize_pod(copied_task.executor_config["pod_override"]) == (
+            PodGenerator.serialize_pod(task.executor_config["pod_override"])
+        )
+
+        # Assigning an attribute discards the pending value.
+        lazy_task = SerializedDAG.from_json(SerializedDAG.to_json(dag)).get_task("task1")
+        lazy_task.resources = None
+        assert lazy_task.resources is None
+
+    @conf_vars({("core", "lazy_load_serialized_operators"): "True"})
+    def test_lazy_operator_deserialization_keeps_state_at_load_time(self):
+        """
+        Test pending attributes are decoded as they would have been when the operator was loaded.
+        """
+        with DAG("test_lazy_operator_state", start_date=datetime(2020, 1, 1)) as dag:
+            CustomOperator(task_id="task1", bash_command="true")
+        serialized = SerializedDAG.to_json(dag)
+
+        with mock.patch.object(SerializedDAG, "_load_operator_extra_links", False):
+            deserialized_task = SerializedDAG.from_json(serialized).get_task("task1")
+        assert "operator_extra_links" in deserialized_task._deferred_fields
+        # The pending values do not keep the whole encoded operator alive
+        for decode in deserialized_task._deferred_fields.values():
+            assert not any(isinstance(arg, dict) and "task_id" in arg for arg in decode.args)
+        assert deserialized_task.operator_extra_links == []
+
+    @conf_vars({("core", "lazy_load_serialized_operators"): "True"})
+    def test_lazy_operator_deserialization_threads(self):
+        """
+        Test threads reading a pending attribute at the same time all get the same value.
+        """
+        with DAG("test_lazy_operator_threads", start_date=datetime(2020, 1, 1)) as dag:
+            BashOperator(task_id="task1", bash_command="true", params={"my_param": 1})
+        deserialized_task = SerializedDAG.from_json(SerializedDAG.to_json(dag)).get_task("task1")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = list(executor.map(lambda _: deserialized_task.params, range(32)))
+        assert all(value is values[0] for value in values)
+        assert values[0]["my_param"] == 1
+
     def test_task_group_serialization(self):
         """
         Test TaskGroup serialization/deserialization.
@@ -1265,6 +1344,52 @@ class TestStringifiedDAGs:
 
         check_task_group(serialized_dag.task_group)
 
+    def test_topology_index(self):
+        """
+        Test the topology index built on deserialization gives the same answers as the DAG.
+        """
+        from airflow.operators.empty import EmptyOperator
+
+        with DAG("test_topology_index", start_date=datetime(2020, 1, 1)) as dag:
+            task1 = EmptyOperator(task_id="task1")
+            with TaskGroup("group23") as group23:
+                task2 = EmptyOperator(task_id="task2")
+                task3 = EmptyOperator(task_id="task3")
+                task2 >> task3
+            task4 = EmptyOperator(task_id="task4")
+            task5 = EmptyOperator(task_id="task5")
+            task1 >> group23 >> task5
+            task4 >> task5
+
+        serialized_dag = SerializedDAG.deserialize_dag(SerializedDAG.serialize_dag(dag))
+        topology = serialized_dag._topology_index
+        assert topology is not None
+        # The index is only built as it is used
+        assert not vars(topology).keys() - {"_dag"}
+
+        assert [t.task_id for t in serialized_dag.roots] == [t.task_id for t in dag.roots]
+        assert "topological_order" not in vars(topology)
+        assert "_descendants" not in vars(topology)
+        assert [t.task_id for t in serialized_dag.leaves] == [t.task_id for t in dag.leaves]
+        assert [t.task_id for t in serialized_dag.topological_sort()] == [
+            t.task_id for t in dag.topological_sort()
+        ]
+        for task in dag.tasks:
+            serialized_task = serialized_dag.get_task(task.task_id)
+            for upstream in (False, True):
+                assert serialized_task.get_flat_relative_ids(upstream) == task.get_flat_relative_ids(upstream)
+
+        subset = serialized_dag.partial_subset(
+            "group23.task2", include_downstream=True, include_upstream=True
+        )
+        assert subset._topology_index is None
+        assert set(subset.task_dict) == {"task1", "group23.task2", "group23.task3", "task5"}
+
+        # Adding a dependency invalidates the index.
+        serialized_dag.get_task("task4") >> serialized_dag.get_task("group23.task3")
+        assert serialized_dag._topology_index is None
+        assert serialized_dag.get_task("task4").get_flat_relative_ids() == {"group23.task3", "task5"}
+
     def test_deps_sorted(self):
         """
         Tests serialize_operator, make sure the deps is in order
@@ -0,0 +1,103 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Times executor heartbeats under a large backlog of queued tasks.
+
+The executor starts with ``backlog`` queued tasks of random priorities, and every heartbeat
+queues ``tasks_per_heartbeat`` more tasks and then triggers ``parallelism`` of them. The time
+spent in ``trigger_tasks`` is compared with the previous implementation, which sorted all the
+queued tasks on every heartbeat.
+
+To Run:
+    $ python tests/test_utils/perf/executor_heartbeat.py [backlog] [heartbeats]
+"""
+from __future__ import annotations
+
+import logging
+import random
+import sys
+from datetime import datetime
+from time import perf_counter
+from types import SimpleNamespace
+
+from airflow.executors.base_executor import BaseExecutor
+from airflow.models.taskinstance import TaskInstanceKey
+
+TASKS_PER_HEARTBEAT = 100
+PARALLELISM = 64
+
+
+class NoopExecutor(BaseExecutor):
+    """Executor which considers the tasks running as soon as they are triggered."""
+
+    def execute_async(self, key, command, queue=None, executor_config=None):
+        pass
+
+    def sync(self):
+        # The tasks finish right away, so all the slots are open again
+        self.running.clear()
+
+
+class SortingExecutor(NoopExecutor):
+    """Triggers the tasks like the executors did before the queued tasks were kept in a heap."""
+
+    def trigger_tasks(self, open_slots):
+        sorted_queue = sorted(self.queued_tasks.items(), key=lambda x: x[1][1], reverse=True)
+        task_tuples = []
+        for _ in range(min((open_slots, len(self.queued_tasks)))):
+            key, (command, _, queue, ti) = sorted_queue.pop(0)
+            task_tuples.append((key, command, queue, ti.executor_config))
+        if task_tuples:
+            self._process_tasks(task_tuples)
+
+
+def _queue_tasks(executor: BaseExecutor, start: int, count: int) -> None:
+    execution_date = datetime(2022, 1, 1)
+    for index in range(start, start + count):
+        ti = SimpleNamespace(
+            key=TaskInstanceKey("perf_dag", f"task_{index}", execution_date, 1), executor_config=None
+        )
+        executor.queue_command(ti, ["airflow", "tasks", "run"], priority=random.randint(1, 1000))
+
+
+def _time_heartbeats(executor: BaseExecutor, backlog: int, heartbeats: int) -> float:
+    """Returns the average time in milliseconds spent triggering the tasks of a heartbeat."""
+    random.seed(0)
+    _queue_tasks(executor, 0, backlog)
+    elapsed = 0.0
+    for heartbeat in range(heartbeats):
+        _queue_tasks(executor, backlog + heartbeat * TASKS_PER_HEARTBEAT, TASKS_PER_HEARTBEAT)
+        start = perf_counter()
+        executor.trigger_tasks(PARALLELISM - len(executor.running))
+        elapsed += perf_counter() - start
+        executor.sync()
+    return elapsed * 1000.0 / heartbeats
+
+
+def main(backlog: int = 50_000, heartbeats: int = 50) -> None:
+    # The logs of each queued task would dominate the timings
+    logging.disable(logging.INFO)
+    print(f"{backlog} queued tasks, {heartbeats} heartbeats of {PARALLELISM} triggered tasks\n")
+    print(f"{'implementation':<16}{'trigger_tasks (ms)':>20}")
+    for name, executor_class in (("sorted", SortingExecutor), ("heap", NoopExecutor)):
+        executor = executor_class(parallelism=PARALLELISM)
+        print(f"{name:<16}{_time_heartbeats(executor, backlog, heartbeats):>20.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
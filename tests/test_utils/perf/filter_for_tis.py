@@ -0,0 +1,92 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measures the time to select task instances by key with the strategies of ``TaskInstance.filter_for_tis``.
+
+For every number of keys, the keys of the task instances of 10 DAG runs are selected with a
+row-value IN and with the OR of one IN per DAG run ``filter_for_tis`` builds for them. Keys spread
+over too many DAG runs to be grouped are selected with a row-value IN and through a temporary table.
+The keys do not need to exist: what is measured is building, compiling, planning and running the query
+on the configured metadata database.
+
+To Run:
+    $ python tests/test_utils/perf/filter_for_tis.py [keys ...]
+"""
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+from airflow.models.taskinstance import TaskInstance, TaskInstanceKey
+from airflow.utils.session import create_session
+from airflow.utils.sqlalchemy import tuple_in_condition, tuple_in_temp_table
+
+TI = TaskInstance
+
+
+def _keys(num_keys: int, num_runs: int) -> list[TaskInstanceKey]:
+    return [
+        TaskInstanceKey("perf_dag", f"task_{index // num_runs}", f"run_{index % num_runs}", 1, -1)
+        for index in range(num_keys)
+    ]
+
+
+def select_tuple_in(keys: list[TaskInstanceKey], session) -> None:
+    condition = tuple_in_condition(
+        (TI.dag_id, TI.task_id, TI.run_id, TI.map_index), (key.primary for key in keys)
+    )
+    session.query(TI.dag_id).filter(condition).all()
+
+
+def select_filter_for_tis(keys: list[TaskInstanceKey], session) -> None:
+    session.query(TI.dag_id).filter(TI.filter_for_tis(keys)).all()
+
+
+def select_temp_table(keys: list[TaskInstanceKey], session) -> None:
+    with tuple_in_temp_table(
+        (TI.dag_id, TI.task_id, TI.run_id, TI.map_index), (key.primary for key in keys), session=session
+    ) as condition:
+        session.query(TI.dag_id).filter(condition).all()
+
+
+def main(*key_counts: int) -> None:
+    with create_session() as session:
+        # Warm up the mappers and the connection pool
+        select_tuple_in(_keys(10, 1), session)
+    print(f"{'keys':>8}  {'runs':>6}  {'strategy':<16}{'seconds':>10}")
+    for num_keys in key_counts or (1_000, 10_000, 100_000):
+        for num_runs, strategies in (
+            (10, (("tuple-in", select_tuple_in), ("grouped", select_filter_for_tis))),
+            (num_keys // 10, (("tuple-in", select_tuple_in), ("temp-table", select_temp_table))),
+        ):
+            keys = _keys(num_keys, num_runs)
+            for name, select in strategies:
+                with create_session() as session:
+                    start = perf_counter()
+                    try:
+                        select(keys, session)
+                    except Exception as e:
+                        result = f"failed: {type(e).__name__}"
+                    else:
+                        result = f"{perf_counter() - start:>10.3f}"
+                    session.rollback()
+                print(f"{num_keys:>8}  {num_runs:>6}  {name:<16}{result}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
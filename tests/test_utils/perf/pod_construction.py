@@ -0,0 +1,96 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measures the number of worker pods the KubernetesExecutor constructs per second.
+
+The pods are constructed from the example pod_template_file and an executor_config overriding
+the resources of the base container, by reading and reconciling the template for every pod as
+the executor used to, and from the templates cached by ``PodTemplateCache``.
+
+To Run:
+    $ python tests/test_utils/perf/pod_construction.py [pods]
+"""
+from __future__ import annotations
+
+import os
+import sys
+from time import perf_counter
+
+from kubernetes.client import models as k8s
+
+import airflow
+from airflow.kubernetes.pod_generator import PodGenerator, PodTemplateCache
+
+POD_TEMPLATE_FILE = os.path.join(
+    os.path.dirname(airflow.__file__),
+    "kubernetes",
+    "pod_template_file_examples",
+    "dags_in_image_template.yaml",
+)
+EXECUTOR_CONFIG = k8s.V1Pod(
+    spec=k8s.V1PodSpec(
+        containers=[
+            k8s.V1Container(
+                name="base", resources=k8s.V1ResourceRequirements(limits={"cpu": "1", "memory": "1G"})
+            )
+        ]
+    )
+)
+
+
+def _pod_args(index: int) -> dict:
+    return dict(
+        dag_id="perf_dag",
+        task_id=f"task_{index}",
+        pod_id=f"perfdagtask{index}",
+        try_number=1,
+        date=None,
+        args=["airflow", "tasks", "run", "perf_dag", f"task_{index}", "run_id"],
+        namespace="default",
+        scheduler_job_id="1",
+        run_id="run_id",
+    )
+
+
+def construct_pods(pods: int) -> None:
+    for index in range(pods):
+        PodGenerator.construct_pod(
+            kube_image="apache/airflow:latest",
+            pod_override_object=EXECUTOR_CONFIG,
+            base_worker_pod=PodGenerator.deserialize_model_file(POD_TEMPLATE_FILE),
+            **_pod_args(index),
+        )
+
+
+def construct_pods_from_template(pods: int) -> None:
+    cache = PodTemplateCache("apache/airflow:latest")
+    for index in range(pods):
+        pod_template = cache.get_pod_template(POD_TEMPLATE_FILE, EXECUTOR_CONFIG)
+        PodGenerator.construct_pod_from_template(pod_template=pod_template, **_pod_args(index))
+
+
+def main(pods: int = 2000) -> None:
+    print(f"{'implementation':<16}{'pods/s':>12}")
+    for name, construct in (("reconcile", construct_pods), ("cached", construct_pods_from_template)):
+        start = perf_counter()
+        construct(pods)
+        print(f"{name:<16}{pods / (perf_counter() - start):>12.0f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
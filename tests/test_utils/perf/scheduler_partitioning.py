@@ -0,0 +1,134 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measures how the throughput of examining DAG runs scales with the number of schedulers.
+
+Every scheduler is a process repeatedly locking the next DAG runs to examine, as the scheduler loop
+does with ``DagRun.next_dagruns_to_examine``, spending a fixed time per DAG run to stand for the
+scheduling decisions, and committing. The DAG runs examined per second by 1 to 4 schedulers are
+reported with all schedulers competing for all DAGs, and with the DAGs partitioned between them by
+``DagPartitioner``.
+
+The DAGs and DAG runs used are created in, and removed from, the configured metadata database, which
+needs to support ``SKIP LOCKED``, e.g. Postgres.
+
+To Run:
+    $ python tests/test_utils/perf/scheduler_partitioning.py [dags] [seconds]
+"""
+from __future__ import annotations
+
+import multiprocessing
+import sys
+import time
+from datetime import timedelta
+
+from airflow import settings
+from airflow.jobs.scheduler_job import DagPartitioner
+from airflow.models import DagModel, DagRun
+from airflow.utils import timezone
+from airflow.utils.session import create_session
+from airflow.utils.state import DagRunState
+from airflow.utils.types import DagRunType
+
+DAG_ID_PREFIX = "perf_scheduler_partitioning_"
+RUNS_PER_DAG = 4
+SECONDS_PER_DAG_RUN = 0.002
+
+
+def create_dag_runs(num_dags: int) -> list[str]:
+    dag_ids = [f"{DAG_ID_PREFIX}{index}" for index in range(num_dags)]
+    start = timezone.utcnow() - timedelta(days=RUNS_PER_DAG)
+    with create_session() as session:
+        session.add_all(DagModel(dag_id=dag_id, is_active=True, is_paused=False) for dag_id in dag_ids)
+        session.add_all(
+            DagRun(
+                dag_id=dag_id,
+                run_id=f"perf_{run}",
+                execution_date=start + timedelta(days=run),
+                state=DagRunState.RUNNING,
+                run_type=DagRunType.SCHEDULED,
+            )
+            for dag_id in dag_ids
+            for run in range(RUNS_PER_DAG)
+        )
+    return dag_ids
+
+
+def delete_dag_runs() -> None:
+    with create_session() as session:
+        session.query(DagRun).filter(DagRun.dag_id.startswith(DAG_ID_PREFIX)).delete(
+            synchronize_session=False
+        )
+        session.query(DagModel).filter(DagModel.dag_id.startswith(DAG_ID_PREFIX)).delete(
+            synchronize_session=False
+        )
+
+
+def examine_dag_runs(dag_ids: set[str] | None, seconds: float, examined: multiprocessing.Queue) -> None:
+    # Do not share the connections of the parent process
+    settings.engine.dispose()
+    count = 0
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        with create_session() as session:
+            dag_runs = DagRun.next_dagruns_to_examine(DagRunState.RUNNING, session, dag_ids=dag_ids).all()
+            for dag_run in dag_runs:
+                time.sleep(SECONDS_PER_DAG_RUN)
+                dag_run.last_scheduling_decision = timezone.utcnow()
+            count += len(dag_runs)
+    examined.put(count)
+
+
+def measure(partitions: list[set[str] | None], seconds: float) -> float:
+    examined: multiprocessing.Queue = multiprocessing.Queue()
+    schedulers = [
+        multiprocessing.Process(target=examine_dag_runs, args=(dag_ids, seconds, examined))
+        for dag_ids in partitions
+    ]
+    for scheduler in schedulers:
+        scheduler.start()
+    total = sum(examined.get() for _ in schedulers)
+    for scheduler in schedulers:
+        scheduler.join()
+    return total / seconds
+
+
+def main(num_dags: int = 400, seconds: float = 20.0) -> None:
+    if settings.engine.dialect.name == "sqlite":
+        sys.exit("Multiple schedulers need a database supporting SKIP LOCKED, e.g. Postgres")
+    delete_dag_runs()
+    dag_ids = create_dag_runs(num_dags)
+    try:
+        print(f"{'schedulers':>10}  {'shared':>14}  {'partitioned':>14}  (DAG runs examined per second)")
+        for num_schedulers in range(1, 5):
+            partitioner = DagPartitioner(refresh_interval=0)
+            partitioner.live_job_ids = list(range(1, num_schedulers + 1))
+            owners = partitioner.owners(dag_ids)
+            partitions = [
+                {dag_id for dag_id, owner in owners.items() if owner == job_id}
+                for job_id in partitioner.live_job_ids
+            ]
+            shared = measure([None] * num_schedulers, seconds)
+            partitioned = measure(partitions, seconds)
+            print(f"{num_schedulers:>10}  {shared:>14.0f}  {partitioned:>14.0f}")
+    finally:
+        delete_dag_runs()
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]), *(float(arg) for arg in sys.argv[2:3]))
@@ -0,0 +1,88 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Compares the JSON and MessagePack storage formats of serialized DAGs on the example DAGs.
+
+For every format the size of the stored blob and the time to encode and decode it is
+measured, both with and without zlib compression. Only the encoding itself is timed,
+turning the decoded dict into a DAG costs the same for all formats.
+
+To Run:
+    $ python tests/test_utils/perf/serialized_dag_format.py [repeat_count]
+"""
+from __future__ import annotations
+
+import sys
+import zlib
+from time import perf_counter
+from typing import Any, Callable
+
+import msgpack
+
+from airflow.models import DagBag
+from airflow.serialization.serialized_objects import SerializedDAG
+from airflow.settings import json
+
+FORMATS: dict[str, tuple[Callable[[Any], bytes], Callable[[bytes], Any]]] = {
+    "json": (
+        lambda data: json.dumps(data).encode("utf-8"),
+        lambda blob: json.loads(blob),
+    ),
+    "json+zlib": (
+        lambda data: zlib.compress(json.dumps(data).encode("utf-8")),
+        lambda blob: json.loads(zlib.decompress(blob)),
+    ),
+    "msgpack": (
+        lambda data: msgpack.packb(data, use_bin_type=True),
+        lambda blob: msgpack.unpackb(blob, raw=False),
+    ),
+    "msgpack+zlib": (
+        lambda data: zlib.compress(msgpack.packb(data, use_bin_type=True)),
+        lambda blob: msgpack.unpackb(zlib.decompress(blob), raw=False),
+    ),
+}
+
+
+def _time(func: Callable[[Any], Any], items: list[Any], repeat_count: int) -> float:
+    """Returns the average time in milliseconds to apply ``func`` to all the items."""
+    start = perf_counter()
+    for _ in range(repeat_count):
+        for item in items:
+            func(item)
+    return (perf_counter() - start) * 1000.0 / repeat_count
+
+
+def main(repeat_count: int = 20) -> None:
+    dagbag = DagBag(include_examples=True, read_dags_from_db=False)
+    dag_data = [SerializedDAG.to_dict(dag) for dag in dagbag.dags.values()]
+    # What is read back from the database, all formats must decode to exactly this.
+    expected = [json.loads(json.dumps(data)) for data in dag_data]
+    print(f"Serialized {len(dag_data)} example DAGs, averaging over {repeat_count} runs\n")
+
+    print(f"{'format':<14}{'size (KiB)':>12}{'encode (ms)':>14}{'decode (ms)':>14}")
+    for name, (encode, decode) in FORMATS.items():
+        blobs = [encode(data) for data in dag_data]
+        assert [decode(blob) for blob in blobs] == expected
+        size = sum(len(blob) for blob in blobs) / 1024
+        encode_time = _time(encode, dag_data, repeat_count)
+        decode_time = _time(decode, blobs, repeat_count)
+        print(f"{name:<14}{size:>12.1f}{encode_time:>14.2f}{decode_time:>14.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,77 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Measures the CPU time spent by an event loop waiting on many temporal triggers.
+
+The triggers are due in a minute to an hour, so that all of them are in the last two hours before their
+moment, when they used to check the time every second. The CPU time the event loop spends over a few
+seconds is reported for ``DateTimeTrigger`` waiting on the timer wheel of the loop, and for triggers
+sleeping a second at a time as ``DateTimeTrigger`` used to.
+
+To Run:
+    $ python tests/test_utils/perf/temporal_triggers.py [triggers] [seconds]
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from datetime import timedelta
+
+from airflow.triggers.base import TriggerEvent
+from airflow.triggers.temporal import DateTimeTrigger
+from airflow.utils import timezone
+
+
+class SleepingDateTimeTrigger(DateTimeTrigger):
+    """The DateTimeTrigger of earlier versions, sleeping a second at a time until its moment."""
+
+    async def run(self):
+        while self.moment > timezone.utcnow():
+            await asyncio.sleep(1)
+        yield TriggerEvent(self.moment)
+
+
+async def measure(trigger_class: type[DateTimeTrigger], num_triggers: int, seconds: float) -> float:
+    now = timezone.utcnow()
+    tasks = [
+        asyncio.create_task(
+            trigger_class(now + timedelta(seconds=60 + index % 3540)).run().__anext__()  # type: ignore
+        )
+        for index in range(num_triggers)
+    ]
+    # Let all the triggers start waiting
+    await asyncio.sleep(1)
+    start = time.process_time()
+    await asyncio.sleep(seconds)
+    cpu_time = time.process_time() - start
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return cpu_time
+
+
+def main(num_triggers: int = 50_000, seconds: float = 10.0) -> None:
+    print(f"{'triggers':>10}  {'strategy':<12}{'CPU seconds':>12}")
+    for name, trigger_class in (("sleeping", SleepingDateTimeTrigger), ("timer wheel", DateTimeTrigger)):
+        cpu_time = asyncio.run(measure(trigger_class, num_triggers, seconds))
+        print(f"{num_triggers:>10}  {name:<12}{cpu_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]), *(float(arg) for arg in sys.argv[2:3]))
@@ -28,7 +28,7 @@ from airflow.models.baseoperator import BaseOperator
 from airflow.models.taskinstance import TaskInstance
 from airflow.operators.empty import EmptyOperator
 from airflow.ti_deps.dep_context import DepContext
-from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep
+from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, UpstreamStatesIndex
 from airflow.utils import timezone
 from airflow.utils.session import create_session
 from airflow.utils.state import State, TaskInstanceState
@@ -851,6 +851,66 @@ class TestTriggerRuleDep:
         dr.update_state()
         assert State.SUCCESS == dr.state
 
+    def test_upstream_states_index_counts(self, session, dag_maker):
+        with dag_maker(dag_id='test_upstream_states_index_counts', session=session) as dag:
+            op1 = EmptyOperator(task_id='A')
+            op2 = EmptyOperator(task_id='B')
+            op3 = EmptyOperator(task_id='C')
+            op4 = EmptyOperator(task_id='D')
+            op5 = EmptyOperator(task_id='E', trigger_rule=TriggerRule.ONE_FAILED)
+
+            op1 >> [op2, op3] >> op4
+            [op2, op3, op4] >> op5
+
+        dr = dag_maker.create_dagrun()
+        states = {'A': State.SUCCESS, 'B': State.FAILED, 'C': State.SKIPPED, 'D': State.UPSTREAM_FAILED}
+        for ti in dr.get_task_instances(session=session):
+            ti.state = states.get(ti.task_id)
+        session.flush()
+
+        finished_tis = dr.get_task_instances(state=State.finished, session=session)
+        index = UpstreamStatesIndex(dag, dr.run_id, finished_tis)
+        for task in dag.tasks:
+            assert index.get_counts(task.task_id) == TriggerRuleDep._get_states_count_upstream_ti(
+                task=task, finished_tis=finished_tis
+            )
+        assert index.get_counts('E') == (0, 1, 1, 1, 0, 3)
+
+    @pytest.mark.parametrize("use_upstream_states_index", [False, True])
+    def test_dep_statuses_with_upstream_states_index(self, session, dag_maker, use_upstream_states_index):
+        with dag_maker(dag_id='test_dep_statuses_with_upstream_states_index', session=session):
+            upstream = [EmptyOperator(task_id=f'upstream_{i}') for i in range(4)]
+            for trigger_rule in (
+                TriggerRule.ALL_SUCCESS,
+                TriggerRule.ALL_DONE,
+                TriggerRule.ONE_SUCCESS,
+                TriggerRule.ONE_FAILED,
+                TriggerRule.NONE_FAILED,
+            ):
+                upstream >> EmptyOperator(task_id=trigger_rule.value, trigger_rule=trigger_rule)
+
+        dr = dag_maker.create_dagrun()
+        states = {'upstream_0': State.SUCCESS, 'upstream_1': State.FAILED, 'upstream_2': State.SKIPPED}
+        tis = dr.get_task_instances(session=session)
+        for ti in tis:
+            ti.state = states.get(ti.task_id)
+        session.flush()
+
+        dep_context = DepContext(use_upstream_states_index=use_upstream_states_index)
+        results = {
+            ti.task_id: TriggerRuleDep().is_met(ti=ti, session=session, dep_context=dep_context)
+            for ti in tis
+            if not ti.task_id.startswith('upstream_')
+        }
+        assert results == {
+            TriggerRule.ALL_SUCCESS: False,
+            TriggerRule.ALL_DONE: False,
+            TriggerRule.ONE_SUCCESS: True,
+            TriggerRule.ONE_FAILED: True,
+            TriggerRule.NONE_FAILED: False,
+        }
+        assert (dep_context.upstream_states_index is not None) == use_upstream_states_index
+
     def test_mapped_task_upstream_removed_with_all_success_trigger_rules(
         self, session, get_mapped_task_dagrun
     ):
@@ -0,0 +1,69 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from airflow.triggers.base import TriggerEvent
+from airflow.triggers.file import FileTrigger
+
+
+def test_file_trigger_serialization():
+    """
+    Tests that the FileTrigger correctly serializes its arguments, along
+    with its backoff, and classpath.
+    """
+    trigger = FileTrigger(filepath="/files/*.csv", recursive=True, poke_interval=5, backoff_factor=2.0)
+    classpath, kwargs = trigger.serialize()
+    assert classpath == "airflow.triggers.file.FileTrigger"
+    assert kwargs == {
+        "filepath": "/files/*.csv",
+        "recursive": True,
+        "poke_interval": 5,
+        "backoff_factor": 2.0,
+        "max_poke_interval": None,
+    }
+
+
+def test_file_trigger_poke(tmp_path):
+    """
+    Tests that the FileTrigger finds files, and files within directories, matching its glob.
+    """
+    assert FileTrigger(filepath=str(tmp_path / "*.csv")).poke() is None
+    (tmp_path / "empty").mkdir()
+    assert FileTrigger(filepath=str(tmp_path / "empty")).poke() is None
+    (tmp_path / "data.csv").write_text("")
+    assert FileTrigger(filepath=str(tmp_path / "*.csv")).poke() == str(tmp_path / "data.csv")
+    (tmp_path / "empty" / "nested").mkdir()
+    (tmp_path / "empty" / "nested" / "file").write_text("")
+    assert FileTrigger(filepath=str(tmp_path / "empty")).poke() == str(tmp_path / "empty" / "nested" / "file")
+
+
+@pytest.mark.asyncio
+async def test_file_trigger_run(tmp_path):
+    """
+    Tests that the FileTrigger fires once the file lands.
+    """
+    trigger = FileTrigger(filepath=str(tmp_path / "data.csv"), poke_interval=0.05)
+    trigger_task = asyncio.create_task(trigger.run().__anext__())
+    await asyncio.sleep(0.2)
+    assert trigger_task.done() is False
+
+    (tmp_path / "data.csv").write_text("")
+    assert await asyncio.wait_for(trigger_task, timeout=5) == TriggerEvent(str(tmp_path / "data.csv"))
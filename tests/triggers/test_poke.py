@@ -0,0 +1,89 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from airflow.triggers.base import TriggerEvent
+from airflow.triggers.poke import PokeTrigger
+
+
+class CountingTrigger(PokeTrigger):
+    """A trigger firing on its given poke, which records the time of every poke."""
+
+    def __init__(self, fire_on_poke: int, **kwargs):
+        super().__init__(**kwargs)
+        self.fire_on_poke = fire_on_poke
+        self.poke_times: list[float] = []
+
+    def serialize(self):
+        return ("tests.triggers.test_poke.CountingTrigger", {"fire_on_poke": self.fire_on_poke})
+
+    def poke(self):
+        self.poke_times.append(time.monotonic())
+        if len(self.poke_times) == self.fire_on_poke:
+            return len(self.poke_times)
+        return None
+
+
+def test_input_validation():
+    """
+    Tests that the PokeTrigger validates its backoff arguments.
+    """
+    with pytest.raises(ValueError, match="The poke_interval must be a non-negative number"):
+        CountingTrigger(1, poke_interval=-1)
+    with pytest.raises(ValueError, match="The backoff_factor must be at least 1"):
+        CountingTrigger(1, backoff_factor=0.5)
+
+
+@pytest.mark.parametrize(
+    "backoff_factor, max_poke_interval, expected",
+    [
+        (1.0, None, [10, 10, 10, 10]),
+        (2.0, None, [10, 20, 40, 80]),
+        (2.0, 30, [10, 20, 30, 30]),
+    ],
+)
+def test_next_poke_interval(backoff_factor, max_poke_interval, expected):
+    """
+    Tests that the wait between pokes grows by the backoff factor up to the maximum.
+    """
+    trigger = CountingTrigger(
+        1, poke_interval=10, backoff_factor=backoff_factor, max_poke_interval=max_poke_interval
+    )
+    intervals = [trigger.poke_interval]
+    for _ in expected[1:]:
+        intervals.append(trigger.next_poke_interval(intervals[-1]))
+    assert intervals == expected
+
+
+@pytest.mark.asyncio
+async def test_poke_trigger_run():
+    """
+    Tests that the PokeTrigger pokes in the executor until the poke returns
+    a payload, and fires a single event with it.
+    """
+    trigger = CountingTrigger(3, poke_interval=0.05, backoff_factor=2.0)
+    events = [event async for event in trigger.run()]
+    assert events == [TriggerEvent(3)]
+    assert len(trigger.poke_times) == 3
+    # The second wait is twice as long as the first
+    first_wait, second_wait = (b - a for a, b in zip(trigger.poke_times, trigger.poke_times[1:]))
+    assert first_wait >= 0.05
+    assert second_wait >= 0.1
@@ -23,7 +23,7 @@ import pendulum
 import pytest
 
 from airflow.triggers.base import TriggerEvent
-from airflow.triggers.temporal import DateTimeTrigger, TimeDeltaTrigger
+from airflow.triggers.temporal import DateTimeTrigger, TimeDeltaTrigger, TimerWheel
 from airflow.utils import timezone
 
 
@@ -88,3 +88,78 @@ async def test_datetime_trigger_timing():
     result = trigger_task.result()
     assert isinstance(result, TriggerEvent)
     assert result.payload == past_moment
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_advance():
+    """
+    Tests that the TimerWheel fires its timers exactly when they are due,
+    across its levels and overflow list, and when the clock jumps.
+    """
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(slots=4, levels=2)
+    start = wheel._tick
+    futures = {}
+    for offset in (0.5, 1, 3.5, 4, 7, 15.5, 16, 40, 100.5, 400, 700):
+        futures[start + offset] = loop.create_future()
+        wheel._add((start + offset, futures[start + offset]))
+
+    def assert_fired(now):
+        for deadline, future in futures.items():
+            assert future.done() == (deadline <= now), f"timer for {deadline - start} at {now - start}"
+
+    for now in range(start + 1, start + 102):
+        wheel.advance(now)
+        assert_fired(now)
+    # The clock going backwards does not fire anything
+    wheel.advance(start + 50)
+    assert_fired(start + 101)
+    # Nor does jumping forward skip anything
+    wheel.advance(start + 500)
+    assert_fired(start + 500)
+    wheel.advance(start + 699.5)
+    assert_fired(start + 699.5)
+    wheel.advance(start + 700)
+    assert_fired(start + 700)
+
+
+@pytest.mark.asyncio
+async def test_timer_wheel_block_boundary():
+    """
+    Tests that timers cascaded on the first tick of their block land in the
+    slots fired during that block, rather than back in the emptied upper slot.
+    """
+    loop = asyncio.get_running_loop()
+    wheel = TimerWheel(slots=4, levels=2)
+    # The next tick to fire starts a block of the first level
+    wheel._tick = 3
+    futures = {deadline: loop.create_future() for deadline in (7, 8, 11, 12)}
+    for deadline, future in futures.items():
+        wheel._add((deadline, future))
+    for now in range(4, 13):
+        wheel.advance(now)
+        assert {deadline for deadline, future in futures.items() if future.done()} == {
+            deadline for deadline in futures if deadline <= now
+        }
+
+
+@pytest.mark.asyncio
+async def test_datetime_triggers_share_timer_wheel():
+    """
+    Tests that the DateTimeTriggers of an event loop all wait on its
+    TimerWheel, which stops once no timer is pending.
+    """
+    moment = timezone.utcnow() + datetime.timedelta(seconds=1)
+    tasks = [asyncio.create_task(DateTimeTrigger(moment).run().__anext__()) for _ in range(100)]
+    cancelled = asyncio.create_task(DateTimeTrigger(moment + datetime.timedelta(hours=1)).run().__anext__())
+    await asyncio.sleep(0.1)
+    wheel = TimerWheel.for_running_loop()
+    assert len(wheel) == 101
+    cancelled.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*tasks), timeout=5)
+    assert timezone.utcnow() >= moment
+    assert all(result.payload == moment for result in results)
+    await asyncio.sleep(1.1)
+    assert len(wheel) == 0
+    assert wheel._task is None
@@ -24,7 +24,13 @@ from unittest import mock
 
 import pytest
 
-from airflow.utils.file import correct_maybe_zipped, find_path_from_directory, open_maybe_zipped
+from airflow.utils.file import (
+    correct_maybe_zipped,
+    find_dag_file_paths,
+    find_path_from_directory,
+    is_dag_file_path,
+    open_maybe_zipped,
+)
 from tests.models import TEST_DAGS_FOLDER
 
 
@@ -146,6 +152,17 @@ class TestListPyFilesPath:
         assert os.path.join(test_dir, "symlink", "hello_world.py") in found
         assert os.path.join(test_dir, "folder", "hello_world.py") not in found
 
+    def test_is_dag_file_path_agrees_with_find_dag_file_paths(self):
+        found = set(find_dag_file_paths(TEST_DAGS_FOLDER, safe_mode=True))
+        assert found
+
+        for root, _, files in os.walk(TEST_DAGS_FOLDER):
+            for file in files:
+                file_path = os.path.join(root, file)
+                assert is_dag_file_path(TEST_DAGS_FOLDER, file_path, safe_mode=True) == (
+                    file_path in found
+                ), file_path
+
     def test_find_path_from_directory_fails_on_recursive_link(self, test_dir):
         # add a recursive link
         recursing_src = os.path.join(test_dir, "folder2", "recursor")